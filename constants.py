@@ -16,13 +16,105 @@ OPTIONS_FILE = os.path.join(DATA_DIR, 'options.json')
 SEARCHES_FILE = os.path.join(DATA_DIR, 'recent_searches.json')
 FAVORITES_FILE = os.path.join(DATA_DIR, 'wfs_favorites.json')
 
+# 캐시
+CACHE_DIR = os.path.join(DATA_DIR, 'cache')
+CACHE_DB_NAME = 'cache.db'
+CACHE_WRITE_BATCH_SIZE = 200
+CACHE_FLUSH_INTERVAL = 2.0  # seconds
+CACHE_MEMORY_MAX_ENTRIES = 5000
+CACHE_MEMORY_MAX_BYTES = 32 * 1024 * 1024
+CACHE_QUERY_CHUNK_SIZE = 500  # SQLite 바인딩 변수 한도 이하
+CACHE_SERIALIZER = 'json'  # json / msgpack
+CACHE_COMPRESSION = 'zlib'  # None / zlib / zstd
+CACHE_COMPRESS_MIN_SIZE = 1024  # bytes
+CACHE_REFRESH_WORKERS = 2
+# 키 분류별 stale-while-revalidate 허용 기간 (만료 후 초 단위)
+CACHE_MAX_STALE = {
+    'geocode': 30 * 24 * 3600,
+    'reverse_geocode': 7 * 24 * 3600,
+    'wfs_capabilities': 7 * 24 * 3600
+}
+REVERSE_GEOCODE_CACHE_TTL = 30 * 24 * 3600  # seconds
+WFS_CAPABILITIES_CACHE_KEY = 'wfs_capabilities|layers'
+WFS_CAPABILITIES_CACHE_TTL = 24 * 3600  # seconds
+GEOCODE_CACHE_DIR = os.path.join(CACHE_DIR, 'geocode')
+GEOCODE_CACHE_TTL = 90 * 24 * 3600  # seconds
+
+# WFS 로컬 저장 (GeoPackage)
+WFS_MIRROR_DIR = os.path.join(DATA_DIR, 'wfs_mirror')
+WFS_COVERAGE_DB_NAME = 'coverage.db'
+WFS_MIRROR_MAX_AGE = 30 * 24 * 3600  # seconds, 이보다 오래된 범위는 갱신 시 다시 받음
+WFS_MIRROR_FID_COLUMN = 'mirror_fid'  # GeoPackage 기본 키 (GML2 fid 속성과 겹치지 않도록)
+
 # API 관련
 API_BASE_URL = "api.vworld.kr"
 DEFAULT_PROTOCOL = "https://"
 DEFAULT_MAX_FEATURES = 1000
+WFS_CATALOG_BATCH_SIZE = 100
+WFS_SEARCH_DEBOUNCE_MS = 150
+WFS_PAGE_SIZE = DEFAULT_MAX_FEATURES  # GetFeature 한 번에 받는 최대 피처 수 (서버 상한)
+WFS_GML_OUTPUT = 'text/xml; subtype=gml/2.1.2'
+WFS_JSON_OUTPUT = 'application/json'
+WFS_DOWNLOAD_OUTPUT = WFS_JSON_OUTPUT  # 플러그인 자체 다운로드 형식 (미지원 시 GML로 자동 전환)
+WFS_JSON_CHUNK_SIZE = 64 * 1024  # bytes
+WFS_JSON_BATCH_SIZE = 200  # 디코딩 도중 레이어로 넘기는 피처 수
+WFS_TILE_GRID_SIZE = 4  # 요청 범위를 N x N 타일로 분할
+WFS_TILE_MAX_WORKERS = 4
+WFS_TILE_MAX_DEPTH = 4  # 서버 상한에 걸린 타일을 4분할하는 최대 단계 (이후는 페이지 단위로 받음)
+
+# 화면 범위 따라 불러오기
+WFS_VIEWPORT_DEBOUNCE_MS = 400
+WFS_VIEWPORT_BUFFER = 0.25  # 화면 바깥으로 미리 받는 비율
+WFS_VIEWPORT_MIN_SCALE = 25000  # 이보다 축소된 화면에서는 불러오지 않음 (1:N)
+WFS_VIEWPORT_MAX_FEATURES = 200000  # 넘으면 화면 밖 피처를 메모리에서 정리
+WFS_VIEWPORT_MERGE_RATIO = 1.3  # 두 범위를 합친 사각형이 면적 합의 이 배수 이하면 한 번에 요청
 DEFAULT_SEARCH_SIZE = 10
 API_TIMEOUT = 30  # seconds
 
+# HTTP 커넥션 풀
+HTTP_POOL_SIZE = 10
+HTTP_POOL_MAX_IDLE = 60  # seconds
+
+# API 호출 제한 (키를 사무실 전체가 공유하므로 프로세스 단위로 제한)
+API_RATE_LIMIT = 10.0  # requests per second
+API_RATE_BURST = 20
+API_MIN_CONCURRENCY = 1
+API_MAX_CONCURRENCY = 8
+API_LATENCY_TARGET = 3.0  # seconds
+API_OVERLOAD_STATUS_CODES = (429, 503)
+
+# 재시도 정책 (엔드포인트별, max_attempts는 최초 요청 포함)
+RETRY_POLICIES = {
+    'default': {'max_attempts': 3, 'backoff_base': 0.5, 'backoff_max': 10.0, 'jitter': 0.5,
+                'retry_status': (429, 500, 502, 503, 504)},
+    '/req/address': {'max_attempts': 5, 'backoff_base': 1.0, 'backoff_max': 30.0, 'jitter': 0.5,
+                     'retry_status': (429, 500, 502, 503, 504)},
+    '/req/search': {'max_attempts': 2, 'backoff_base': 0.3, 'backoff_max': 2.0, 'jitter': 0.5,
+                    'retry_status': (429, 502, 503, 504)},
+    '/req/wfs': {'max_attempts': 3, 'backoff_base': 1.0, 'backoff_max': 20.0, 'jitter': 0.5,
+                 'retry_status': (429, 500, 502, 503, 504)}
+}
+
+# 일괄 지오코딩
+GEOCODING_MAX_WORKERS = 8
+GEOCODING_CHUNK_SIZE = 500  # 결과를 레이어/파일로 넘기는 단위
+GEOCODING_REORDER_LIMIT = 1000  # 앞선 주소가 끝나지 않았을 때 먼저 처리해 둘 수 있는 최대 주소 수
+GEOCODING_SHUTDOWN_TIMEOUT = 5  # seconds, 취소 후 실행 중인 조회가 끝나기를 기다리는 최대 시간
+GEOCODE_RESULT_FIELDS = ['address', 'x', 'y', 'status']
+GEOCODE_JOURNAL_SUFFIX = '.geocode-journal.jsonl'  # 입력 파일 옆에 두는 체크포인트
+
+# 진행 상황 알림 (일괄 작업에서 시그널 전송 빈도 제한)
+PROGRESS_EMIT_INTERVAL = 0.1  # seconds
+PROGRESS_EMIT_STEP = 1  # percent
+
+# 백그라운드 작업 스케줄러
+TASK_SCHEDULER_MAX_THREADS = 6
+TASK_SCHEDULER_MAX_QUEUE = 64  # 대기 작업 수 상한
+TASK_SCHEDULER_SHUTDOWN_TIMEOUT = 3000  # ms
+TASK_PRIORITY_INTERACTIVE = 10  # 주소 검색 등 사용자가 결과를 기다리는 작업
+TASK_PRIORITY_NORMAL = 0
+TASK_PRIORITY_BACKGROUND = -10  # 일괄 지오코딩, 피처 다운로드 등 오래 걸리는 작업
+
 # 레이어 이름
 SEARCH_RESULT_LAYER = "브이월드[주소결과]"
 GEOCODER_LAYER = "Geocoder"
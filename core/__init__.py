@@ -1,11 +1,32 @@
 from .layer_manager import LayerManager
 from .cache_manager import CacheManager
-from .thread_workers import GenericWorker, GeocodingWorker, SearchWorker
+from .cache_serializer import JsonSerializer, MsgpackSerializer
+from .geocode_cache import GeocodeCache
+from .geocode_journal import GeocodeJournal
+from .wfs_catalog import WfsCatalog
+from .wfs_downloader import WfsDownloader
+from .wfs_mirror import WfsMirror
+from .viewport_loader import ViewportLoader
+from .task_scheduler import TaskScheduler, ScheduledWorker
+from .thread_workers import GenericWorker, GeocodingWorker, SearchWorker, WfsCatalogWorker, WfsDownloadWorker, WfsMirrorWorker
 
 __all__ = [
     'LayerManager',
     'CacheManager',
+    'JsonSerializer',
+    'MsgpackSerializer',
+    'GeocodeCache',
+    'GeocodeJournal',
+    'WfsCatalog',
+    'WfsDownloader',
+    'WfsMirror',
+    'ViewportLoader',
+    'TaskScheduler',
+    'ScheduledWorker',
     'GenericWorker',
     'GeocodingWorker',
-    'SearchWorker'
+    'SearchWorker',
+    'WfsCatalogWorker',
+    'WfsDownloadWorker',
+    'WfsMirrorWorker'
 ]
\ No newline at end of file
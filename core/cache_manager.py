@@ -1,118 +1,666 @@
-from typing import Dict, Any, Optional
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, Tuple, List, Iterable, Union, Callable
+import copy
 import time
-import pickle
 import os
 import hashlib
+import sqlite3
+import threading
 import logging
 
-from ..constants import DATA_DIR
+from ..constants import (
+    CACHE_DIR, CACHE_DB_NAME, CACHE_WRITE_BATCH_SIZE, CACHE_FLUSH_INTERVAL,
+    CACHE_MEMORY_MAX_ENTRIES, CACHE_MEMORY_MAX_BYTES, CACHE_QUERY_CHUNK_SIZE,
+    CACHE_MAX_STALE, CACHE_REFRESH_WORKERS
+)
+from ..exceptions import ConfigurationError
+from .cache_serializer import CacheSerializer, create_serializer, load_legacy_pickle
 
 logger = logging.getLogger(__name__)
 
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    expires_at REAL NOT NULL,
+    size INTEGER NOT NULL,
+    stale_until REAL NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_cache_expires_at ON cache (expires_at);
+
+CREATE TABLE IF NOT EXISTS cache_stats (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    entry_count INTEGER NOT NULL,
+    total_size INTEGER NOT NULL
+);
+
+INSERT OR IGNORE INTO cache_stats (id, entry_count, total_size) VALUES (0, 0, 0);
+
+CREATE TRIGGER IF NOT EXISTS cache_after_insert AFTER INSERT ON cache BEGIN
+    UPDATE cache_stats SET entry_count = entry_count + 1, total_size = total_size + NEW.size WHERE id = 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS cache_after_delete AFTER DELETE ON cache BEGIN
+    UPDATE cache_stats SET entry_count = entry_count - 1, total_size = total_size - OLD.size WHERE id = 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS cache_after_update AFTER UPDATE OF size ON cache BEGIN
+    UPDATE cache_stats SET total_size = total_size - OLD.size + NEW.size WHERE id = 0;
+END;
+"""
+
+# 1: pickle 값, 2: 헤더 포함 JSON/msgpack 값, 3: stale_until 컬럼 추가
+_SCHEMA_VERSION = 3
+
+_UPSERT = """
+INSERT INTO cache (key, value, expires_at, stale_until, size) VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (key) DO UPDATE SET
+    value = excluded.value, expires_at = excluded.expires_at,
+    stale_until = excluded.stale_until, size = excluded.size
+"""
+
+# 조회 결과 상태
+CACHE_HIT = 'hit'
+CACHE_STALE = 'stale'
+CACHE_MISS = 'miss'
+
+# 백그라운드 갱신 스레드 (모든 CacheManager 공유)
+_refresh_executor: Optional[ThreadPoolExecutor] = None
+_refresh_executor_lock = threading.Lock()
+
+
+def _get_refresh_executor() -> ThreadPoolExecutor:
+    global _refresh_executor
+
+    with _refresh_executor_lock:
+        if _refresh_executor is None:
+            _refresh_executor = ThreadPoolExecutor(max_workers=CACHE_REFRESH_WORKERS)
+        return _refresh_executor
+
+
+class MemoryCache:
+    """
+        항목 수 / 바이트 크기 제한 LRU 메모리 캐시
+            (스레드 안전성은 CacheManager 잠금으로 보장)
+    """
+
+    def __init__(self, max_entries: int = CACHE_MEMORY_MAX_ENTRIES, max_bytes: int = CACHE_MEMORY_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._entries: 'OrderedDict[str, Tuple[Any, float, float, int]]' = OrderedDict()
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get(self, key: str, now: float) -> Optional[Tuple[Any, float]]:
+        """
+            (값 사본, 만료 시각) 반환, 허용 기간까지 지난 항목은 제거 후 None
+                (호출자가 값을 수정해도 캐시된 값은 바뀌지 않도록 사본 반환)
+        """
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        value, expires_at, stale_until, size = entry
+        if now > max(expires_at, stale_until):
+            self.pop(key)
+            self.misses += 1
+            return None
+
+        # 최근 사용으로 이동
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return copy.deepcopy(value), expires_at
+
+    def put(self, key: str, value: Any, expires_at: float, stale_until: float, size: int):
+        """
+            값 저장 후 한도를 넘으면 오래 사용하지 않은 항목부터 제거
+        """
+        self.pop(key)
+
+        # 한도보다 큰 값은 메모리에 두지 않음
+        if size > self.max_bytes:
+            return
+
+        self._entries[key] = (value, expires_at, stale_until, size)
+        self.total_bytes += size
+
+        while len(self._entries) > self.max_entries or self.total_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.total_bytes -= evicted[3]
+            self.evictions += 1
+
+    def pop(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry[3]
+
+    def clear(self):
+        self._entries.clear()
+        self.total_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'memory_cache_count': len(self._entries),
+            'memory_cache_bytes': self.total_bytes,
+            'memory_hits': self.hits,
+            'memory_misses': self.misses,
+            'memory_evictions': self.evictions
+        }
+
 
 class CacheManager:
 
-    def __init__(self, cache_dir: Optional[str] = None, ttl: int = 3600):
+    _shared: Dict[str, 'CacheManager'] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(
+            self,
+            cache_dir: Optional[str] = None,
+            ttl: int = 3600,
+            memory_max_entries: int = CACHE_MEMORY_MAX_ENTRIES,
+            memory_max_bytes: int = CACHE_MEMORY_MAX_BYTES,
+            serializer: Optional[CacheSerializer] = None
+    ):
         """
             cache_dir: 캐시 디렉토리 경로
             ttl: Time To Live (초 단위)
+            memory_max_entries / memory_max_bytes: 메모리 캐시 한도
+            serializer: 값 직렬화 방식 (기본: 설정된 JSON/msgpack + 압축)
         """
-        self.cache_dir = cache_dir or os.path.join(DATA_DIR, 'cache')
+        self.cache_dir = cache_dir or CACHE_DIR
         self.ttl = ttl
-        self._memory_cache: Dict[str, Dict[str, Any]] = {}
+        self.serializer = serializer or create_serializer()
+        self._memory_cache = MemoryCache(memory_max_entries, memory_max_bytes)
+
+        # 전체 조회 통계 (메모리 + DB), 키 분류별 hit/stale/miss 통계
+        self.hits = 0
+        self.misses = 0
+        self._class_stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {CACHE_HIT: 0, CACHE_STALE: 0, CACHE_MISS: 0, 'refreshed': 0, 'refresh_failed': 0}
+        )
+
+        # 백그라운드 갱신 중인 키
+        self._refreshing = set()
+
+        # 아직 DB에 쓰지 않은 항목 (일정 개수/시간마다 한 트랜잭션으로 기록)
+        self._pending: Dict[str, Tuple[bytes, float, float, int]] = {}
+        self._last_flush = time.monotonic()
+        self._lock = threading.RLock()
+        self._closed = False
 
         # 캐시 디렉토리 생성
         os.makedirs(self.cache_dir, exist_ok=True)
 
+        self.db_path = os.path.join(self.cache_dir, CACHE_DB_NAME)
+        self._conn = self._connect()
+
+        # 기존 파일 캐시(.cache) 이전
+        self._migrate_legacy_files()
+
         # 시작 시 오래된 캐시 정리
         self._cleanup_old_cache()
 
+    @classmethod
+    def shared(cls, cache_dir: Optional[str] = None, ttl: int = 3600) -> 'CacheManager':
+        """
+            디렉토리별 공유 인스턴스 반환 (같은 DB에 연결을 하나만 유지)
+                이미 다른 TTL로 열린 디렉토리면 ConfigurationError
+        """
+        path = os.path.abspath(cache_dir or CACHE_DIR)
+
+        with cls._shared_lock:
+            cache = cls._shared.get(path)
+            if cache is None:
+                cache = cls._shared[path] = cls(path, ttl)
+            elif cache.ttl != ttl:
+                raise ConfigurationError(f"캐시 TTL 불일치: {path} (사용 중 {cache.ttl}초, 요청 {ttl}초)")
+            return cache
+
+    @classmethod
+    def close_shared(cls):
+        """
+            모든 공유 인스턴스 종료 (플러그인 언로드 시)
+                진행 중인 백그라운드 갱신은 기다리지 않음 (재시도가 길어질 수 있으므로),
+                종료 후 끝난 갱신은 저장하지 않음
+        """
+        global _refresh_executor
+
+        with _refresh_executor_lock:
+            executor, _refresh_executor = _refresh_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+        with cls._shared_lock:
+            for cache in cls._shared.values():
+                try:
+                    cache.close()
+                except Exception as e:
+                    logger.error(f"캐시 종료 오류: {e}")
+            cls._shared.clear()
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+            SQLite 연결 (WAL 모드)
+        """
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        self._upgrade_schema(conn)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_stale_until ON cache (stale_until)")
+        return conn
+
+    def _upgrade_schema(self, conn: sqlite3.Connection):
+        """
+            이전 버전 DB를 현재 형식으로 변환
+        """
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= _SCHEMA_VERSION:
+            return
+
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(cache)")}
+        converted = []
+        dropped = []
+
+        # pickle 값 행 변환
+        if version < 2:
+            for key, blob in conn.execute("SELECT key, value FROM cache"):
+                try:
+                    value = self.serializer.dumps(load_legacy_pickle(blob))
+                    converted.append((value, len(value), key))
+                except Exception:
+                    dropped.append((key,))
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany("UPDATE cache SET value = ?, size = ? WHERE key = ?", converted)
+            conn.executemany("DELETE FROM cache WHERE key = ?", dropped)
+
+            if 'stale_until' not in columns:
+                conn.execute("ALTER TABLE cache ADD COLUMN stale_until REAL NOT NULL DEFAULT 0")
+                conn.execute("UPDATE cache SET stale_until = expires_at")
+
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+        if converted or dropped:
+            logger.info(f"캐시 형식 변환: {len(converted)}개 변환, {len(dropped)}개 삭제")
+
     def _get_cache_key(self, key: str) -> str:
         """
             캐시 키 생성 (해시 사용)
         """
         return hashlib.md5(key.encode()).hexdigest()
 
-    def _get_cache_filepath(self, key: str) -> str:
+    @staticmethod
+    def get_key_class(key: str) -> str:
         """
-            캐시 파일 경로 생성
+            키 분류 반환 ('geocode|road|...' -> 'geocode')
         """
-        cache_key = self._get_cache_key(key)
-        return os.path.join(self.cache_dir, f"{cache_key}.cache")
+        return key.split('|', 1)[0] if '|' in key else 'default'
 
-    def get(self, key: str) -> Optional[Any]:
+    def _get_max_stale(self, key: str, max_stale: Optional[int]) -> int:
+        if max_stale is not None:
+            return max_stale
+        return CACHE_MAX_STALE.get(self.get_key_class(key), 0)
+
+    def _encode(self, value: Any) -> bytes:
+        return self.serializer.dumps(value)
+
+    def _decode(self, blob: bytes) -> Any:
+        return self.serializer.loads(blob)
+
+    def _lookup(self, key: str, now: float) -> Optional[Tuple[Any, float]]:
         """
-            캐시에서 값 가져오기
+            (값, 만료 시각) 조회, 허용 기간 내의 만료 항목도 반환 (잠금 상태에서 호출)
         """
         # 메모리 캐시 확인
-        if key in self._memory_cache:
-            data = self._memory_cache[key]
-            if time.time() - data['timestamp'] <= self.ttl:
-                logger.debug(f"메모리 캐시 히트: {key}")
-                return data['value']
-            else:
-                del self._memory_cache[key]
-
-        # 파일 캐시 확인
-        filepath = self._get_cache_filepath(key)
+        entry = self._memory_cache.get(key, now)
+        if entry is not None:
+            logger.debug(f"메모리 캐시 히트: {key}")
+            return entry
 
-        if not os.path.exists(filepath):
-            return None
+        cache_key = self._get_cache_key(key)
 
         try:
-            with open(filepath, 'rb') as f:
-                data = pickle.load(f)
-
-            # TTL 확인
-            if time.time() - data['timestamp'] > self.ttl:
-                os.remove(filepath)
+            pending = self._pending.get(cache_key)
+            if pending is not None:
+                blob, expires_at, stale_until = pending[0], pending[1], pending[2]
+            else:
+                row = self._conn.execute(
+                    "SELECT value, expires_at, stale_until FROM cache WHERE key = ?", (cache_key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                blob, expires_at, stale_until = row
+
+            # 허용 기간까지 지난 행은 정리 시 범위 삭제
+            if now > max(expires_at, stale_until):
                 logger.debug(f"캐시 만료: {key}")
                 return None
 
-            # 메모리 캐시에 로드
-            self._memory_cache[key] = data
-            logger.debug(f"파일 캐시 히트: {key}")
-            return data['value']
+            value = self._decode(blob)
+
+            # 메모리 캐시에 로드 (반환한 값과 같은 객체를 보관하지 않도록 사본 저장)
+            self._memory_cache.put(key, copy.deepcopy(value), expires_at, stale_until, len(blob))
+            logger.debug(f"DB 캐시 히트: {key}")
+            return value, expires_at
 
         except Exception as e:
             logger.error(f"캐시 읽기 오류: {e}")
             return None
 
-    def set(self, key: str, value: Any):
+    def get(self, key: str) -> Optional[Any]:
         """
-            캐시에 값 저장
+            캐시에서 값 가져오기 (만료 전 항목만)
         """
-        data = {
-            'value': value,
-            'timestamp': time.time()
-        }
+        now = time.time()
 
-        # 메모리 캐시에 저장
-        self._memory_cache[key] = data
+        with self._lock:
+            entry = self._lookup(key, now)
 
-        # 파일 캐시에 저장
-        filepath = self._get_cache_filepath(key)
+            if entry is not None and now <= entry[1]:
+                self.hits += 1
+                return entry[0]
+
+            self.misses += 1
+            return None
+
+    def get_with_status(self, key: str) -> Tuple[Optional[Any], str]:
+        """
+            (값, 상태) 반환
+                상태: hit(유효) / stale(만료됐지만 허용 기간 내) / miss
+        """
+        now = time.time()
+
+        with self._lock:
+            entry = self._lookup(key, now)
+
+            if entry is None:
+                status, value = CACHE_MISS, None
+                self.misses += 1
+            elif now <= entry[1]:
+                status, value = CACHE_HIT, entry[0]
+                self.hits += 1
+            else:
+                status, value = CACHE_STALE, entry[0]
+
+            self._class_stats[self.get_key_class(key)][status] += 1
+            return value, status
+
+    def get_or_fetch(
+            self,
+            key: str,
+            fetch_func: Callable[[], Any],
+            ttl: Optional[int] = None,
+            max_stale: Optional[int] = None,
+            cacheable: Optional[Callable[[Any], bool]] = None
+    ) -> Tuple[Any, str]:
+        """
+            stale-while-revalidate 조회
+                - hit: 캐시 값 반환
+                - stale: 만료된 값을 즉시 반환하고 백그라운드에서 갱신
+                - miss: fetch_func 호출 후 저장
+            cacheable: 저장 여부 판단 함수 (없으면 항상 저장)
+        """
+        value, status = self.get_with_status(key)
+
+        if status == CACHE_HIT:
+            return value, status
+
+        if status == CACHE_STALE:
+            self.refresh_in_background(key, fetch_func, ttl, max_stale, cacheable)
+            return value, status
+
+        value = fetch_func()
+        if cacheable is None or cacheable(value):
+            self.set(key, value, ttl, max_stale)
+        return value, status
+
+    def refresh_in_background(
+            self,
+            key: str,
+            fetch_func: Callable[[], Any],
+            ttl: Optional[int] = None,
+            max_stale: Optional[int] = None,
+            cacheable: Optional[Callable[[Any], bool]] = None
+    ):
+        """
+            백그라운드 갱신 예약 (키당 동시에 하나만)
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        _get_refresh_executor().submit(self._refresh, key, fetch_func, ttl, max_stale, cacheable)
+
+    def _refresh(
+            self,
+            key: str,
+            fetch_func: Callable[[], Any],
+            ttl: Optional[int],
+            max_stale: Optional[int],
+            cacheable: Optional[Callable[[Any], bool]]
+    ):
+        key_class = self.get_key_class(key)
 
         try:
-            with open(filepath, 'wb') as f:
-                pickle.dump(data, f)
-            logger.debug(f"캐시 설정: {key}")
+            # 종료 전에 시작하지 못한 갱신은 건너뜀
+            if self._closed:
+                return
+
+            value = fetch_func()
+            if cacheable is None or cacheable(value):
+                self.set(key, value, ttl, max_stale)
+
+            with self._lock:
+                self._class_stats[key_class]['refreshed'] += 1
+            logger.debug(f"캐시 백그라운드 갱신: {key}")
+
+        except Exception as e:
+            with self._lock:
+                self._class_stats[key_class]['refresh_failed'] += 1
+            logger.warning(f"캐시 백그라운드 갱신 실패 {key}: {e}")
+
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None, max_stale: Optional[int] = None):
+        """
+            캐시에 값 저장
+                ttl: 항목별 TTL (없으면 기본값)
+                max_stale: 만료 후 stale 값으로 제공할 수 있는 기간 (없으면 키 분류별 설정)
+        """
+        expires_at = time.time() + (self.ttl if ttl is None else ttl)
+        stale_until = expires_at + self._get_max_stale(key, max_stale)
+
+        try:
+            blob = self._encode(value)
+            # 메모리 캐시도 DB에서 읽은 것과 같은 값을 반환하도록 직렬화를 거친 값 저장
+            stored = self._decode(blob)
         except Exception as e:
             logger.error(f"캐시 쓰기 오류: {e}")
+            return
+
+        with self._lock:
+            # 종료 후 끝난 백그라운드 갱신 결과는 버림
+            if self._closed:
+                return
+
+            # 메모리 캐시에 저장
+            self._memory_cache.put(key, stored, expires_at, stale_until, len(blob))
+
+            # 쓰기 대기열에 추가
+            self._pending[self._get_cache_key(key)] = (blob, expires_at, stale_until, len(blob))
+            logger.debug(f"캐시 설정: {key}")
+
+            if (len(self._pending) >= CACHE_WRITE_BATCH_SIZE or
+                    time.monotonic() - self._last_flush >= CACHE_FLUSH_INTERVAL):
+                self.flush()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+            여러 키를 한 번에 조회, 유효한 항목만 {키: 값}으로 반환
+                (대량 조회 결과는 메모리 캐시를 밀어내지 않도록 적재하지 않음)
+        """
+        now = time.time()
+        found: Dict[str, Any] = {}
+
+        with self._lock:
+            # 메모리 / 쓰기 대기열에서 먼저 찾고 나머지만 DB 조회
+            remaining: Dict[str, str] = {}
+            seen = set()
+
+            for key in keys:
+                if key in seen:
+                    continue
+                seen.add(key)
+
+                entry = self._memory_cache.get(key, now)
+                if entry is not None and now <= entry[1]:
+                    found[key] = entry[0]
+                    continue
+
+                cache_key = self._get_cache_key(key)
+                pending = self._pending.get(cache_key)
+                if pending is not None and now <= pending[1]:
+                    found[key] = self._decode(pending[0])
+                    continue
+
+                remaining[cache_key] = key
+
+            hashes = list(remaining)
+            db_hits = 0
+
+            try:
+                for start in range(0, len(hashes), CACHE_QUERY_CHUNK_SIZE):
+                    chunk = hashes[start:start + CACHE_QUERY_CHUNK_SIZE]
+                    placeholders = ','.join('?' * len(chunk))
+                    rows = self._conn.execute(
+                        f"SELECT key, value FROM cache WHERE key IN ({placeholders}) AND expires_at >= ?",
+                        (*chunk, now)
+                    )
+
+                    for cache_key, blob in rows:
+                        found[remaining[cache_key]] = self._decode(blob)
+                        db_hits += 1
+
+            except Exception as e:
+                logger.error(f"캐시 일괄 읽기 오류: {e}")
+
+            self.hits += len(found)
+            self.misses += len(remaining) - db_hits
+
+        return found
+
+    def partition(self, keys: Iterable[str]) -> Tuple[Dict[str, Any], List[str]]:
+        """
+            키 목록을 (캐시된 항목, 캐시되지 않은 키 목록)으로 분리
+        """
+        keys = list(keys)
+        cached = self.get_many(keys)
+        return cached, [key for key in keys if key not in cached]
+
+    def set_many(
+            self,
+            items: Union[Dict[str, Any], Iterable[Tuple[str, Any]]],
+            ttl: Optional[int] = None,
+            max_stale: Optional[int] = None
+    ):
+        """
+            여러 항목을 한 트랜잭션으로 저장
+        """
+        if isinstance(items, dict):
+            items = items.items()
+
+        expires_at = time.time() + (self.ttl if ttl is None else ttl)
+        rows = []
+        keys = []
+
+        for key, value in items:
+            try:
+                blob = self._encode(value)
+            except Exception as e:
+                logger.error(f"캐시 쓰기 오류 {key}: {e}")
+                continue
+
+            stale_until = expires_at + self._get_max_stale(key, max_stale)
+            keys.append(key)
+            rows.append((self._get_cache_key(key), blob, expires_at, stale_until, len(blob)))
+
+        with self._lock:
+            if self._closed:
+                return
+
+            # 이전 값이 메모리 캐시에 남아 있지 않도록 제거
+            for key in keys:
+                self._memory_cache.pop(key)
+
+            # 대기 중인 단건 쓰기도 같은 트랜잭션으로 기록
+            try:
+                with self._transaction():
+                    self._conn.executemany(_UPSERT, self._pending_rows() + rows)
+                self._pending.clear()
+                self._last_flush = time.monotonic()
+            except Exception as e:
+                logger.error(f"캐시 일괄 쓰기 오류: {e}")
+
+    def _pending_rows(self) -> List[Tuple[str, bytes, float, float, int]]:
+        return [
+            (cache_key, blob, expires_at, stale_until, size)
+            for cache_key, (blob, expires_at, stale_until, size) in self._pending.items()
+        ]
+
+    def flush(self):
+        """
+            쓰기 대기열을 한 트랜잭션으로 기록
+        """
+        with self._lock:
+            self._last_flush = time.monotonic()
+
+            if self._closed or not self._pending:
+                return
+
+            try:
+                with self._transaction():
+                    self._conn.executemany(_UPSERT, self._pending_rows())
+                self._pending.clear()
+            except Exception as e:
+                logger.error(f"캐시 쓰기 오류: {e}")
 
     def delete(self, key: str):
         """
             캐시에서 값 삭제
         """
-        # 메모리 캐시에서 삭제
-        if key in self._memory_cache:
-            del self._memory_cache[key]
+        with self._lock:
+            # 메모리 캐시에서 삭제
+            self._memory_cache.pop(key)
+
+            cache_key = self._get_cache_key(key)
+            self._pending.pop(cache_key, None)
 
-        # 파일 캐시에서 삭제
-        filepath = self._get_cache_filepath(key)
-        if os.path.exists(filepath):
             try:
-                os.remove(filepath)
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (cache_key,))
                 logger.debug(f"캐시 삭제: {key}")
             except Exception as e:
                 logger.error(f"캐시 삭제 오류: {e}")
@@ -121,61 +669,115 @@ class CacheManager:
         """
             모든 캐시 초기화
         """
-        # 메모리 캐시 초기화
-        self._memory_cache.clear()
+        with self._lock:
+            # 메모리 캐시 초기화
+            self._memory_cache.clear()
+            self._pending.clear()
 
-        # 파일 캐시 초기화
-        for filename in os.listdir(self.cache_dir):
-            if filename.endswith('.cache'):
-                filepath = os.path.join(self.cache_dir, filename)
-                try:
-                    os.remove(filepath)
-                except Exception as e:
-                    logger.error(f"캐시 파일 삭제 실패 {filepath}: {e}")
+            try:
+                self._conn.execute("DELETE FROM cache")
+            except Exception as e:
+                logger.error(f"캐시 초기화 실패: {e}")
 
         logger.info("캐시 초기화 완료")
 
+    def close(self):
+        """
+            대기 중인 쓰기 기록 후 연결 종료 (이후 쓰기는 무시)
+        """
+        with self._lock:
+            if self._closed:
+                return
+
+            self.flush()
+            self._closed = True
+            self._conn.close()
+
+    @contextmanager
+    def _transaction(self):
+        """
+            명시적 트랜잭션 (autocommit 연결에서 사용)
+        """
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        else:
+            self._conn.execute("COMMIT")
+
     def _cleanup_old_cache(self):
         """
-            오래된 캐시 파일 정리
+            허용 기간까지 지난 캐시 정리 (stale_until 인덱스 범위 삭제)
         """
-        current_time = time.time()
-        cleaned_count = 0
+        with self._lock:
+            try:
+                cursor = self._conn.execute("DELETE FROM cache WHERE stale_until < ?", (time.time(),))
+                if cursor.rowcount > 0:
+                    logger.info(f"만료된 캐시 {cursor.rowcount}개 정리 완료")
+            except Exception as e:
+                logger.error(f"캐시 정리 실패: {e}")
 
-        for filename in os.listdir(self.cache_dir):
-            if not filename.endswith('.cache'):
-                continue
+    def _migrate_legacy_files(self):
+        """
+            키별 pickle 파일(.cache)을 DB로 이전 후 삭제 (기본 자료형만 허용)
+        """
+        filenames = [name for name in os.listdir(self.cache_dir) if name.endswith('.cache')]
+        if not filenames:
+            return
 
+        now = time.time()
+        rows = []
+
+        for filename in filenames:
             filepath = os.path.join(self.cache_dir, filename)
 
             try:
-                # 파일 수정 시간 확인
-                file_time = os.path.getmtime(filepath)
-                if current_time - file_time > self.ttl:
-                    os.remove(filepath)
-                    cleaned_count += 1
+                with open(filepath, 'rb') as f:
+                    data = load_legacy_pickle(f.read())
+
+                expires_at = data['timestamp'] + self.ttl
+                if expires_at > now:
+                    blob = self._encode(data['value'])
+                    rows.append((filename[:-len('.cache')], blob, expires_at, expires_at, len(blob)))
             except Exception as e:
-                logger.error(f"캐시 파일 정리 실패 {filepath}: {e}")
+                logger.error(f"캐시 파일 이전 실패 {filepath}: {e}")
 
-        if cleaned_count > 0:
-            logger.info(f"만료된 캐시 파일 {cleaned_count}개 정리 완료")
+        with self._lock:
+            try:
+                with self._transaction():
+                    self._conn.executemany(_UPSERT, rows)
+            except Exception as e:
+                logger.error(f"캐시 파일 이전 실패: {e}")
+                return
+
+        for filename in filenames:
+            try:
+                os.remove(os.path.join(self.cache_dir, filename))
+            except Exception as e:
+                logger.error(f"캐시 파일 삭제 실패 {filename}: {e}")
+
+        logger.info(f"캐시 파일 {len(rows)}개를 DB로 이전 완료")
 
     def get_cache_size(self) -> Dict[str, Any]:
         """
-            캐시 크기 정보 반환
+            캐시 크기 정보 반환 (트리거로 유지되는 통계 행 조회)
         """
-        total_size = 0
-        file_count = 0
-
-        for filename in os.listdir(self.cache_dir):
-            if filename.endswith('.cache'):
-                filepath = os.path.join(self.cache_dir, filename)
-                total_size += os.path.getsize(filepath)
-                file_count += 1
-
-        return {
-            'total_size_bytes': total_size,
-            'total_size_mb': total_size / (1024 * 1024),
-            'file_count': file_count,
-            'memory_cache_count': len(self._memory_cache)
-        }
\ No newline at end of file
+        with self._lock:
+            self.flush()
+            entry_count, total_size = self._conn.execute(
+                "SELECT entry_count, total_size FROM cache_stats WHERE id = 0"
+            ).fetchone()
+
+            stats = {
+                'total_size_bytes': total_size,
+                'total_size_mb': total_size / (1024 * 1024),
+                'entry_count': entry_count,
+                'file_count': entry_count,
+                'hits': self.hits,
+                'misses': self.misses,
+                'key_classes': {name: dict(counts) for name, counts in self._class_stats.items()}
+            }
+            stats.update(self._memory_cache.get_stats())
+            return stats
@@ -0,0 +1,146 @@
+from typing import Any, Optional
+import io
+import json
+import pickle
+import zlib
+import logging
+
+from ..constants import CACHE_SERIALIZER, CACHE_COMPRESSION, CACHE_COMPRESS_MIN_SIZE
+
+logger = logging.getLogger(__name__)
+
+# 선택 의존성
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# 저장 형식: [코덱 1바이트][압축 1바이트][본문]
+CODEC_JSON = b'J'
+CODEC_MSGPACK = b'M'
+COMPRESSION_NONE = b'-'
+COMPRESSION_ZLIB = b'z'
+COMPRESSION_ZSTD = b's'
+
+
+class CacheSerializer:
+    """
+        캐시 값 직렬화 기본 클래스 (JSON 호환 값 전용)
+    """
+
+    codec = b''
+
+    def __init__(
+            self,
+            compression: Optional[str] = CACHE_COMPRESSION,
+            compress_min_size: int = CACHE_COMPRESS_MIN_SIZE,
+            level: int = 6
+    ):
+        """
+            compression: None / 'zlib' / 'zstd'
+            compress_min_size: 이 크기(바이트) 이상일 때만 압축
+        """
+        if compression == 'zstd' and zstandard is None:
+            logger.warning("zstandard 모듈이 없어 zlib 압축을 사용합니다.")
+            compression = 'zlib'
+
+        self.compression = compression
+        self.compress_min_size = compress_min_size
+        self.level = level
+
+    def _dump(self, value: Any) -> bytes:
+        raise NotImplementedError
+
+    def dumps(self, value: Any) -> bytes:
+        payload = self._dump(value)
+        flag = COMPRESSION_NONE
+
+        if self.compression and len(payload) >= self.compress_min_size:
+            if self.compression == 'zstd':
+                payload = zstandard.ZstdCompressor(level=self.level).compress(payload)
+                flag = COMPRESSION_ZSTD
+            else:
+                payload = zlib.compress(payload, self.level)
+                flag = COMPRESSION_ZLIB
+
+        return self.codec + flag + payload
+
+    @staticmethod
+    def loads(blob: bytes) -> Any:
+        """
+            헤더를 보고 복원 (설정된 직렬화 방식과 무관하게 읽을 수 있음)
+        """
+        codec, flag, payload = blob[:1], blob[1:2], blob[2:]
+
+        if flag == COMPRESSION_ZLIB:
+            payload = zlib.decompress(payload)
+        elif flag == COMPRESSION_ZSTD:
+            if zstandard is None:
+                raise ValueError("zstandard 모듈이 없어 캐시를 읽을 수 없습니다.")
+            payload = zstandard.ZstdDecompressor().decompress(payload)
+        elif flag != COMPRESSION_NONE:
+            raise ValueError(f"알 수 없는 캐시 압축 형식: {flag!r}")
+
+        if codec == CODEC_JSON:
+            return json.loads(payload.decode('utf-8'))
+        if codec == CODEC_MSGPACK:
+            if msgpack is None:
+                raise ValueError("msgpack 모듈이 없어 캐시를 읽을 수 없습니다.")
+            return msgpack.unpackb(payload, raw=False)
+
+        raise ValueError(f"알 수 없는 캐시 형식: {codec!r}")
+
+
+class JsonSerializer(CacheSerializer):
+    """
+        압축 JSON 직렬화
+    """
+
+    codec = CODEC_JSON
+
+    def _dump(self, value: Any) -> bytes:
+        return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+class MsgpackSerializer(CacheSerializer):
+    """
+        msgpack 직렬화 (msgpack 모듈 필요)
+    """
+
+    codec = CODEC_MSGPACK
+
+    def _dump(self, value: Any) -> bytes:
+        return msgpack.packb(value, use_bin_type=True)
+
+
+def create_serializer(name: str = CACHE_SERIALIZER, compression: Optional[str] = CACHE_COMPRESSION) -> CacheSerializer:
+    """
+        설정 이름으로 직렬화 객체 생성
+    """
+    if name == 'msgpack':
+        if msgpack is not None:
+            return MsgpackSerializer(compression)
+        logger.warning("msgpack 모듈이 없어 JSON 직렬화를 사용합니다.")
+
+    return JsonSerializer(compression)
+
+
+class _SafeUnpickler(pickle.Unpickler):
+    """
+        기본 자료형만 허용하는 언피클러 (이전 형식 캐시 이전 전용)
+    """
+
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(f"허용되지 않은 객체: {module}.{name}")
+
+
+def load_legacy_pickle(data: bytes) -> Any:
+    """
+        이전 pickle 캐시 읽기 (dict/list/str/숫자 외 객체는 거부)
+    """
+    return _SafeUnpickler(io.BytesIO(data)).load()
@@ -0,0 +1,69 @@
+from typing import List, Tuple
+
+# (xmin, ymin, xmax, ymax)
+Extent = Tuple[float, float, float, float]
+
+
+def area(extent: Extent) -> float:
+    """
+        범위 면적 (뒤집힌 범위는 0)
+    """
+    return max(0.0, extent[2] - extent[0]) * max(0.0, extent[3] - extent[1])
+
+
+def subtract_extent(extent: Extent, other: Extent) -> List[Extent]:
+    """
+        extent에서 other를 뺀 나머지 영역 (최대 4개 사각형)
+    """
+    xmin, ymin, xmax, ymax = extent
+    oxmin, oymin, oxmax, oymax = other
+
+    if oxmin >= xmax or oxmax <= xmin or oymin >= ymax or oymax <= ymin:
+        return [extent]
+
+    pieces = []
+    if oymin > ymin:
+        pieces.append((xmin, ymin, xmax, oymin))
+    if oymax < ymax:
+        pieces.append((xmin, oymax, xmax, ymax))
+
+    top = min(ymax, oymax)
+    bottom = max(ymin, oymin)
+    if oxmin > xmin:
+        pieces.append((xmin, bottom, oxmin, top))
+    if oxmax < xmax:
+        pieces.append((oxmax, bottom, xmax, top))
+
+    return pieces
+
+
+def intersects(extent: Extent, other: Extent) -> bool:
+    """
+        두 범위가 겹치는지 (경계만 닿으면 False)
+    """
+    return extent[0] < other[2] and other[0] < extent[2] and extent[1] < other[3] and other[1] < extent[3]
+
+
+def merge_extents(extents: List[Extent], ratio: float) -> List[Extent]:
+    """
+        가까운 범위를 합쳐 요청 수를 줄임
+            - 두 범위를 감싸는 사각형의 면적이 두 면적 합의 ratio배 이하이면 합침
+    """
+    merged = list(extents)
+    changed = True
+
+    while changed and len(merged) > 1:
+        changed = False
+        for i in range(len(merged)):
+            for j in range(i + 1, len(merged)):
+                a, b = merged[i], merged[j]
+                union = (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+                if area(union) <= (area(a) + area(b)) * ratio:
+                    merged[i] = union
+                    del merged[j]
+                    changed = True
+                    break
+            if changed:
+                break
+
+    return merged
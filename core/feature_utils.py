@@ -0,0 +1,92 @@
+from qgis.core import QgsVectorLayer, QgsFeature, QgsField, QgsFields, QgsWkbTypes
+from PyQt5.QtCore import QVariant
+from typing import List
+
+from ..exceptions import LayerError
+
+_NUMERIC_TYPES = (QVariant.Int, QVariant.LongLong, QVariant.Double)
+
+
+def widen_type(current: QVariant.Type, other: QVariant.Type) -> QVariant.Type:
+    """
+        두 필드 타입의 값을 모두 담을 수 있는 타입 (정수 + 실수 -> 실수, 그 외 불일치 -> 문자열)
+    """
+    if current == other:
+        return current
+    if current in _NUMERIC_TYPES and other in _NUMERIC_TYPES:
+        return QVariant.Double if QVariant.Double in (current, other) else QVariant.LongLong
+    return QVariant.String
+
+
+def merge_fields(features: List[QgsFeature]) -> QgsFields:
+    """
+        피처 목록 전체의 필드 합집합 (처음 나타난 순서, 타입이 다르면 넓은 타입으로)
+    """
+    merged = {}
+    layouts = set()
+
+    for feature in features:
+        fields = feature.fields()
+        layout = tuple((field.name(), field.type()) for field in fields)
+        if layout in layouts:
+            continue
+        layouts.add(layout)
+
+        for field in fields:
+            current = merged.get(field.name())
+            if current is None:
+                merged[field.name()] = QgsField(field)
+            elif current.type() != field.type():
+                merged[field.name()] = QgsField(field.name(), widen_type(current.type(), field.type()))
+
+    result = QgsFields()
+    for field in merged.values():
+        result.append(field)
+    return result
+
+
+def append_features(layer: QgsVectorLayer, features: List[QgsFeature]) -> int:
+    """
+        피처 목록을 레이어에 추가, 추가된 수 반환
+            - 묶음 안 모든 피처의 새 필드는 레이어에 추가하고 속성은 필드 이름으로 맞춤
+    """
+    if not features:
+        return 0
+
+    provider = layer.dataProvider()
+    source_fields = merge_fields(features)
+
+    missing = [field for field in source_fields if layer.fields().indexOf(field.name()) < 0]
+    if missing:
+        provider.addAttributes(missing)
+        layer.updateFields()
+
+    target_fields = layer.fields()
+    target_names = target_fields.names()
+    to_multi = QgsWkbTypes.isMultiType(layer.wkbType())
+
+    converted = []
+    for feature in features:
+        new_feature = QgsFeature(target_fields)
+
+        if feature.hasGeometry():
+            geometry = feature.geometry()
+            if to_multi and not geometry.isMultipart():
+                geometry.convertToMultiType()
+            new_feature.setGeometry(geometry)
+
+        names = feature.fields().names()
+        if names == target_names:
+            new_feature.setAttributes(feature.attributes())
+        else:
+            for name, value in zip(names, feature.attributes()):
+                new_feature.setAttribute(name, value)
+
+        converted.append(new_feature)
+
+    success, _ = provider.addFeatures(converted)
+    if not success:
+        raise LayerError(f"피처 추가 실패: {layer.name()}")
+
+    layer.updateExtents()
+    return len(converted)
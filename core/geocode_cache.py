@@ -0,0 +1,104 @@
+from typing import Dict, Any, Optional, Iterable, Callable, Tuple
+import re
+import unicodedata
+import logging
+
+from ..constants import GEOCODE_CACHE_DIR, GEOCODE_CACHE_TTL
+from .cache_manager import CacheManager
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r'\s+')
+
+# 주소가 바뀌지 않는 한 결과가 같은 응답만 캐시 (ERROR 등은 제외)
+CACHEABLE_STATUSES = ('OK', 'NOT_FOUND')
+
+# 조회 순서 (도로명 -> 지번)
+ADDRESS_TYPES = ('road', 'parcel')
+
+
+class GeocodeCache:
+    """
+        지오코딩 결과 영구 캐시 (정규화 주소 + 좌표계 + 주소 유형 기준)
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, ttl: int = GEOCODE_CACHE_TTL):
+        self.cache = CacheManager.shared(cache_dir or GEOCODE_CACHE_DIR, ttl)
+
+    @staticmethod
+    def normalize_address(address: str) -> str:
+        """
+            주소 정규화 (유니코드 NFC, 공백 정리, 대소문자 통일)
+        """
+        address = unicodedata.normalize('NFC', address or '')
+        return _WHITESPACE.sub(' ', address).strip().casefold()
+
+    @classmethod
+    def make_key(cls, address: str, crs: str, address_type: str) -> str:
+        """
+            캐시 키 생성
+        """
+        return f"geocode|{address_type}|{crs}|{cls.normalize_address(address)}"
+
+    def get(self, address: str, crs: str, address_type: str) -> Optional[Dict[str, Any]]:
+        """
+            캐시된 결과 반환
+                {'status': 'OK', 'x': float, 'y': float} 또는 {'status': 'NOT_FOUND', 'text': str}
+        """
+        return self.cache.get(self.make_key(address, crs, address_type))
+
+    def lookup(
+            self,
+            address: str,
+            crs: str,
+            address_type: str,
+            fetch_func: Callable[[], Dict[str, Any]]
+    ) -> Tuple[Dict[str, Any], str]:
+        """
+            stale-while-revalidate 조회, (항목, hit/stale/miss) 반환
+                fetch_func: 지오코딩 API 응답을 반환하는 함수
+        """
+        return self.cache.get_or_fetch(
+            self.make_key(address, crs, address_type),
+            lambda: self.entry_from_response(fetch_func()),
+            cacheable=lambda entry: entry.get('status') in CACHEABLE_STATUSES
+        )
+
+    def prefetch(self, addresses: Iterable[str], crs: str) -> Dict[str, Dict[str, Any]]:
+        """
+            배치 입력 전체의 도로명/지번 캐시 항목을 한 번에 조회, {캐시 키: 항목} 반환
+        """
+        keys = [
+            self.make_key(address, crs, address_type)
+            for address in addresses
+            for address_type in ADDRESS_TYPES
+        ]
+        return self.cache.get_many(keys)
+
+    def set(self, address: str, crs: str, address_type: str, entry: Dict[str, Any]):
+        """
+            결과 저장 (캐시 대상 상태만)
+        """
+        if entry.get('status') in CACHEABLE_STATUSES:
+            self.cache.set(self.make_key(address, crs, address_type), entry)
+
+    def flush(self):
+        """
+            대기 중인 쓰기 기록
+        """
+        self.cache.flush()
+
+    @staticmethod
+    def entry_from_response(response: Dict[str, Any]) -> Dict[str, Any]:
+        """
+            지오코딩 API 응답을 캐시 항목으로 변환
+        """
+        body = response.get('response', {})
+        status = body.get('status')
+
+        if status == 'OK':
+            point = body['result']['point']
+            return {'status': 'OK', 'x': float(point['x']), 'y': float(point['y'])}
+
+        text = body.get('error', {}).get('text', '주소를 찾을 수 없습니다')
+        return {'status': status or 'ERROR', 'text': text}
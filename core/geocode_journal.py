@@ -0,0 +1,189 @@
+from typing import Dict, Any, List, Iterator, Optional, Tuple, TextIO
+import hashlib
+import json
+import os
+import logging
+
+from ..constants import GEOCODE_JOURNAL_SUFFIX
+from ..exceptions import FileError
+
+logger = logging.getLogger(__name__)
+
+# 2: 확정된 행(성공/주소 없음)만 기록, 이전 형식은 오류/취소 행도 완료로 기록했으므로 버림
+JOURNAL_VERSION = 2
+
+
+class GeocodeJournal:
+    """
+        일괄 지오코딩 체크포인트 기록 (추가 전용 JSON Lines)
+            - 첫 줄: 입력 지문(주소 목록 + 좌표계) 헤더
+            - 이후 줄: 입력 순서대로 확정된 결과 묶음 {'start': int, 'rows': [...]}
+            - 같은 입력으로 다시 시작하면 기록된 행은 건너뛰고, 오류/취소로 확정되지 않은 행부터 다시 처리
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.completed = 0
+        self._file: Optional[TextIO] = None
+
+    @staticmethod
+    def path_for(input_path: str) -> str:
+        """
+            입력 파일 옆의 체크포인트 파일 경로
+        """
+        return f"{input_path}{GEOCODE_JOURNAL_SUFFIX}"
+
+    @staticmethod
+    def fingerprint(addresses: List[str], crs: str) -> str:
+        """
+            입력 지문 (주소 순서까지 같아야 이어서 처리 가능)
+        """
+        digest = hashlib.sha256()
+        digest.update(crs.encode('utf-8'))
+        for address in addresses:
+            digest.update(b'\n')
+            digest.update((address or '').encode('utf-8'))
+        return digest.hexdigest()
+
+    def open(self, addresses: List[str], crs: str) -> int:
+        """
+            체크포인트 열기, 이미 끝난 행 수 반환
+                - 입력이 다르거나 기록이 없으면 새로 시작 (0)
+                - 중단으로 잘린 마지막 줄은 버리고 그 앞까지 이어서 기록
+        """
+        header = {
+            'version': JOURNAL_VERSION,
+            'fingerprint': self.fingerprint(addresses, crs),
+            'total': len(addresses)
+        }
+
+        try:
+            completed, offset = self._scan(header['fingerprint'])
+
+            if completed is None:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+
+                self._file = open(self.path, 'w', encoding='utf-8')
+                self._write_line(header)
+                self.completed = 0
+            else:
+                with open(self.path, 'r+b') as f:
+                    f.truncate(offset)
+
+                self._file = open(self.path, 'a', encoding='utf-8')
+                self.completed = completed
+                logger.info(f"지오코딩 체크포인트 발견: {completed}/{len(addresses)}건 완료 ({self.path})")
+
+        except OSError as e:
+            self.close()
+            raise FileError(f"체크포인트 파일 열기 실패: {self.path} ({e})")
+
+        return self.completed
+
+    def append(self, start: int, rows: List[Dict[str, Any]]):
+        """
+            확정된 결과 묶음 기록 (입력 순서대로 이어진 묶음만)
+        """
+        if self._file is None:
+            return
+
+        if start != self.completed:
+            raise FileError(f"체크포인트 순서 오류: {start} (기록된 행 {self.completed})")
+
+        try:
+            self._write_line({'start': start, 'rows': rows})
+        except OSError as e:
+            raise FileError(f"체크포인트 기록 실패: {self.path} ({e})")
+
+        self.completed += len(rows)
+
+    def iter_chunks(self) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+        """
+            기록된 결과 묶음을 순서대로 반환 (재시작 시 레이어/파일 복원용)
+        """
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            f.readline()
+            expected = 0
+
+            for line in f:
+                chunk = self._parse_chunk(line, expected)
+                if chunk is None or expected >= self.completed:
+                    return
+
+                yield chunk['start'], chunk['rows']
+                expected += len(chunk['rows'])
+
+    def close(self):
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            self._file = None
+
+    def remove(self):
+        """
+            작업이 끝난 체크포인트 삭제
+        """
+        self.close()
+        try:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+        except OSError as e:
+            logger.warning(f"체크포인트 삭제 실패 {self.path}: {e}")
+
+    def _scan(self, fingerprint: str) -> Tuple[Optional[int], int]:
+        """
+            기존 기록 확인, (끝난 행 수, 이어서 기록할 위치) 반환 (사용할 수 없으면 None)
+        """
+        if not os.path.exists(self.path):
+            return None, 0
+
+        with open(self.path, 'rb') as f:
+            try:
+                header = json.loads(f.readline().decode('utf-8'))
+            except (ValueError, UnicodeDecodeError):
+                return None, 0
+
+            if header.get('version') != JOURNAL_VERSION or header.get('fingerprint') != fingerprint:
+                logger.info(f"입력이 바뀌어 체크포인트를 새로 만듭니다: {self.path}")
+                return None, 0
+
+            completed = 0
+            offset = f.tell()
+
+            # 줄 단위로 읽어 마지막으로 온전한 묶음까지만 인정
+            for line in iter(f.readline, b''):
+                if not line.endswith(b'\n'):
+                    break
+
+                chunk = self._parse_chunk(line, completed)
+                if chunk is None:
+                    break
+
+                completed += len(chunk['rows'])
+                offset = f.tell()
+
+        return completed, offset
+
+    @staticmethod
+    def _parse_chunk(line, expected: int) -> Optional[Dict[str, Any]]:
+        try:
+            chunk = json.loads(line)
+        except (ValueError, UnicodeDecodeError):
+            return None
+
+        if not isinstance(chunk, dict) or chunk.get('start') != expected or not isinstance(chunk.get('rows'), list):
+            return None
+        return chunk
+
+    def _write_line(self, data: Dict[str, Any]):
+        # 한 줄을 온전히 디스크에 남긴 뒤 다음 묶음 처리 (중단되어도 앞 기록은 유지)
+        self._file.write(json.dumps(data, ensure_ascii=False) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
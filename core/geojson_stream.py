@@ -0,0 +1,175 @@
+from qgis.core import QgsFeature, QgsField, QgsFields, QgsGeometry
+from PyQt5.QtCore import QVariant
+from osgeo import ogr
+from typing import Dict, Any, Iterable, Iterator
+import codecs
+import json
+import re
+import logging
+
+from ..exceptions import ApiError
+from .feature_utils import widen_type
+
+logger = logging.getLogger(__name__)
+
+_FEATURES_KEY = re.compile(r'"features"\s*:\s*\[')
+_SEPARATORS = ' \t\r\n,'
+
+# features 배열을 찾기 전까지 모아 둘 최대 크기 (오류 응답 판별용)
+_MAX_HEADER_SIZE = 1024 * 1024
+
+# 버퍼 끝에서 이 거리 안의 디코딩 오류는 덜 도착한 값(true/null/숫자/\u 이스케이프 일부)일 수 있음
+_INCOMPLETE_TAIL = 8
+
+
+def iter_geojson_features(chunks: Iterable[bytes]) -> Iterator[Dict[str, Any]]:
+    """
+        GeoJSON FeatureCollection 스트림에서 피처를 하나씩 디코딩
+            - 전체 문서를 메모리에 올리지 않고 features 배열의 객체 단위로 raw_decode
+            - 잘못된 피처 객체나 features 배열이 닫히기 전에 끝난 응답은 ApiError
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder('utf-8')()
+    buffer = ''
+    in_array = False
+
+    for chunk in chunks:
+        buffer += text_decoder.decode(chunk)
+        pos = 0
+
+        if not in_array:
+            match = _FEATURES_KEY.search(buffer)
+            if not match:
+                if len(buffer) > _MAX_HEADER_SIZE:
+                    break
+                continue
+            pos = match.end()
+            in_array = True
+
+        while True:
+            while pos < len(buffer) and buffer[pos] in _SEPARATORS:
+                pos += 1
+
+            if pos >= len(buffer):
+                break
+
+            if buffer[pos] == ']':
+                return
+
+            try:
+                feature, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError as e:
+                if not _is_incomplete(e, buffer):
+                    raise ApiError(f"WFS 응답의 피처를 해석할 수 없습니다: {e.msg} ({buffer[pos:pos + 200]})")
+                # 객체가 아직 다 도착하지 않음
+                break
+
+            yield feature
+
+        buffer = buffer[pos:]
+
+    if not in_array:
+        raise ApiError(f"WFS 응답에 피처 목록이 없습니다: {buffer[:500]}")
+
+    # 배열을 닫는 ']' 전에 스트림이 끝남 (연결 끊김 등)
+    raise ApiError(f"WFS 응답이 중간에 끊겼습니다: {buffer[:200]}")
+
+
+def _is_incomplete(error: json.JSONDecodeError, buffer: str) -> bool:
+    """
+        디코딩 오류가 데이터가 덜 도착해서인지 확인 (아니면 잘못된 JSON)
+    """
+    # 닫는 따옴표가 아직 오지 않은 문자열
+    if error.msg.startswith('Unterminated string'):
+        return True
+    return len(buffer) - error.pos <= _INCOMPLETE_TAIL
+
+
+class GeoJsonFeatureConverter:
+    """
+        GeoJSON 피처 -> QgsFeature 변환
+            - 속성 필드는 값이 처음 나타날 때 추가 (null만 있는 동안은 타입을 알 수 없으므로 추가하지 않음)
+            - 정수 필드에 실수가 오는 등 타입이 달라지면 넓은 타입으로 변경 (append_features에서 묶음 전체 기준으로 맞춤)
+    """
+
+    def __init__(self, id_field: str):
+        self.id_field = id_field
+        self.fields = QgsFields()
+        self.fields.append(QgsField(id_field, QVariant.String))
+
+    def to_feature(self, data: Dict[str, Any]) -> QgsFeature:
+        properties = data.get('properties') or {}
+
+        self._update_fields(properties)
+        feature = QgsFeature(self.fields)
+
+        if data.get('id') is not None:
+            feature.setAttribute(self.id_field, str(data['id']))
+
+        for name, value in properties.items():
+            if value is None:
+                continue
+            if isinstance(value, (dict, list)):
+                value = json.dumps(value, ensure_ascii=False)
+            feature.setAttribute(name, value)
+
+        geometry = data.get('geometry')
+        if geometry:
+            feature.setGeometry(self.geometry_from_geojson(geometry))
+
+        return feature
+
+    @staticmethod
+    def geometry_from_geojson(geometry: Dict[str, Any]) -> QgsGeometry:
+        """
+            GeoJSON geometry -> QgsGeometry (OGR 경유)
+        """
+        ogr_geometry = ogr.CreateGeometryFromJson(json.dumps(geometry))
+        if ogr_geometry is None:
+            return QgsGeometry()
+
+        result = QgsGeometry()
+        result.fromWkb(ogr_geometry.ExportToIsoWkb())
+        return result
+
+    def _update_fields(self, properties: Dict[str, Any]):
+        """
+            새 속성 필드 추가 및 타입 확장 (바뀐 경우에만 필드 목록을 새로 만듦)
+        """
+        changes = {}
+
+        for name, value in properties.items():
+            if value is None:
+                continue
+
+            value_type = self._field_type(value)
+            idx = self.fields.indexOf(name)
+
+            if idx < 0:
+                changes[name] = value_type
+            else:
+                current = self.fields.at(idx).type()
+                if current != value_type and widen_type(current, value_type) != current:
+                    changes[name] = widen_type(current, value_type)
+
+        if not changes:
+            return
+
+        fields = QgsFields()
+        for field in self.fields:
+            if field.name() in changes:
+                field = QgsField(field.name(), changes.pop(field.name()))
+            fields.append(field)
+        for name, field_type in changes.items():
+            fields.append(QgsField(name, field_type))
+        self.fields = fields
+
+    @staticmethod
+    def _field_type(value: Any) -> QVariant.Type:
+        if isinstance(value, bool):
+            return QVariant.Bool
+        if isinstance(value, int):
+            return QVariant.LongLong
+        if isinstance(value, float):
+            return QVariant.Double
+        return QVariant.String
@@ -3,27 +3,220 @@ from qgis.core import (
     QgsPointXY, QgsCoordinateReferenceSystem, QgsField, QgsWkbTypes,
     QgsFillSymbol, QgsPalLayerSettings, QgsTextFormat, QgsTextBufferSettings,
     QgsVectorLayerSimpleLabeling, QgsCoordinateTransform, QgsSymbol,
-    QgsSimpleFillSymbolLayer, QgsSingleSymbolRenderer
+    QgsSimpleFillSymbolLayer, QgsSingleSymbolRenderer, QgsRectangle
 )
 from PyQt5.QtCore import QVariant
 from PyQt5.QtGui import QColor, QFont
 from typing import List, Optional, Tuple, Dict, Any
 import logging
 import random
+import sqlite3
 
 from ..constants import (
     SEARCH_RESULT_LAYER, WMTS_LAYER_PREFIX, WMTS_CAPABILITIES_PATH,
     TILE_MATRIX_SET, IMAGE_FORMATS, LABEL_MAPPING, DEFAULT_FILL_COLOR,
     DEFAULT_OUTLINE_WIDTH, DEFAULT_OUTLINE_STYLE, DEFAULT_LABEL_FONT,
-    DEFAULT_LABEL_SIZE, API_BASE_URL
+    DEFAULT_LABEL_SIZE, API_BASE_URL, WFS_TILE_GRID_SIZE, WFS_MIRROR_MAX_AGE, GEOCODER_LAYER
 )
 from ..exceptions import LayerError
 from ..utils import ConfigManager
 from ..config import API_KEY  # config.py에서 직접 가져오기
+from .thread_workers import GeocodingWorker, WfsDownloadWorker, WfsMirrorWorker
+from .wfs_downloader import WfsDownloader
+from .feature_utils import append_features, merge_fields
+from .wfs_mirror import WfsMirror
+from .geocode_journal import GeocodeJournal
 
 logger = logging.getLogger(__name__)
 
 
+class FeatureLayerWriter:
+    """
+        다운로드된 피처를 메모리 레이어에 순차 기록 (첫 묶음으로 레이어 구성)
+    """
+
+    def __init__(self, layer_id: str, layer_name: str, crs: str):
+        self.layer_id = layer_id
+        self.layer_name = layer_name
+        self.crs = crs
+        self.layer: Optional[QgsVectorLayer] = None
+        self.count = 0
+
+    def write(self, features: List[QgsFeature]):
+        """
+            피처 목록 추가 (메인 스레드에서 호출)
+        """
+        if not features:
+            return
+
+        if self.layer is None:
+            self.layer = self._create_layer(features)
+
+        self.count += append_features(self.layer, features)
+        self.layer.triggerRepaint()
+
+    def _create_layer(self, features: List[QgsFeature]) -> QgsVectorLayer:
+        geometry_type = QgsWkbTypes.Unknown
+        for feature in features:
+            if feature.hasGeometry():
+                # 페이지마다 단일/멀티가 섞일 수 있으므로 멀티 타입으로 통일
+                geometry_type = QgsWkbTypes.multiType(feature.geometry().wkbType())
+                break
+
+        uri = f"{QgsWkbTypes.displayString(geometry_type)}?crs={self.crs}"
+        layer = QgsVectorLayer(uri, self.layer_id, "memory")
+
+        if not layer.isValid():
+            raise LayerError(f"레이어 생성 실패: {self.layer_id}")
+
+        layer.dataProvider().addAttributes(merge_fields(features).toList())
+        layer.updateFields()
+
+        LayerManager._apply_wfs_style(layer, self.layer_name)
+        QgsProject.instance().addMapLayer(layer)
+        logger.info(f"WFS 다운로드 레이어 생성: {self.layer_id}")
+
+        return layer
+
+
+class MirrorLayerLoader:
+    """
+        로컬 저장소(GeoPackage) 레이어를 프로젝트에 올리고, 워커가 받은 피처를 저장하면서 다시 그림
+            저장소 쓰기와 레이어 갱신은 모두 메인 스레드에서 처리
+    """
+
+    def __init__(self, layer_id: str, layer_name: str, crs: str, mirror: WfsMirror):
+        self.layer_id = layer_id
+        self.layer_name = layer_name
+        self.crs = crs
+        self.mirror = mirror
+        self.layer: Optional[QgsVectorLayer] = None
+
+        # 저장에 실패한 피처가 있으면 이후 타일도 받은 범위로 기록하지 않음
+        # (타일 경계에서 중복 제거된 피처가 실패한 묶음에 들어 있었을 수 있음, 다음 요청 때 다시 받음)
+        self._write_failed = False
+
+    def load(self):
+        """
+            저장소가 있으면 레이어 추가 (메인 스레드에서 호출)
+        """
+        if self.layer is not None or not self.mirror.has_layer(self.layer_name, self.crs):
+            return
+
+        uri = self.mirror.get_layer_uri(self.layer_name, self.crs)
+
+        # 이미 프로젝트에 올라간 저장소 레이어는 다시 추가하지 않음
+        for layer in QgsProject.instance().mapLayers().values():
+            if layer.providerType() == "ogr" and layer.source() == uri:
+                self.layer = layer
+                return
+
+        layer = QgsVectorLayer(uri, self.layer_id, "ogr")
+        if not layer.isValid():
+            raise LayerError(f"로컬 저장소 레이어 추가 실패: {self.layer_id}")
+
+        LayerManager._apply_wfs_style(layer, self.layer_name)
+        QgsProject.instance().addMapLayer(layer)
+        self.layer = layer
+
+        logger.info(f"WFS 로컬 저장소 레이어 추가: {self.layer_id}")
+
+    def write(self, features: List[QgsFeature]):
+        """
+            받은 피처를 저장소에 저장 후 레이어 갱신 (메인 스레드에서 호출)
+        """
+        if not features:
+            return
+
+        try:
+            self.mirror.write(self.layer_name, self.crs, features)
+        except (LayerError, sqlite3.Error) as e:
+            logger.error(f"WFS 로컬 저장 실패 ({self.layer_name}): {e}")
+            self._write_failed = True
+            return
+
+        self.refresh()
+
+    def add_coverage(self, tile):
+        """
+            빠짐없이 저장한 타일 범위 기록 (해당 타일의 피처를 저장한 뒤 호출됨)
+                앞서 저장에 실패한 피처가 있으면 기록하지 않음
+        """
+        if self._write_failed:
+            logger.warning(f"저장 실패로 받은 범위를 기록하지 않음 ({self.layer_name}): {tile}")
+            return
+
+        try:
+            self.mirror.add_coverage(self.layer_name, self.crs, tile)
+        except sqlite3.Error as e:
+            logger.error(f"WFS 로컬 저장 범위 기록 실패 ({self.layer_name}): {e}")
+
+    def refresh(self, *args):
+        """
+            새로 저장된 피처 반영
+        """
+        if self.layer is None:
+            self.load()
+            return
+
+        self.layer.dataProvider().reloadData()
+        self.layer.updateExtents()
+        self.layer.triggerRepaint()
+
+
+class GeocodeLayerWriter:
+    """
+        지오코딩 결과 묶음을 포인트 레이어에 순차 기록 (실패한 주소는 도형 없이 기록)
+    """
+
+    def __init__(self, layer_name: str, crs: str):
+        self.layer_name = layer_name
+        self.crs = crs
+        self.layer: Optional[QgsVectorLayer] = None
+        self.count = 0
+
+    def write(self, start: int, results: List[Dict[str, Any]]):
+        """
+            결과 묶음 추가 (메인 스레드에서 호출)
+                start: 묶음 첫 행의 입력 인덱스
+        """
+        if not results:
+            return
+
+        if self.layer is None:
+            self.layer = self._create_layer()
+
+        features = []
+        for offset, result in enumerate(results):
+            feature = QgsFeature(self.layer.fields())
+            feature.setAttributes([
+                start + offset + 1, result['address'], result['x'], result['y'], result['status']
+            ])
+
+            if result['status'].startswith('성공'):
+                feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(result['x'], result['y'])))
+
+            features.append(feature)
+
+        self.layer.dataProvider().addFeatures(features)
+        self.layer.updateExtents()
+        self.layer.triggerRepaint()
+        self.count += len(features)
+
+    def _create_layer(self) -> QgsVectorLayer:
+        fields = [
+            QgsField('row', QVariant.Int),
+            QgsField('address', QVariant.String),
+            QgsField('x', QVariant.Double),
+            QgsField('y', QVariant.Double),
+            QgsField('status', QVariant.String)
+        ]
+
+        layer = LayerManager.create_point_layer(self.layer_name, self.crs, fields)
+        QgsProject.instance().addMapLayer(layer)
+        return layer
+
+
 class LayerManager:
 
     @staticmethod
@@ -238,6 +431,139 @@ class LayerManager:
 
         return wfs_layer
 
+    @staticmethod
+    def download_wfs_layer(
+            layer_id: str,
+            layer_name: str,
+            crs: Optional[str] = None,
+            bbox: Optional[str] = None
+    ) -> WfsDownloadWorker:
+        """
+            WFS 피처 전체를 페이지 단위로 내려받아 메모리 레이어로 추가 (백그라운드)
+                - maxNumFeatures 제한 없이 마지막 페이지까지 받음
+                - 반환된 워커로 진행률 확인 및 취소
+        """
+        if crs is None:
+            crs = QgsProject.instance().crs().authid()
+
+        writer = FeatureLayerWriter(layer_id, layer_name, crs)
+
+        worker = WfsDownloadWorker(layer_name, crs, bbox)
+        worker.writer = writer
+        worker.features_ready.connect(writer.write)
+        worker.start()
+
+        logger.info(f"WFS 다운로드 시작: {layer_id} ({layer_name})")
+        return worker
+
+    @staticmethod
+    def extract_wfs_layer(
+            layer_id: str,
+            layer_name: str,
+            extent: QgsRectangle,
+            crs: Optional[str] = None,
+            grid_size: int = WFS_TILE_GRID_SIZE
+    ) -> WfsDownloadWorker:
+        """
+            범위를 격자 타일로 나눠 병렬로 받아 하나의 메모리 레이어로 추가 (백그라운드)
+                - 타일 경계에 걸친 피처는 fid 기준으로 한 번만 추가
+                - 서버 상한에 닿은 타일은 자동으로 더 잘게 분할
+        """
+        if crs is None:
+            crs = QgsProject.instance().crs().authid()
+
+        writer = FeatureLayerWriter(layer_id, layer_name, crs)
+
+        worker = WfsDownloadWorker(layer_name, crs, WfsDownloader.format_bbox(extent, crs), grid_size=grid_size)
+        worker.writer = writer
+        worker.features_ready.connect(writer.write)
+        worker.start()
+
+        logger.info(f"WFS 타일 분할 다운로드 시작: {layer_id} ({layer_name}, {grid_size}x{grid_size})")
+        return worker
+
+    @staticmethod
+    def add_mirrored_wfs_layer(
+            layer_id: str,
+            layer_name: str,
+            extent: QgsRectangle,
+            crs: Optional[str] = None,
+            max_age: Optional[float] = None
+    ) -> Tuple[Optional[QgsVectorLayer], Optional[WfsMirrorWorker]]:
+        """
+            로컬 저장소(GeoPackage)에서 WFS 레이어 추가
+                - 저장된 피처는 바로 표시하고, 요청 범위 중 아직 받지 않은 부분만 백그라운드로 받음
+                - max_age(초)를 주면 그보다 오래전에 받은 범위도 다시 받음
+                - (레이어, 워커) 반환, 모두 저장되어 있으면 워커는 None
+                - 저장소가 처음 만들어지는 경우 레이어는 첫 저장 후 추가됨
+        """
+        if crs is None:
+            crs = QgsProject.instance().crs().authid()
+
+        mirror = WfsMirror()
+        loader = MirrorLayerLoader(layer_id, layer_name, crs, mirror)
+        loader.load()
+
+        requested = WfsDownloader.to_extent(extent)
+        missing = mirror.missing_extents(layer_name, crs, requested, max_age)
+
+        if not missing:
+            logger.info(f"WFS 로컬 저장소에서 불러옴: {layer_id}")
+            return loader.layer, None
+
+        worker = WfsMirrorWorker(layer_name, crs, missing)
+        worker.loader = loader
+        worker.features_ready.connect(loader.write)
+        worker.tile_done.connect(loader.add_coverage)
+        worker.start()
+
+        logger.info(f"WFS 로컬 저장소 갱신 시작: {layer_id} (받을 범위 {len(missing)}개)")
+        return loader.layer, worker
+
+    @staticmethod
+    def refresh_mirrored_wfs_layer(
+            layer_id: str,
+            layer_name: str,
+            extent: QgsRectangle,
+            crs: Optional[str] = None,
+            max_age: float = WFS_MIRROR_MAX_AGE
+    ) -> Optional[WfsMirrorWorker]:
+        """
+            로컬 저장소 갱신 (받지 않았거나 max_age초보다 오래된 범위만 다시 받음)
+                - 모두 최신이면 None 반환
+        """
+        _, worker = LayerManager.add_mirrored_wfs_layer(layer_id, layer_name, extent, crs, max_age)
+        return worker
+
+    @staticmethod
+    def geocode_to_layer(
+            addresses: List[str],
+            crs: Optional[str] = None,
+            layer_name: str = GEOCODER_LAYER,
+            output_path: Optional[str] = None,
+            input_path: Optional[str] = None
+    ) -> GeocodingWorker:
+        """
+            주소 목록을 지오코딩하면서 결과를 묶음 단위로 포인트 레이어에 추가 (백그라운드)
+                - output_path가 있으면 같은 결과를 CSV로도 저장 (기존 파일은 새로 작성)
+                - input_path가 있으면 입력 파일 옆에 체크포인트를 두고, 중단된 작업은 이어서 처리
+                - 반환된 워커로 진행률 확인 및 취소 (취소 전까지의 결과는 레이어/파일에 남음)
+        """
+        if crs is None:
+            crs = QgsProject.instance().crs().authid()
+
+        writer = GeocodeLayerWriter(layer_name, crs)
+
+        journal_path = GeocodeJournal.path_for(input_path) if input_path else None
+
+        worker = GeocodingWorker(addresses, crs, output_path=output_path, journal_path=journal_path)
+        worker.writer = writer
+        worker.chunk_ready.connect(writer.write)
+        worker.start()
+
+        logger.info(f"지오코딩 시작: {len(addresses)}건 -> {layer_name}")
+        return worker
+
     @staticmethod
     def _apply_wfs_style(layer: QgsVectorLayer, layer_name: str):
         """
@@ -0,0 +1,229 @@
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool
+from typing import List, Optional, Tuple
+import heapq
+import itertools
+import threading
+import logging
+
+from ..constants import (
+    TASK_SCHEDULER_MAX_THREADS, TASK_SCHEDULER_MAX_QUEUE, TASK_SCHEDULER_SHUTDOWN_TIMEOUT,
+    TASK_PRIORITY_INTERACTIVE, TASK_PRIORITY_NORMAL
+)
+from ..exceptions import TaskSchedulerError
+from ..utils import CancellationToken
+
+logger = logging.getLogger(__name__)
+
+
+class _TaskRunnable(QRunnable):
+    """
+        스레드 풀에서 워커 하나를 실행하는 래퍼
+    """
+
+    def __init__(self, scheduler: 'TaskScheduler', worker: 'ScheduledWorker'):
+        super().__init__()
+        self.scheduler = scheduler
+        self.worker = worker
+
+    def run(self):
+        worker = self.worker
+        try:
+            # 대기 중 취소된 작업은 실행하지 않음
+            if not worker.is_cancelled:
+                worker.run()
+        except Exception as e:
+            logger.exception(f"작업 실행 오류 ({type(worker).__name__}): {e}")
+        finally:
+            worker._done.set()
+            self.scheduler._task_done(worker)
+
+
+class TaskScheduler:
+    """
+        공유 스레드 풀 기반 작업 스케줄러
+            - 우선순위가 높은 작업부터 실행 (같은 우선순위는 요청 순서)
+            - 스레드 하나는 항상 대화형 작업용으로 남겨 둠
+            - 백그라운드 작업 대기열이 가득 차면 TaskSchedulerError (대화형 작업은 제한 없음)
+    """
+
+    _shared: Optional['TaskScheduler'] = None
+    _shared_lock = threading.Lock()
+
+    # 종료한 스케줄러의 스레드 풀 (QThreadPool 소멸자는 남은 작업을 제한 없이 기다리므로
+    # 언로드 중에 소멸되지 않도록 프로세스가 끝날 때까지 유지)
+    _retired_pools: List[QThreadPool] = []
+
+    def __init__(self, max_threads: int = TASK_SCHEDULER_MAX_THREADS, max_queue: int = TASK_SCHEDULER_MAX_QUEUE):
+        self.max_threads = max(1, int(max_threads))
+        self.max_queue = max_queue
+
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(self.max_threads)
+
+        self._queue: List[Tuple[int, int, 'ScheduledWorker']] = []
+        self._running = set()
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> 'TaskScheduler':
+        """
+            플러그인 전체에서 공유하는 스케줄러
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @classmethod
+    def shutdown_shared(cls):
+        """
+            공유 스케줄러 종료 (플러그인 언로드 시)
+        """
+        with cls._shared_lock:
+            scheduler, cls._shared = cls._shared, None
+
+        if scheduler is not None:
+            scheduler.shutdown()
+            cls._retired_pools.append(scheduler.pool)
+
+    def submit(self, worker: 'ScheduledWorker'):
+        """
+            작업 등록
+        """
+        with self._lock:
+            # 사용자가 기다리는 대화형 작업은 백그라운드 작업이 쌓여 있어도 거절하지 않음
+            if worker.priority < TASK_PRIORITY_INTERACTIVE and self._background_pending() >= self.max_queue:
+                raise TaskSchedulerError(f"대기 중인 작업이 너무 많습니다 ({len(self._queue)}개)")
+            heapq.heappush(self._queue, (-worker.priority, next(self._seq), worker))
+
+        self._dispatch()
+
+    def remove(self, worker: 'ScheduledWorker') -> bool:
+        """
+            아직 시작하지 않은 작업을 대기열에서 제거, 제거했으면 True
+        """
+        with self._lock:
+            for idx, entry in enumerate(self._queue):
+                if entry[2] is worker:
+                    self._queue[idx] = self._queue[-1]
+                    self._queue.pop()
+                    heapq.heapify(self._queue)
+                    return True
+        return False
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._queue)
+
+    def running_count(self) -> int:
+        with self._lock:
+            return len(self._running)
+
+    def shutdown(self, timeout: int = TASK_SCHEDULER_SHUTDOWN_TIMEOUT):
+        """
+            대기 작업 제거, 실행 중 작업 취소 후 종료를 기다림
+        """
+        with self._lock:
+            queued = [entry[2] for entry in self._queue]
+            running = list(self._running)
+            self._queue.clear()
+
+        for worker in queued:
+            worker.cancel_token.cancel()
+            worker._done.set()
+
+        for worker in running:
+            worker.cancel()
+
+        if not self.pool.waitForDone(timeout):
+            logger.warning(f"종료되지 않은 작업이 있습니다: {self.running_count()}개")
+
+    def _dispatch(self):
+        """
+            빈 스레드만큼 대기열에서 꺼내 실행
+        """
+        background_limit = max(1, self.max_threads - 1)
+
+        with self._lock:
+            while self._queue and len(self._running) < self.max_threads:
+                worker = self._queue[0][2]
+
+                # 대기열은 우선순위 순이므로 맨 앞이 막히면 나머지도 백그라운드 작업
+                if worker.priority < TASK_PRIORITY_INTERACTIVE and self._background_count() >= background_limit:
+                    break
+
+                heapq.heappop(self._queue)
+                self._running.add(worker)
+                self.pool.start(_TaskRunnable(self, worker))
+
+    def _background_pending(self) -> int:
+        return sum(1 for entry in self._queue if entry[2].priority < TASK_PRIORITY_INTERACTIVE)
+
+    def _background_count(self) -> int:
+        return sum(1 for worker in self._running if worker.priority < TASK_PRIORITY_INTERACTIVE)
+
+    def _task_done(self, worker: 'ScheduledWorker'):
+        with self._lock:
+            self._running.discard(worker)
+        self._dispatch()
+
+
+class ScheduledWorker(QObject):
+    """
+        공유 스케줄러에서 실행되는 워커 기본 클래스
+            - QThread 워커와 같은 start / isRunning / wait / cancel 사용
+            - 강제 종료 없이 run()에서 is_cancelled / cancel_token을 확인해 스스로 멈춤
+    """
+
+    priority = TASK_PRIORITY_NORMAL
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.cancel_token = CancellationToken()
+        self._scheduler: Optional[TaskScheduler] = None
+
+        # 시작 전이거나 끝난 상태
+        self._done = threading.Event()
+        self._done.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self.cancel_token.is_cancelled
+
+    def run(self):
+        raise NotImplementedError
+
+    def start(self, scheduler: Optional[TaskScheduler] = None):
+        """
+            스케줄러에 작업 등록 (대기열이 가득 차면 TaskSchedulerError)
+        """
+        self._scheduler = scheduler or TaskScheduler.shared()
+        self._done.clear()
+
+        try:
+            self._scheduler.submit(self)
+        except TaskSchedulerError:
+            self._done.set()
+            raise
+
+    def isRunning(self) -> bool:
+        """
+            대기 중이거나 실행 중이면 True
+        """
+        return not self._done.is_set()
+
+    def wait(self, msecs: Optional[int] = None) -> bool:
+        """
+            작업이 끝날 때까지 대기, 끝났으면 True (QThread.wait와 같이 밀리초 단위, 없으면 무제한)
+        """
+        return self._done.wait(None if msecs is None else msecs / 1000)
+
+    def cancel(self):
+        """
+            취소 요청 (대기 중이면 바로 제거, 실행 중이면 다음 확인 지점에서 멈춤)
+        """
+        self.cancel_token.cancel()
+
+        if self._scheduler is not None and self._scheduler.remove(self):
+            self._done.set()
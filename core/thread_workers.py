@@ -1,17 +1,33 @@
-from PyQt5.QtCore import QThread, pyqtSignal, QObject
-from typing import List, Callable, Any, Dict, Optional
+from PyQt5.QtCore import pyqtSignal
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import List, Callable, Any, Dict, Optional, Tuple
 import logging
+import threading
 import requests
 
-from ..utils import ApiClient
-from ..exceptions import GeocodingError
+from ..constants import (
+    GEOCODING_MAX_WORKERS, GEOCODING_CHUNK_SIZE, GEOCODING_REORDER_LIMIT, GEOCODING_SHUTDOWN_TIMEOUT,
+    GEOCODE_RESULT_FIELDS, WFS_CATALOG_BATCH_SIZE, WFS_PAGE_SIZE,
+    TASK_PRIORITY_INTERACTIVE, TASK_PRIORITY_BACKGROUND
+)
+from ..utils import ApiClient, FileManager, ProgressThrottler
+from ..exceptions import GeocodingError, FileError, OperationCancelledError
+from .cache_manager import CACHE_MISS
+from .geocode_cache import GeocodeCache, ADDRESS_TYPES, CACHEABLE_STATUSES
+from .geocode_journal import GeocodeJournal
+from .wfs_catalog import WfsCatalog
+from .wfs_downloader import WfsDownloader
+from .extent_utils import Extent
+from .task_scheduler import ScheduledWorker
 
 logger = logging.getLogger(__name__)
 
 
-class GenericWorker(QThread):
+class GenericWorker(ScheduledWorker):
     """
         범용 백그라운드 워커
+            progress_callback: 지정하면 func에 진행률 콜백 전달 (취소 후 호출하면 OperationCancelledError)
+            cancellable: True면 func에 cancel_token 인자 전달
     """
 
     finished = pyqtSignal(object)
@@ -24,6 +40,7 @@ class GenericWorker(QThread):
             func: Callable,
             *args,
             progress_callback: Optional[Callable] = None,
+            cancellable: bool = False,
             **kwargs
     ):
         super().__init__()
@@ -31,7 +48,9 @@ class GenericWorker(QThread):
         self.args = args
         self.kwargs = kwargs
         self.progress_callback = progress_callback
-        self._is_cancelled = False
+
+        if cancellable:
+            self.kwargs['cancel_token'] = self.cancel_token
 
     def run(self):
         try:
@@ -42,9 +61,11 @@ class GenericWorker(QThread):
 
             result = self.func(*self.args, **self.kwargs)
 
-            if not self._is_cancelled:
+            if not self.is_cancelled:
                 self.finished.emit(result)
                 self.status.emit("작업 완료")
+        except OperationCancelledError:
+            self.status.emit("작업 취소됨")
         except Exception as e:
             logger.exception(f"워커 오류: {e}")
             self.error.emit(str(e))
@@ -52,130 +73,348 @@ class GenericWorker(QThread):
 
     def _emit_progress(self, value: int, message: str = ""):
         """
-            진행률 전송
+            진행률 전송 (취소되었으면 작업 함수를 중단시키도록 예외 발생)
         """
-        if not self._is_cancelled:
-            self.progress.emit(value)
-            if message:
-                self.status.emit(message)
-
-    def cancel(self):
-        self._is_cancelled = True
-        self.terminate()
-        self.wait()
+        self.cancel_token.raise_if_cancelled()
+        self.progress.emit(value)
+        if message:
+            self.status.emit(message)
 
 
-class GeocodingWorker(QThread):
+class GeocodingWorker(ScheduledWorker):
     """
         지오코딩 전용 워커
+            - 결과는 입력 순서대로 chunk_size개씩 chunk_ready로 전달 (전체 목록을 모아 두지 않음)
+            - output_path가 있으면 시작할 때 새로 만들고 각 묶음을 워커 스레드에서 CSV에 바로 추가
+            - 취소되어도 그때까지 순서대로 끝난 결과는 전달
+            - journal_path가 있으면 끝난 묶음을 체크포인트에 기록하고,
+              같은 입력으로 다시 시작하면 기록된 결과를 먼저 전달한 뒤 나머지만 처리
     """
 
-    finished = pyqtSignal(list)
+    chunk_ready = pyqtSignal(int, list)  # 묶음 첫 행의 입력 인덱스, 결과 목록
+    finished = pyqtSignal(int)  # 전달한 결과 수
     progress = pyqtSignal(int)
     status = pyqtSignal(str)
     error = pyqtSignal(str)
 
-    def __init__(self, addresses: List[str], crs: str):
+    priority = TASK_PRIORITY_BACKGROUND
+
+    def __init__(
+            self,
+            addresses: List[str],
+            crs: str,
+            max_workers: int = GEOCODING_MAX_WORKERS,
+            chunk_size: int = GEOCODING_CHUNK_SIZE,
+            output_path: Optional[str] = None,
+            journal_path: Optional[str] = None,
+            reorder_limit: int = GEOCODING_REORDER_LIMIT
+    ):
         super().__init__()
         self.addresses = addresses
         self.crs = crs
+        self.max_workers = max(1, int(max_workers))
+        self.chunk_size = max(1, int(chunk_size))
+        self.reorder_limit = max(1, int(reorder_limit))
+        self.output_path = output_path
+        self.journal_path = journal_path
+        self.journal: Optional[GeocodeJournal] = None
+        self.delivered = 0
+        self.resumed = 0
+
+        # 확정되지 않은(일시적 오류) 행 번호, 체크포인트는 첫 미확정 행 앞까지만 기록
+        self.retry_rows = set()
+        self._journal_stopped = False
         self.api_client = ApiClient()
-        self._is_cancelled = False
+
+        # 지오코딩 결과 캐시
+        self.cache = GeocodeCache()
+        self.cache_hits = 0
+        self._prefetched: Dict[str, Dict[str, Any]] = {}
+        self._stats_lock = threading.Lock()
 
     def run(self):
         """
-            지오코딩 실행
+            지오코딩 실행 (동시 요청 수 제한, 입력 순서 유지)
         """
-        results = []
         total = len(self.addresses)
 
-        self.status.emit(f"총 {total}개 주소 지오코딩 시작...")
+        # 순서가 앞선 결과를 기다리는 완료 결과 (최대 reorder_limit개)
+        buffer: Dict[int, Dict[str, Any]] = {}
+        chunk: List[Dict[str, Any]] = []
 
-        for idx, address in enumerate(self.addresses):
-            if self._is_cancelled:
-                break
-
-            try:
-                # 진행 상태 업데이트
-                self.status.emit(f"처리 중: {address} ({idx + 1}/{total})")
+        self.api_client.reset_retry_count()
+        self.cache_hits = 0
+        self.delivered = 0
+        self.retry_rows = set()
+        self._journal_stopped = False
 
-                # 지오코딩 실행
-                result = self._geocode_single(address)
-                results.append(result)
+        try:
+            self._reset_output()
+            self.resumed = self._open_journal()
 
-                # 진행률 업데이트
-                progress = int((idx + 1) / total * 100)
-                self.progress.emit(progress)
+            # 캐시된 주소를 한 번에 조회
+            self._prefetched = self.cache.prefetch(self.addresses[self.resumed:], self.crs)
+            logger.info(f"캐시 사전 조회: {len(self._prefetched)}건")
+        except FileError as e:
+            self.error.emit(str(e))
+            return
+        except Exception as e:
+            logger.error(f"지오코딩 준비 오류: {e}")
+            self.error.emit(f"지오코딩을 시작할 수 없습니다: {e}")
+            return
+
+        if self.resumed:
+            self.status.emit(f"총 {total}개 중 {self.resumed}개 완료, 이어서 지오코딩... (동시 {self.max_workers}건)")
+        else:
+            self.status.emit(f"총 {total}개 주소 지오코딩 시작... (동시 {self.max_workers}건)")
+
+        # 취소 시 빠르게 멈출 수 있도록 실행 중인 작업 수를 작게 유지
+        window = self.max_workers * 2
+        pending = set()
+        next_idx = self.resumed
+        throttler = ProgressThrottler(total, self.progress.emit, self.status.emit, start=self.resumed)
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            while (next_idx < total or pending) and not self.is_cancelled:
+                # 앞선 주소 하나가 오래 걸려도 뒤 결과가 끝없이 쌓이지 않도록
+                # 아직 전달하지 못한 첫 주소부터 reorder_limit개까지만 요청
+                while (
+                        next_idx < total
+                        and len(pending) < window
+                        and next_idx < self.delivered + len(chunk) + self.reorder_limit
+                ):
+                    pending.add(executor.submit(self._geocode_indexed, next_idx, self.addresses[next_idx]))
+                    next_idx += 1
+
+                done, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    try:
+                        idx, result, definitive = future.result()
+                    except OperationCancelledError:
+                        continue
+
+                    buffer[idx] = result
+                    if not definitive:
+                        self.retry_rows.add(idx)
+
+                    # 진행 상태는 일정 간격으로만 전달
+                    throttler.update(message=f"처리 중: {result['address']}")
+
+                # 입력 순서대로 이어진 결과만 묶음으로 전달
+                while self.delivered + len(chunk) in buffer:
+                    chunk.append(buffer.pop(self.delivered + len(chunk)))
+                    if len(chunk) >= self.chunk_size:
+                        self._deliver(chunk)
+                        chunk = []
+        finally:
+            if not self.is_cancelled:
+                throttler.flush()
+            # 시작 전인 조회는 취소하고, 실행 중인 조회는 캐시 기록 전에 끝나기를 기다림
+            # (취소 토큰이 연결을 끊으므로 오래 걸리지 않음)
+            running = [future for future in pending if not future.cancel()]
+            executor.shutdown(wait=False)
+            if running:
+                _, not_done = wait(running, timeout=GEOCODING_SHUTDOWN_TIMEOUT)
+                if not_done:
+                    logger.warning(f"끝나지 않은 지오코딩 요청 {len(not_done)}건을 기다리지 않고 종료")
+            self.cache.flush()
+
+        # 취소된 경우에도 순서대로 확정된 결과까지는 사용할 수 있도록 전달
+        # (일시적 오류 행부터는 다음 실행 때 다시 처리)
+        if chunk and self.is_cancelled:
+            chunk = chunk[:self._definitive_count(self.delivered, chunk)]
+        if chunk:
+            self._deliver(chunk)
+
+        if self.journal is not None:
+            # 모두 확정되었으면 체크포인트 삭제, 중단/일시적 오류가 있으면 다음 실행을 위해 남김
+            if self.is_cancelled or self._journal_stopped:
+                self.journal.close()
+            else:
+                self.journal.remove()
+
+        retry_count = self.api_client.retry_count
+        logger.info(f"지오코딩 배치 재시도 횟수: {retry_count}, 캐시 적중: {self.cache_hits}")
+
+        if not self.is_cancelled:
+            self.finished.emit(self.delivered)
+            self.status.emit(f"지오코딩 완료 (캐시 적중 {self.cache_hits}건, 재시도 {retry_count}회)")
+            if self.retry_rows and self._journal_stopped:
+                self.status.emit(f"일시적 오류 {len(self.retry_rows)}건은 같은 파일로 다시 실행하면 이어서 처리합니다")
+
+    def _reset_output(self):
+        """
+            결과 파일을 비우고 새로 시작
+                (이어서 처리할 때도 체크포인트 기준으로 다시 작성, 이전 실행의 행이 빠지거나 겹치지 않도록)
+        """
+        if self.output_path and not FileManager.delete_file(self.output_path):
+            raise FileError(f"결과 파일을 다시 만들 수 없습니다: {self.output_path}")
 
-            except Exception as e:
-                logger.error(f"{address} 지오코딩 오류: {e}")
-                results.append({
-                    'address': address,
-                    'x': 0,
-                    'y': 0,
-                    'status': f'오류: {str(e)}'
-                })
-
-        if not self._is_cancelled:
-            self.finished.emit(results)
-            self.status.emit("지오코딩 완료")
-
-    def _geocode_single(self, address: str) -> Dict[str, Any]:
+    def _open_journal(self) -> int:
         """
-            단일 주소 지오코딩
+            체크포인트를 열고 이미 끝난 결과를 다시 전달, 끝난 행 수 반환
         """
+        if not self.journal_path:
+            return 0
+
+        self.journal = GeocodeJournal(self.journal_path)
+
         try:
-            # 도로명 주소로 시도
-            response = self.api_client.geocode(address, self.crs)
-
-            if response.get('response', {}).get('status') == 'OK':
-                point = response['response']['result']['point']
-                return {
-                    'address': address,
-                    'x': float(point['x']),
-                    'y': float(point['y']),
-                    'status': '성공'
-                }
+            completed = self.journal.open(self.addresses, self.crs)
+        except FileError as e:
+            # 체크포인트 없이도 작업은 가능하므로 경고만 남김
+            logger.warning(f"체크포인트를 사용할 수 없습니다: {e}")
+            self.journal = None
+            return 0
 
-            # 지번 주소로 재시도
-            params = {
-                "service": "address",
-                "request": "getcoord",
-                "crs": self.crs,
-                "address": address,
-                "format": "json",
-                "type": "parcel"
-            }
+        if not completed:
+            return 0
 
-            response = self.api_client.request("/req/address", params).json()
+        for start, rows in self.journal.iter_chunks():
+            if self.output_path:
+                FileManager.append_csv(self.output_path, rows, GEOCODE_RESULT_FIELDS)
+            self.chunk_ready.emit(start, rows)
 
-            if response.get('response', {}).get('status') == 'OK':
-                point = response['response']['result']['point']
-                return {
-                    'address': address,
-                    'x': float(point['x']),
-                    'y': float(point['y']),
-                    'status': '성공'
-                }
+        self.delivered = completed
+        return completed
+
+    def _definitive_count(self, start: int, chunk: List[Dict[str, Any]]) -> int:
+        """
+            묶음 앞에서부터 확정된(성공/주소 없음) 행 수
+        """
+        for offset in range(len(chunk)):
+            if start + offset in self.retry_rows:
+                return offset
+        return len(chunk)
+
+    def _deliver(self, chunk: List[Dict[str, Any]]):
+        """
+            결과 묶음을 체크포인트/파일에 기록하고 chunk_ready로 전달
+                체크포인트에는 첫 미확정 행 앞까지만 기록 (이후 행은 다시 실행할 때 재처리)
+        """
+        if self.journal is not None and not self._journal_stopped:
+            count = self._definitive_count(self.delivered, chunk)
+
+            try:
+                if count:
+                    self.journal.append(self.delivered, chunk[:count])
+            except FileError as e:
+                logger.warning(f"체크포인트 기록 중단: {e}")
+                self.journal.close()
+                self.journal = None
+            else:
+                if count < len(chunk):
+                    logger.info(f"일시적 오류 행 {self.delivered + count + 1}부터 체크포인트 기록 중단")
+                    self._journal_stopped = True
+
+        if self.output_path:
+            try:
+                FileManager.append_csv(self.output_path, chunk, GEOCODE_RESULT_FIELDS)
+            except FileError as e:
+                # 결과 파일에 쓸 수 없으면 남은 주소는 처리하지 않음
+                self.error.emit(str(e))
+                self.cancel_token.cancel()
+
+        self.chunk_ready.emit(self.delivered, chunk)
+        self.delivered += len(chunk)
+
+    def _geocode_indexed(self, idx: int, address: str) -> Tuple[int, Dict[str, Any], bool]:
+        """
+            스레드 풀에서 실행되는 단일 주소 지오코딩, (행 번호, 결과 행, 확정 여부) 반환
+                - 오류는 미확정 결과 행으로 변환
+                - 취소되면 결과 행 없이 OperationCancelledError
+        """
+        self.cancel_token.raise_if_cancelled("요청이 취소되었습니다.")
+
+        try:
+            result, definitive = self._geocode_single(address)
+            return idx, result, definitive
+        except OperationCancelledError:
+            raise
+        except Exception as e:
+            # 취소로 연결이 끊겨 생긴 오류는 결과로 남기지 않음
+            self.cancel_token.raise_if_cancelled("요청이 취소되었습니다.")
+
+            logger.error(f"{address} 지오코딩 오류: {e}")
+            return idx, {
+                'address': address,
+                'x': 0,
+                'y': 0,
+                'status': f'오류: {str(e)}'
+            }, False
+
+    def _geocode_single(self, address: str) -> Tuple[Dict[str, Any], bool]:
+        """
+            단일 주소 지오코딩 (도로명 -> 지번 순, 캐시 우선), (결과 행, 확정 여부) 반환
+                성공했거나 모든 유형에서 API가 주소 없음(NOT_FOUND)으로 답한 경우만 확정
+        """
+        try:
+            entry = {}
+            all_cached = True
+            definitive = True
+
+            for address_type in ADDRESS_TYPES:
+                entry, from_cache = self._lookup(address, address_type)
+                all_cached = all_cached and from_cache
+                definitive = definitive and entry.get('status') in CACHEABLE_STATUSES
+
+                if entry['status'] == 'OK':
+                    self._count_cache_hit(all_cached)
+                    return {
+                        'address': address,
+                        'x': entry['x'],
+                        'y': entry['y'],
+                        'status': '성공(캐시)' if all_cached else '성공'
+                    }, True
 
             # 실패
-            error_text = response.get('response', {}).get('error', {}).get('text', '주소를 찾을 수 없습니다')
+            self._count_cache_hit(all_cached)
+            error_text = entry.get('text', '주소를 찾을 수 없습니다')
             return {
                 'address': address,
                 'x': 0,
                 'y': 0,
-                'status': error_text
-            }
+                'status': f"{error_text}(캐시)" if all_cached else error_text
+            }, definitive
 
+        except OperationCancelledError:
+            raise
         except Exception as e:
             raise GeocodingError(f"지오코딩 실패: {str(e)}")
 
+    def _lookup(self, address: str, address_type: str) -> Tuple[Dict[str, Any], bool]:
+        """
+            캐시 조회 후 없으면 API 호출, (결과 항목, 캐시 적중 여부) 반환
+                (만료된 항목은 즉시 사용하고 백그라운드에서 갱신)
+        """
+        entry = self._prefetched.get(GeocodeCache.make_key(address, self.crs, address_type))
+
+        if entry is None:
+            entry, status = self.cache.lookup(
+                address, self.crs, address_type,
+                lambda: self.api_client.geocode(address, self.crs, self.cancel_token, address_type)
+            )
+            if status == CACHE_MISS:
+                return entry, False
+
+        return entry, True
+
+    def _count_cache_hit(self, all_cached: bool):
+        """
+            API 호출 없이 캐시만으로 끝난 주소 수 집계 (주소당 1회)
+        """
+        if all_cached:
+            with self._stats_lock:
+                self.cache_hits += 1
+
     def cancel(self):
-        self._is_cancelled = True
+        super().cancel()
         self.status.emit("작업 취소됨")
 
 
-class SearchWorker(QThread):
+class SearchWorker(ScheduledWorker):
     """
         주소 검색 전용 워커
     """
@@ -183,6 +422,8 @@ class SearchWorker(QThread):
     finished = pyqtSignal(list)
     error = pyqtSignal(str)
 
+    priority = TASK_PRIORITY_INTERACTIVE
+
     def __init__(self, query: str, crs: str):
         super().__init__()
         self.query = query
@@ -208,7 +449,7 @@ class SearchWorker(QThread):
                 "crs": self.crs
             }
 
-            response = self.api_client.request("/req/search", params).json()
+            response = self.api_client.request("/req/search", params, self.cancel_token).json()
 
             if response.get('response', {}).get('status') != 'NOT_FOUND':
                 items = response.get('response', {}).get('result', {}).get('items', [])
@@ -221,7 +462,7 @@ class SearchWorker(QThread):
                     })
 
             # 도로명 주소 검색
-            if not results:
+            if not results and not self.is_cancelled:
                 params = {
                     "request": "search",
                     "format": "json",
@@ -233,7 +474,7 @@ class SearchWorker(QThread):
                     "crs": self.crs
                 }
 
-                response = self.api_client.request("/req/search", params).json()
+                response = self.api_client.request("/req/search", params, self.cancel_token).json()
 
                 if response.get('response', {}).get('status') != 'NOT_FOUND':
                     items = response.get('response', {}).get('result', {}).get('items', [])
@@ -245,16 +486,220 @@ class SearchWorker(QThread):
                             'type': 'road'
                         })
 
-            self.finished.emit(results)
+            # 새 검색으로 대체된 경우 결과를 보내지 않음
+            if not self.is_cancelled:
+                self.finished.emit(results)
 
         except Exception as e:
             logger.error(f"검색 오류: {e}")
-            self.error.emit(str(e))
+            if not self.is_cancelled:
+                self.error.emit(str(e))
+
+
+class WfsCatalogWorker(ScheduledWorker):
+    """
+        WFS 레이어 목록 로드 워커
+    """
+
+    layers_loaded = pyqtSignal(list)  # 일부 레이어 목록 (순차 전달)
+    progress = pyqtSignal(int)  # 지금까지 불러온 레이어 수
+    finished = pyqtSignal(list)
+    error = pyqtSignal(str)
+
+    def __init__(self, force_refresh: bool = False, batch_size: int = WFS_CATALOG_BATCH_SIZE):
+        super().__init__()
+        self.force_refresh = force_refresh
+        self.batch_size = batch_size
+
+    def run(self):
+        try:
+            loaded = 0
+
+            # 다운로드 중 파싱된 레이어부터 나눠 보내 위젯이 조금씩 채우도록 함
+            def on_batch(batch: List[Dict]):
+                nonlocal loaded
+                self.cancel_token.raise_if_cancelled("요청이 취소되었습니다.")
+                loaded += len(batch)
+                self.layers_loaded.emit(batch)
+                self.progress.emit(loaded)
+
+            layers = WfsCatalog().get_layers(self.force_refresh, on_batch, self.batch_size)
+
+            if not self.is_cancelled:
+                self.finished.emit(layers)
+
+        except Exception as e:
+            logger.error(f"WFS 레이어 목록 로드 오류: {e}")
+            if not self.is_cancelled:
+                self.error.emit(str(e))
+
+
+class WfsDownloadWorker(ScheduledWorker):
+    """
+        WFS 피처 페이지 단위 다운로드 워커
+    """
+
+    features_ready = pyqtSignal(list)  # 페이지 단위 QgsFeature 목록
+    tile_done = pyqtSignal(object)  # 빠짐없이 받은 타일 범위 (xmin, ymin, xmax, ymax)
+    progress = pyqtSignal(int)  # 전체 건수를 알 때만 전달 (0~100)
+    status = pyqtSignal(str)
+    finished = pyqtSignal(int)  # 받은 피처 수
+    error = pyqtSignal(str)
+
+    priority = TASK_PRIORITY_BACKGROUND
+
+    def __init__(
+            self,
+            typename: str,
+            crs: str,
+            bbox: Optional[str] = None,
+            page_size: int = WFS_PAGE_SIZE,
+            grid_size: int = 0,
+            extents: Optional[List[Extent]] = None
+    ):
+        """
+            grid_size: 0이면 페이지 단위 순차 다운로드, 1 이상이면 bbox를 격자로 나눠 병렬 다운로드
+            extents: 주어지면 bbox 대신 이 범위들을 병렬 다운로드 (타일마다 tile_done 전달)
+        """
+        super().__init__()
+        self.typename = typename
+        self.crs = crs
+        self.bbox = bbox
+        self.page_size = page_size
+        self.grid_size = grid_size
+        self.extents = extents
+
+    def run(self):
+        try:
+            downloader = WfsDownloader(page_size=self.page_size)
+            tiled = bool(self.extents) or (self.grid_size > 0 and self.bbox)
+            total = None if tiled else downloader.count_features(self.typename, self.crs, self.bbox)
+            downloaded = 0
+
+            self.status.emit(f"다운로드 시작: {self.typename}")
+
+            if self.extents:
+                pages = downloader.iter_extents(
+                    self.typename, self.crs, self.extents,
+                    cancel_token=self.cancel_token,
+                    on_tile_done=self.tile_done.emit
+                )
+            elif tiled:
+                pages = downloader.iter_tiles(
+                    self.typename, self.crs, WfsDownloader.parse_bbox(self.bbox),
+                    self.grid_size, cancel_token=self.cancel_token
+                )
+            else:
+                pages = downloader.iter_pages(self.typename, self.crs, self.bbox, self.cancel_token)
+
+            for features in pages:
+                if self.is_cancelled:
+                    break
+
+                downloaded += len(features)
+                self.features_ready.emit(features)
+
+                if tiled:
+                    # 분할로 타일 수가 늘어나면 진행률이 잠시 줄어들 수 있음
+                    self.progress.emit(int(downloader.tiles_done / downloader.tile_count * 100))
+                    self.status.emit(
+                        f"다운로드 중: {downloaded}건 (타일 {downloader.tiles_done}/{downloader.tile_count})"
+                    )
+                elif total:
+                    self.progress.emit(min(100, int(downloaded / total * 100)))
+                    self.status.emit(f"다운로드 중: {downloaded}/{total}건")
+                else:
+                    self.status.emit(f"다운로드 중: {downloaded}건")
+
+            if self.is_cancelled:
+                self.status.emit(f"다운로드 취소됨 ({downloaded}건 저장)")
+                return
+
+            if downloader.tiles_failed:
+                self.status.emit(f"다운로드 완료: {downloaded}건 (실패한 타일 {downloader.tiles_failed}개)")
+            else:
+                self.status.emit(f"다운로드 완료: {downloaded}건")
+            self.finished.emit(downloaded)
+
+        except OperationCancelledError:
+            self.status.emit(f"다운로드 취소됨: {self.typename}")
+        except Exception as e:
+            logger.error(f"WFS 다운로드 오류 ({self.typename}): {e}")
+            if not self.is_cancelled:
+                self.error.emit(str(e))
 
 
-class FileProcessWorker(QThread):
+class WfsMirrorWorker(ScheduledWorker):
+    """
+        로컬 저장소(GeoPackage)에 없는 범위만 받는 워커
+            저장소 파일은 화면의 저장소 레이어와 공유하므로 받은 피처와 타일은
+            시그널로 넘기고 저장/범위 기록은 메인 스레드(MirrorLayerLoader)에서 처리
+    """
+
+    features_ready = pyqtSignal(list)  # 저장할 QgsFeature 목록
+    tile_done = pyqtSignal(object)  # 빠짐없이 받은 타일 범위 (앞서 전달한 피처를 저장한 뒤 기록)
+    progress = pyqtSignal(int)
+    status = pyqtSignal(str)
+    finished = pyqtSignal(int)  # 받은 피처 수
+    error = pyqtSignal(str)
+
+    priority = TASK_PRIORITY_BACKGROUND
+
+    def __init__(self, typename: str, crs: str, extents: List[Extent]):
+        super().__init__()
+        self.typename = typename
+        self.crs = crs
+        self.extents = extents
+
+    def run(self):
+        try:
+            downloader = WfsDownloader()
+            downloaded = 0
+
+            self.status.emit(f"로컬 저장소 갱신 시작: {self.typename} ({len(self.extents)}개 범위)")
+
+            # 같은 스레드에서 보낸 시그널은 순서대로 처리되므로 타일의 피처가 저장된 뒤에 범위가 기록됨
+            # (취소 시 기록되지 않은 범위는 다음에 이어서 받음)
+            pages = downloader.iter_extents(
+                self.typename, self.crs, self.extents,
+                cancel_token=self.cancel_token,
+                on_tile_done=self.tile_done.emit
+            )
+
+            for features in pages:
+                if self.is_cancelled:
+                    break
+
+                downloaded += len(features)
+                self.features_ready.emit(features)
+                self.progress.emit(int(downloader.tiles_done / downloader.tile_count * 100))
+                self.status.emit(f"받는 중: {downloaded}건 (타일 {downloader.tiles_done}/{downloader.tile_count})")
+
+            if self.is_cancelled:
+                self.status.emit(f"로컬 저장 취소됨 ({downloaded}건 받음)")
+                return
+
+            if downloader.tiles_failed:
+                # 실패한 타일은 받은 범위로 기록되지 않았으므로 다음 요청 때 다시 받음
+                self.status.emit(f"로컬 저장 완료: {downloaded}건 (실패한 타일 {downloader.tiles_failed}개)")
+            else:
+                self.status.emit(f"로컬 저장 완료: {downloaded}건")
+            self.finished.emit(downloaded)
+
+        except OperationCancelledError:
+            self.status.emit(f"로컬 저장 취소됨: {self.typename}")
+        except Exception as e:
+            logger.error(f"WFS 로컬 저장 오류 ({self.typename}): {e}")
+            if not self.is_cancelled:
+                self.error.emit(str(e))
+
+
+class FileProcessWorker(ScheduledWorker):
     """
         파일 처리 전용 워커
+            process_func(file_path, progress_callback[, cancel_token])
+                - 취소 후 progress_callback을 호출하면 OperationCancelledError로 중단
+                - cancellable=True면 cancel_token도 전달
     """
 
     finished = pyqtSignal(object)
@@ -262,11 +707,13 @@ class FileProcessWorker(QThread):
     status = pyqtSignal(str)
     error = pyqtSignal(str)
 
-    def __init__(self, file_path: str, process_func: Callable):
+    priority = TASK_PRIORITY_BACKGROUND
+
+    def __init__(self, file_path: str, process_func: Callable, cancellable: bool = False):
         super().__init__()
         self.file_path = file_path
         self.process_func = process_func
-        self._is_cancelled = False
+        self.cancellable = cancellable
 
     def run(self):
         try:
@@ -274,80 +721,96 @@ class FileProcessWorker(QThread):
 
             # 진행률 콜백 함수
             def progress_callback(value: int, message: str = ""):
-                if not self._is_cancelled:
-                    self.progress.emit(value)
-                    if message:
-                        self.status.emit(message)
+                self.cancel_token.raise_if_cancelled()
+                self.progress.emit(value)
+                if message:
+                    self.status.emit(message)
 
             # 파일 처리
-            result = self.process_func(
-                self.file_path,
-                progress_callback=progress_callback
-            )
+            kwargs = {'progress_callback': progress_callback}
+            if self.cancellable:
+                kwargs['cancel_token'] = self.cancel_token
+
+            result = self.process_func(self.file_path, **kwargs)
 
-            if not self._is_cancelled:
+            if not self.is_cancelled:
                 self.finished.emit(result)
                 self.status.emit("파일 처리 완료")
 
+        except OperationCancelledError:
+            logger.info(f"파일 처리 취소됨: {self.file_path}")
         except Exception as e:
             logger.error(f"파일 처리 오류: {e}")
             self.error.emit(str(e))
             self.status.emit("파일 처리 실패")
 
     def cancel(self):
-        self._is_cancelled = True
+        super().cancel()
         self.status.emit("작업 취소됨")
 
 
-class BatchWorker(QThread):
+class BatchWorker(ScheduledWorker):
     """
         배치 작업 전용 워커
+            cancellable: True면 process_func(item, cancel_token=...)으로 호출
     """
 
     finished = pyqtSignal()
     progress = pyqtSignal(int)
     status = pyqtSignal(str)
     error = pyqtSignal(str)
-    item_completed = pyqtSignal(int, object)  # index, result
+    items_completed = pyqtSignal(list)  # [(index, result), ...], 진행률과 같은 간격으로 모아서 전달
 
-    def __init__(self, items: List[Any], process_func: Callable):
+    priority = TASK_PRIORITY_BACKGROUND
+
+    def __init__(self, items: List[Any], process_func: Callable, cancellable: bool = False):
         super().__init__()
         self.items = items
         self.process_func = process_func
-        self._is_cancelled = False
+        self.cancellable = cancellable
         self.results = []
 
     def run(self):
         total = len(self.items)
         self.status.emit(f"총 {total}개 항목 처리 시작...")
+        throttler = ProgressThrottler(total, self.progress.emit, self.status.emit)
+        completed = []
 
         for idx, item in enumerate(self.items):
-            if self._is_cancelled:
+            if self.is_cancelled:
                 break
 
             try:
                 # 아이템 처리
-                self.status.emit(f"처리 중: {idx + 1}/{total}")
-                result = self.process_func(item)
+                if self.cancellable:
+                    result = self.process_func(item, cancel_token=self.cancel_token)
+                else:
+                    result = self.process_func(item)
                 self.results.append(result)
+                completed.append((idx, result))
 
-                # 아이템 완료 시그널
-                self.item_completed.emit(idx, result)
-
-                # 진행률 업데이트
-                progress = int((idx + 1) / total * 100)
-                self.progress.emit(progress)
-
+            except OperationCancelledError:
+                break
             except Exception as e:
                 logger.error(f"항목 {idx + 1} 처리 오류: {e}")
                 self.error.emit(f"항목 {idx + 1} 처리 실패: {str(e)}")
 
-        if not self._is_cancelled:
+            # 진행률과 완료 항목은 일정 간격으로만 전달
+            if throttler.update(idx + 1, "처리 중") and completed:
+                self.items_completed.emit(completed)
+                completed = []
+
+        # 취소된 경우에도 처리가 끝난 항목은 전달
+        if completed:
+            self.items_completed.emit(completed)
+
+        if not self.is_cancelled:
+            throttler.flush()
             self.finished.emit()
             self.status.emit("배치 작업 완료")
 
     def cancel(self):
-        self._is_cancelled = True
+        super().cancel()
         self.status.emit("작업 취소됨")
 
     def get_results(self) -> List[Any]:
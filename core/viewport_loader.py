@@ -0,0 +1,267 @@
+from qgis.core import (
+    QgsProject, QgsRectangle, QgsFeatureRequest, QgsCoordinateReferenceSystem, QgsCoordinateTransform
+)
+from qgis.gui import QgsMapCanvas
+from PyQt5.QtCore import QObject, QTimer
+from typing import List, Optional, Set
+import logging
+
+from ..constants import (
+    WFS_VIEWPORT_DEBOUNCE_MS, WFS_VIEWPORT_BUFFER, WFS_VIEWPORT_MIN_SCALE,
+    WFS_VIEWPORT_MAX_FEATURES, WFS_VIEWPORT_MERGE_RATIO
+)
+from ..exceptions import TaskSchedulerError
+from .layer_manager import FeatureLayerWriter
+from .thread_workers import WfsDownloadWorker
+from .wfs_downloader import WfsDownloader, FEATURE_ID_FIELD
+from .extent_utils import Extent, area, subtract_extent, merge_extents, intersects
+
+logger = logging.getLogger(__name__)
+
+
+class ViewportLoader(QObject):
+    """
+        지도 화면 이동에 따라 필요한 범위의 WFS 피처만 불러오는 로더
+            - 화면 이동이 멈춘 뒤 한 번만 요청 (디바운스)
+            - 이미 받은 범위는 메모리 레이어에서 바로 표시하고 나머지 범위만 합쳐서 요청
+            - 화면을 벗어난 진행 중 요청은 취소
+    """
+
+    _active: List['ViewportLoader'] = []
+
+    def __init__(
+            self,
+            canvas: QgsMapCanvas,
+            layer_id: str,
+            typename: str,
+            crs: Optional[str] = None,
+            parent: Optional[QObject] = None
+    ):
+        super().__init__(parent)
+        self.canvas = canvas
+        self.typename = typename
+        self.crs = crs or canvas.mapSettings().destinationCrs().authid()
+        self.writer = FeatureLayerWriter(layer_id, typename, self.crs)
+
+        # 받은 범위와 받은 피처 fid (메모리 공간 캐시)
+        self._coverage: List[Extent] = []
+        self._ids: Set = set()
+
+        self._worker: Optional[WfsDownloadWorker] = None
+        self._worker_extents: List[Extent] = []
+        self._worker_view: Optional[Extent] = None  # 요청 당시 화면 범위
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(WFS_VIEWPORT_DEBOUNCE_MS)
+        self._timer.timeout.connect(self._load_visible)
+
+        self.canvas.extentsChanged.connect(self._timer.start)
+        QgsProject.instance().layerWillBeRemoved.connect(self._on_layer_removed)
+
+        ViewportLoader._active.append(self)
+        self._timer.start()
+
+        logger.info(f"화면 범위 불러오기 시작: {typename}")
+
+    @property
+    def layer(self):
+        return self.writer.layer
+
+    @classmethod
+    def stop_all(cls):
+        """
+            모든 로더 중지 (플러그인 언로드 시)
+        """
+        for loader in list(cls._active):
+            loader.stop()
+
+    def stop(self):
+        """
+            화면 추적 중지 및 진행 중 요청 취소 (불러온 레이어는 남음)
+        """
+        self._timer.stop()
+        self._cancel_worker()
+
+        try:
+            self.canvas.extentsChanged.disconnect(self._timer.start)
+            QgsProject.instance().layerWillBeRemoved.disconnect(self._on_layer_removed)
+        except TypeError:
+            pass
+
+        if self in ViewportLoader._active:
+            ViewportLoader._active.remove(self)
+
+        logger.info(f"화면 범위 불러오기 중지: {self.typename}")
+
+    def _on_layer_removed(self, layer_id: str):
+        if self.layer is not None and layer_id == self.layer.id():
+            self.stop()
+
+    def _visible_extent(self) -> Extent:
+        """
+            여유 범위를 더한 현재 화면 범위 (로더 좌표계 기준)
+        """
+        extent = self.canvas.extent()
+        canvas_crs = self.canvas.mapSettings().destinationCrs()
+
+        if canvas_crs.authid() != self.crs:
+            transform = QgsCoordinateTransform(
+                canvas_crs, QgsCoordinateReferenceSystem(self.crs), QgsProject.instance()
+            )
+            extent = transform.transformBoundingBox(extent)
+
+        dx = extent.width() * WFS_VIEWPORT_BUFFER
+        dy = extent.height() * WFS_VIEWPORT_BUFFER
+        return (extent.xMinimum() - dx, extent.yMinimum() - dy, extent.xMaximum() + dx, extent.yMaximum() + dy)
+
+    def _load_visible(self):
+        """
+            화면 범위 중 받지 않은 부분 요청
+        """
+        running = self._worker is not None and self._worker.isRunning()
+
+        if self.canvas.scale() > WFS_VIEWPORT_MIN_SCALE:
+            self._cancel_worker()
+            return
+
+        view = self._visible_extent()
+
+        # 화면을 벗어난 진행 중 요청은 더 이상 필요 없음
+        if running and not any(intersects(extent, view) for extent in self._worker_extents):
+            self._cancel_worker()
+            running = False
+
+        self._evict(view)
+
+        pieces = [view]
+        for covered in self._coverage + (self._worker_extents if running else []):
+            pieces = [piece for remaining in pieces for piece in subtract_extent(remaining, covered)]
+            if not pieces:
+                return
+
+        min_area = area(view) * 1e-4
+        pieces = merge_extents([piece for piece in pieces if area(piece) > min_area], WFS_VIEWPORT_MERGE_RATIO)
+        if not pieces:
+            return
+
+        # 요청은 한 번에 하나씩, 진행 중이면 끝난 뒤 남은 범위를 다시 계산
+        if running:
+            return
+
+        self._start_worker(pieces, view)
+
+    def _start_worker(self, extents: List[Extent], view: Extent):
+        worker = WfsDownloadWorker(self.typename, self.crs, extents=extents)
+        worker.features_ready.connect(self._on_features_ready)
+        worker.tile_done.connect(self._on_tile_done)
+        worker.finished.connect(self._on_worker_done)
+        worker.error.connect(self._on_worker_error)
+
+        try:
+            worker.start()
+        except TaskSchedulerError as e:
+            # 대기 작업이 많으면 이번 요청은 건너뛰고 다음 화면 이동 때 다시 계산
+            logger.warning(f"화면 범위 요청 보류 ({self.typename}): {e}")
+            return
+
+        self._worker = worker
+        self._worker_extents = extents
+        self._worker_view = view
+        logger.debug(f"화면 범위 요청: {self.typename} ({len(extents)}개 범위)")
+
+    def _cancel_worker(self):
+        if self._worker is not None and self._worker.isRunning():
+            self._worker.cancel()
+        self._worker = None
+        self._worker_extents = []
+        self._worker_view = None
+
+    def _on_features_ready(self, features: list):
+        """
+            이미 받은 피처(범위 경계에 걸친 피처)를 제외하고 레이어에 추가
+        """
+        # 취소된 이전 워커가 남겨 둔 시그널은 무시
+        if self.sender() is not self._worker:
+            return
+
+        new_features = []
+        for feature in features:
+            key = WfsDownloader.feature_key(feature)
+            if key is None:
+                new_features.append(feature)
+            elif key not in self._ids:
+                self._ids.add(key)
+                new_features.append(feature)
+
+        self.writer.write(new_features)
+
+    def _on_tile_done(self, tile: Extent):
+        """
+            받은 범위 기록 (새 범위에 포함되는 이전 기록은 정리)
+        """
+        if self.sender() is not self._worker:
+            return
+
+        self._coverage = [
+            covered for covered in self._coverage
+            if not (covered[0] >= tile[0] and covered[1] >= tile[1] and covered[2] <= tile[2] and covered[3] <= tile[3])
+        ]
+        self._coverage.append(tile)
+
+    def _on_worker_done(self, *args):
+        if self.sender() is not self._worker:
+            return
+
+        view = self._worker_view
+        self._worker = None
+        self._worker_extents = []
+        self._worker_view = None
+
+        # 요청 중 화면이 움직였으면 남은 범위 확인
+        # (화면이 그대로면 다시 요청하지 않음, 실패한 타일은 다음 화면 이동 때 재시도)
+        if self._visible_extent() != view:
+            self._timer.start()
+
+    def _on_worker_error(self, message: str):
+        # 바로 다시 요청하지 않고 다음 화면 이동 때 재시도
+        logger.warning(f"화면 범위 불러오기 실패 ({self.typename}): {message}")
+        if self.sender() is self._worker:
+            self._worker = None
+            self._worker_extents = []
+            self._worker_view = None
+
+    def _evict(self, view: Extent):
+        """
+            피처가 너무 많으면 화면 밖 피처와 받은 범위 기록을 정리
+        """
+        layer = self.layer
+        if layer is None or layer.featureCount() <= WFS_VIEWPORT_MAX_FEATURES:
+            return
+
+        request = QgsFeatureRequest().setFilterRect(QgsRectangle(*view))
+        if layer.fields().indexOf(FEATURE_ID_FIELD) >= 0:
+            request.setSubsetOfAttributes([FEATURE_ID_FIELD], layer.fields())
+        else:
+            request.setNoAttributes()
+
+        keep_fids = set()
+        keep_ids = set()
+        for feature in layer.getFeatures(request):
+            keep_fids.add(feature.id())
+            key = WfsDownloader.feature_key(feature)
+            if key is not None:
+                keep_ids.add(key)
+
+        remove = [fid for fid in layer.allFeatureIds() if fid not in keep_fids]
+        layer.dataProvider().deleteFeatures(remove)
+        layer.triggerRepaint()
+
+        # 화면 안에 걸친 피처는 남아 있으므로 받은 범위를 화면으로 잘라서 유지
+        self._coverage = [
+            (max(c[0], view[0]), max(c[1], view[1]), min(c[2], view[2]), min(c[3], view[3]))
+            for c in self._coverage if intersects(c, view)
+        ]
+        self._ids = keep_ids
+
+        logger.info(f"화면 밖 피처 {len(remove)}개 정리: {self.typename}")
@@ -0,0 +1,233 @@
+from typing import Dict, Any, List, Optional, Callable, Iterator, BinaryIO
+import io
+import threading
+import xml.etree.ElementTree as ET
+import logging
+
+from ..constants import WFS_CAPABILITIES_CACHE_KEY, WFS_CAPABILITIES_CACHE_TTL, WFS_CATALOG_BATCH_SIZE
+from ..utils import ApiClient
+from ..exceptions import ApiError
+from .cache_manager import CacheManager, CACHE_STALE, CACHE_MISS
+
+logger = logging.getLogger(__name__)
+
+_CRS_TAGS = ('DefaultSRS', 'OtherSRS', 'SRS', 'DefaultCRS', 'OtherCRS')
+
+# 인증키 오류, 사용량 초과 등은 HTTP 200과 함께 예외 문서로 응답
+_EXCEPTION_ROOTS = ('ServiceExceptionReport', 'ExceptionReport')
+
+
+def _local_name(tag: str) -> str:
+    """
+        네임스페이스를 제외한 태그 이름
+    """
+    return tag.rsplit('}', 1)[-1]
+
+
+class WfsCatalog:
+    """
+        WFS 레이어 목록 (디스크 캐시 + 세션 내 메모리 보관)
+    """
+
+    _layers: Optional[List[Dict[str, Any]]] = None
+    _lock = threading.Lock()
+
+    def __init__(self, api_client: Optional[ApiClient] = None):
+        self.api_client = api_client or ApiClient()
+        self.cache = CacheManager.shared()
+
+    @classmethod
+    def get_session_layers(cls) -> Optional[List[Dict[str, Any]]]:
+        """
+            이번 세션에 이미 불러온 목록 (없으면 None)
+        """
+        with cls._lock:
+            return cls._layers
+
+    @classmethod
+    def _remember(cls, layers: List[Dict[str, Any]]):
+        with cls._lock:
+            cls._layers = layers
+
+    def get_layers(
+            self,
+            force_refresh: bool = False,
+            on_batch: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+            batch_size: int = WFS_CATALOG_BATCH_SIZE
+    ) -> List[Dict[str, Any]]:
+        """
+            레이어 목록 반환
+                - 세션 메모리 -> 디스크 캐시 -> 네트워크 순
+                - 만료된 캐시는 바로 사용하고 백그라운드에서 ETag/Last-Modified로 재검증
+                on_batch: 레이어를 batch_size개씩 전달받는 콜백 (네트워크 조회 시 다운로드 도중 호출)
+        """
+        if not force_refresh:
+            layers = self.get_session_layers()
+            if layers is not None:
+                self._emit_batches(layers, on_batch, batch_size)
+                return layers
+
+        entry, status = self.cache.get_with_status(WFS_CAPABILITIES_CACHE_KEY)
+
+        # 이전 버전에서 저장된 빈 목록은 사용하지 않음
+        if entry is not None and not entry.get('layers'):
+            entry, status = None, CACHE_MISS
+
+        if status == CACHE_STALE and not force_refresh:
+            self.cache.refresh_in_background(
+                WFS_CAPABILITIES_CACHE_KEY,
+                lambda: self._revalidate(entry),
+                ttl=WFS_CAPABILITIES_CACHE_TTL
+            )
+            self._emit_batches(entry['layers'], on_batch, batch_size)
+        elif status == CACHE_MISS or force_refresh:
+            entry = self._revalidate(entry, on_batch, batch_size)
+            self.cache.set(WFS_CAPABILITIES_CACHE_KEY, entry, WFS_CAPABILITIES_CACHE_TTL)
+        else:
+            self._emit_batches(entry['layers'], on_batch, batch_size)
+
+        self._remember(entry['layers'])
+        logger.info(f"WFS 레이어 목록 {len(entry['layers'])}개 ({status})")
+        return entry['layers']
+
+    def _revalidate(
+            self,
+            entry: Optional[Dict[str, Any]],
+            on_batch: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+            batch_size: int = WFS_CATALOG_BATCH_SIZE
+    ) -> Dict[str, Any]:
+        """
+            조건부 요청으로 목록 갱신, 변경이 없으면(304) 기존 목록 유지
+                예외 문서나 빈 목록을 받으면 ApiError (캐시에 저장되지 않고 기존 목록 유지)
+        """
+        etag = entry.get('etag') if entry else None
+        last_modified = entry.get('last_modified') if entry else None
+
+        response = self.api_client.fetch_wfs_capabilities(etag, last_modified, stream=True)
+
+        try:
+            if response.status_code == 304 and entry:
+                logger.info("WFS Capabilities 변경 없음 (304)")
+                new_entry = dict(entry)
+                self._emit_batches(new_entry['layers'], on_batch, batch_size)
+            else:
+                # 다운로드와 동시에 파싱하며 batch_size개씩 전달
+                layers = []
+                batch = []
+                response.raw.decode_content = True
+
+                for layer in self.iter_feature_types(response.raw):
+                    layers.append(layer)
+                    batch.append(layer)
+                    if on_batch and len(batch) >= batch_size:
+                        on_batch(batch)
+                        batch = []
+
+                if on_batch and batch:
+                    on_batch(batch)
+
+                if not layers:
+                    raise ApiError("WFS 레이어 목록이 비어 있습니다.")
+
+                new_entry = {
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                    'layers': layers
+                }
+        finally:
+            response.close()
+
+        self._remember(new_entry['layers'])
+        return new_entry
+
+    @staticmethod
+    def _emit_batches(
+            layers: List[Dict[str, Any]],
+            on_batch: Optional[Callable[[List[Dict[str, Any]]], None]],
+            batch_size: int
+    ):
+        if not on_batch:
+            return
+
+        for start in range(0, len(layers), batch_size):
+            on_batch(layers[start:start + batch_size])
+
+    @classmethod
+    def iter_feature_types(cls, source: BinaryIO) -> Iterator[Dict[str, Any]]:
+        """
+            Capabilities XML 스트림에서 FeatureType을 하나씩 추출
+                - 전체 DOM을 만들지 않고, 처리한 요소는 부모에서 제거해 메모리 해제
+                - 예외 문서(ServiceExceptionReport)면 ApiError
+        """
+        parents = []
+        root = None
+
+        for event, elem in ET.iterparse(source, events=('start', 'end')):
+            if event == 'start':
+                if root is None:
+                    root = _local_name(elem.tag)
+                parents.append(elem)
+                continue
+
+            parents.pop()
+
+            if root in _EXCEPTION_ROOTS:
+                if not parents:
+                    message = ' '.join(text.strip() for text in elem.itertext() if text.strip())
+                    raise ApiError(f"WFS 요청 오류: {message or root}")
+                continue
+
+            if _local_name(elem.tag) != 'FeatureType':
+                continue
+
+            layer = cls.parse_feature_type(elem)
+            elem.clear()
+            if parents:
+                parents[-1].remove(elem)
+
+            if layer:
+                yield layer
+
+    @classmethod
+    def parse_capabilities(cls, content: bytes) -> List[Dict[str, Any]]:
+        """
+            Capabilities XML에서 레이어 목록 추출
+        """
+        return list(cls.iter_feature_types(io.BytesIO(content)))
+
+    @staticmethod
+    def parse_feature_type(elem: ET.Element) -> Optional[Dict[str, Any]]:
+        """
+            FeatureType 요소 -> {'name', 'title', 'bbox', 'crs'}
+        """
+        name = None
+        title = None
+        bbox = None
+        crs_list = []
+
+        for child in elem:
+            tag = _local_name(child.tag)
+            text = (child.text or '').strip()
+
+            if tag == 'Name':
+                name = text
+            elif tag == 'Title':
+                title = text
+            elif tag in _CRS_TAGS and text:
+                crs_list.append(text)
+            elif tag == 'LatLongBoundingBox':
+                try:
+                    bbox = [float(child.get(k)) for k in ('minx', 'miny', 'maxx', 'maxy')]
+                except (TypeError, ValueError):
+                    pass
+            elif tag == 'WGS84BoundingBox':
+                corners = {_local_name(c.tag): (c.text or '').split() for c in child}
+                try:
+                    bbox = [float(v) for v in corners['LowerCorner'] + corners['UpperCorner']]
+                except (KeyError, ValueError):
+                    pass
+
+        if not name or not title:
+            return None
+
+        return {'name': name, 'title': title, 'bbox': bbox, 'crs': crs_list}
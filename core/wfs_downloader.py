@@ -0,0 +1,414 @@
+from qgis.core import QgsVectorLayer, QgsFeature, QgsRectangle
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from contextlib import nullcontext
+from collections import deque
+from typing import List, Optional, Iterator, Tuple, Callable, Union
+import os
+import tempfile
+import xml.etree.ElementTree as ET
+import logging
+
+from ..constants import (
+    WFS_PAGE_SIZE, WFS_TILE_GRID_SIZE, WFS_TILE_MAX_WORKERS, WFS_TILE_MAX_DEPTH,
+    WFS_GML_OUTPUT, WFS_JSON_OUTPUT, WFS_DOWNLOAD_OUTPUT, WFS_JSON_CHUNK_SIZE, WFS_JSON_BATCH_SIZE
+)
+from ..exceptions import ApiError, OperationCancelledError
+from ..utils import ApiClient, CancellationToken
+from .geojson_stream import iter_geojson_features, GeoJsonFeatureConverter
+from .extent_utils import Extent
+
+logger = logging.getLogger(__name__)
+
+# GML 2.1.2 응답의 fid 속성을 OGR이 옮겨 담는 필드 (GeoJSON의 id도 같은 필드에 저장)
+FEATURE_ID_FIELD = 'fid'
+
+
+class WfsDownloader:
+    """
+        WFS GetFeature 페이지 단위 다운로드 (startindex + maxfeatures)
+            - GeoJSON 출력은 응답을 받는 도중 피처 단위로 디코딩해 작은 묶음으로 반환
+            - 서버가 JSON 대신 GML을 돌려주면 이후 요청은 GML로 전환
+    """
+
+    def __init__(
+            self,
+            api_client: Optional[ApiClient] = None,
+            page_size: int = WFS_PAGE_SIZE,
+            output_format: str = WFS_DOWNLOAD_OUTPUT
+    ):
+        self.api_client = api_client or ApiClient()
+        self.page_size = page_size
+        self.output_format = output_format
+
+        # 타일 진행 현황 (분할되면 tile_count가 늘어남)
+        self.tile_count = 0
+        self.tiles_done = 0
+        self.tiles_failed = 0
+
+    def count_features(self, typename: str, crs: str, bbox: Optional[str] = None) -> Optional[int]:
+        """
+            전체 피처 수 조회 (resultType=hits, 서버가 지원하지 않으면 None)
+        """
+        try:
+            response = self.api_client.get_wfs_features(typename, crs, bbox, count=0, result_type='hits')
+            root = ET.fromstring(response.content)
+            value = root.get('numberOfFeatures') or root.get('numberMatched')
+            return int(value) if value and value.isdigit() else None
+        except (ApiError, ET.ParseError, ValueError) as e:
+            logger.debug(f"WFS 피처 수 조회 실패 ({typename}): {e}")
+            return None
+
+    def fetch_page(
+            self,
+            typename: str,
+            crs: str,
+            bbox: Optional[str] = None,
+            start_index: int = 0,
+            count: Optional[int] = None,
+            cancel_token: Optional[CancellationToken] = None
+    ) -> List[QgsFeature]:
+        """
+            한 페이지 다운로드 후 피처 목록으로 변환
+        """
+        features = []
+        for batch in self.iter_page_batches(typename, crs, bbox, start_index, count, cancel_token):
+            features.extend(batch)
+        return features
+
+    def iter_page_batches(
+            self,
+            typename: str,
+            crs: str,
+            bbox: Optional[str] = None,
+            start_index: int = 0,
+            count: Optional[int] = None,
+            cancel_token: Optional[CancellationToken] = None
+    ) -> Iterator[List[QgsFeature]]:
+        """
+            한 페이지를 받으면서 피처 묶음 단위로 반환 (GML은 페이지 전체가 한 묶음)
+        """
+        if self.output_format != WFS_JSON_OUTPUT:
+            response = self.api_client.get_wfs_features(
+                typename, crs, bbox,
+                start_index=start_index,
+                count=count or self.page_size,
+                output_format=self.output_format,
+                cancel_token=cancel_token
+            )
+            yield self.parse_gml(response.content)
+            return
+
+        response = self.api_client.get_wfs_features(
+            typename, crs, bbox,
+            start_index=start_index,
+            count=count or self.page_size,
+            output_format=WFS_JSON_OUTPUT,
+            cancel_token=cancel_token,
+            stream=True
+        )
+
+        # 취소되면 응답을 닫아 본문 읽기 대기도 바로 끝냄
+        cancel_scope = (
+            cancel_token.on_cancel(lambda: ApiClient.abort_response(response))
+            if cancel_token is not None else nullcontext()
+        )
+
+        with cancel_scope:
+            yield from self._iter_json_batches(response, typename, cancel_token)
+
+    def _iter_json_batches(
+            self,
+            response,
+            typename: str,
+            cancel_token: Optional[CancellationToken]
+    ) -> Iterator[List[QgsFeature]]:
+        """
+            GeoJSON 스트림 응답을 피처 묶음으로 변환 (끝나면 응답을 닫음)
+        """
+        try:
+            chunks = response.iter_content(WFS_JSON_CHUNK_SIZE)
+            first = next(chunks, b'')
+
+            # JSON 출력을 지원하지 않아 GML(또는 XML 오류)로 응답한 경우
+            if first.lstrip()[:1] == b'<':
+                logger.info(f"WFS JSON 출력 미지원, GML로 전환: {typename}")
+                self.output_format = WFS_GML_OUTPUT
+                yield self.parse_gml(first + b''.join(chunks))
+                return
+
+            converter = GeoJsonFeatureConverter(FEATURE_ID_FIELD)
+            batch = []
+
+            for data in iter_geojson_features(self._chain(first, chunks)):
+                # 취소되면 남은 응답은 읽지 않고 연결을 닫음 (덜 받은 페이지를 끝난 것으로 보지 않도록 예외)
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled("요청이 취소되었습니다.")
+
+                batch.append(converter.to_feature(data))
+                if len(batch) >= WFS_JSON_BATCH_SIZE:
+                    yield batch
+                    batch = []
+
+            if batch:
+                yield batch
+        except Exception:
+            # 취소로 응답이 닫혀 읽기가 실패한 경우
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled("요청이 취소되었습니다.")
+            raise
+        finally:
+            response.close()
+
+    @staticmethod
+    def _chain(first: bytes, chunks: Iterator[bytes]) -> Iterator[bytes]:
+        yield first
+        yield from chunks
+
+    def iter_pages(
+            self,
+            typename: str,
+            crs: str,
+            bbox: Optional[str] = None,
+            cancel_token: Optional[CancellationToken] = None
+    ) -> Iterator[List[QgsFeature]]:
+        """
+            마지막 페이지까지 순서대로 피처 목록 반환
+        """
+        start_index = 0
+        seen = set()
+
+        while cancel_token is None or not cancel_token.is_cancelled:
+            received = 0
+            repeated = 0
+
+            for features in self.iter_page_batches(typename, crs, bbox, start_index, self.page_size, cancel_token):
+                received += len(features)
+
+                new_features = self._drop_seen(features, seen)
+                repeated += len(features) - len(new_features)
+
+                if new_features:
+                    yield new_features
+
+            # 서버가 startindex를 무시하면 같은 페이지가 반복되므로 중단
+            if received and repeated == received:
+                logger.warning(f"WFS 페이지가 반복되어 다운로드를 중단합니다: {typename} (startindex={start_index})")
+                return
+
+            if received < self.page_size:
+                return
+
+            start_index += received
+
+    def iter_tiles(
+            self,
+            typename: str,
+            crs: str,
+            extent: Extent,
+            grid_size: int = WFS_TILE_GRID_SIZE,
+            max_workers: int = WFS_TILE_MAX_WORKERS,
+            max_depth: int = WFS_TILE_MAX_DEPTH,
+            cancel_token: Optional[CancellationToken] = None
+    ) -> Iterator[List[QgsFeature]]:
+        """
+            범위를 격자로 나눠 동시에 받고 타일 단위로 피처 목록 반환
+        """
+        return self.iter_extents(
+            typename, crs, self.split_extent(extent, grid_size),
+            max_workers, max_depth, cancel_token
+        )
+
+    def iter_extents(
+            self,
+            typename: str,
+            crs: str,
+            extents: List[Extent],
+            max_workers: int = WFS_TILE_MAX_WORKERS,
+            max_depth: int = WFS_TILE_MAX_DEPTH,
+            cancel_token: Optional[CancellationToken] = None,
+            on_tile_done: Optional[Callable[[Extent], None]] = None,
+            on_tile_error: Optional[Callable[[Extent, Exception], None]] = None
+    ) -> Iterator[List[QgsFeature]]:
+        """
+            여러 범위를 동시에 받고 타일 단위로 피처 목록 반환
+                - 타일 경계에 걸친 피처는 fid로 한 번만 반환
+                - 결과가 서버 상한(page_size)에 닿은 타일은 4분할해 다시 요청
+                - max_depth 단계의 타일은 페이지 단위로 끝까지 받음
+                - 실패한 타일은 건너뛰고 나머지 타일은 계속 받음 (tiles_failed)
+                on_tile_done: 타일 하나를 빠짐없이 받아 반환까지 마친 뒤 호출
+                on_tile_error: 타일 요청이 실패하면 (타일, 오류)로 호출
+        """
+        pending = deque((tile, 0) for tile in extents)
+        running = {}
+        seen = set()
+        self.tile_count = len(pending)
+        self.tiles_done = 0
+        self.tiles_failed = 0
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        try:
+            while pending or running:
+                while pending and len(running) < max_workers:
+                    if cancel_token is not None and cancel_token.is_cancelled:
+                        return
+                    tile, depth = pending.popleft()
+                    future = executor.submit(self._fetch_tile, typename, crs, tile, depth >= max_depth, cancel_token)
+                    running[future] = (tile, depth)
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    tile, depth = running.pop(future)
+                    self.tiles_done += 1
+
+                    try:
+                        features, truncated = future.result()
+                    except OperationCancelledError:
+                        raise
+                    except Exception as e:
+                        # 실패한 타일은 받은 범위로 기록하지 않음 (다음 요청 때 다시 받음)
+                        self.tiles_failed += 1
+                        logger.warning(f"WFS 타일 다운로드 실패 ({typename}, {tile}): {e}")
+                        if on_tile_error:
+                            on_tile_error(tile, e)
+                        continue
+
+                    if truncated:
+                        subtiles = self.split_extent(tile, 2)
+                        pending.extend((subtile, depth + 1) for subtile in subtiles)
+                        self.tile_count += len(subtiles)
+                        logger.debug(f"WFS 타일 분할 (단계 {depth + 1}): {tile}")
+
+                    # 잘린 타일의 피처도 먼저 반환 (하위 타일과의 중복은 제거됨)
+                    new_features = self._drop_seen(features, seen)
+
+                    if new_features:
+                        yield new_features
+
+                    if not truncated and on_tile_done:
+                        on_tile_done(tile)
+        finally:
+            for future in running:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _fetch_tile(
+            self,
+            typename: str,
+            crs: str,
+            tile: Extent,
+            exhaustive: bool,
+            cancel_token: Optional[CancellationToken]
+    ) -> Tuple[List[QgsFeature], bool]:
+        """
+            타일 하나 요청, (피처 목록, 서버 상한 도달 여부) 반환
+        """
+        bbox = self.format_bbox(tile, crs)
+
+        if exhaustive:
+            features = []
+            for page in self.iter_pages(typename, crs, bbox, cancel_token):
+                features.extend(page)
+            return features, False
+
+        features = self.fetch_page(typename, crs, bbox, 0, self.page_size, cancel_token)
+        return features, len(features) >= self.page_size
+
+    @staticmethod
+    def split_extent(extent: Extent, grid_size: int) -> List[Extent]:
+        """
+            범위를 grid_size x grid_size 타일로 분할
+        """
+        xmin, ymin, xmax, ymax = extent
+        width = (xmax - xmin) / grid_size
+        height = (ymax - ymin) / grid_size
+
+        return [
+            (
+                xmin + col * width,
+                ymin + row * height,
+                xmax if col == grid_size - 1 else xmin + (col + 1) * width,
+                ymax if row == grid_size - 1 else ymin + (row + 1) * height
+            )
+            for row in range(grid_size)
+            for col in range(grid_size)
+        ]
+
+    @staticmethod
+    def to_extent(rect: QgsRectangle) -> Extent:
+        """
+            QgsRectangle -> (xmin, ymin, xmax, ymax)
+        """
+        return rect.xMinimum(), rect.yMinimum(), rect.xMaximum(), rect.yMaximum()
+
+    @classmethod
+    def format_bbox(cls, extent: Union[Extent, QgsRectangle], crs: str) -> str:
+        """
+            WFS bbox 파라미터 문자열 생성
+        """
+        if isinstance(extent, QgsRectangle):
+            extent = cls.to_extent(extent)
+        return "{},{},{},{},{}".format(*extent, crs)
+
+    @staticmethod
+    def parse_bbox(bbox: str) -> Extent:
+        """
+            "minx,miny,maxx,maxy[,crs]" -> (minx, miny, maxx, maxy)
+        """
+        parts = bbox.split(',')
+        return tuple(float(value) for value in parts[:4])
+
+    @staticmethod
+    def feature_key(feature: QgsFeature) -> Optional[str]:
+        """
+            페이지/타일 사이 중복 판정용 식별자 (서버가 준 fid, 없으면 None)
+                OGR 피처 ID는 응답마다 새로 매겨지므로 식별자로 쓰지 않음
+        """
+        if feature.fields().indexOf(FEATURE_ID_FIELD) >= 0:
+            value = feature[FEATURE_ID_FIELD]
+            if value:
+                return str(value)
+        return None
+
+    @classmethod
+    def _drop_seen(cls, features: List[QgsFeature], seen: set) -> List[QgsFeature]:
+        """
+            이미 받은 식별자의 피처 제외 (식별자가 없는 피처는 중복 판정 없이 유지)
+        """
+        new_features = []
+        for feature in features:
+            key = cls.feature_key(feature)
+            if key is None:
+                new_features.append(feature)
+            elif key not in seen:
+                seen.add(key)
+                new_features.append(feature)
+        return new_features
+
+    @staticmethod
+    def parse_gml(content: bytes) -> List[QgsFeature]:
+        """
+            GML 응답을 피처 목록으로 변환 (임시 파일 + OGR)
+        """
+        head = content[:2048]
+        if b'ExceptionReport' in head or b'ServiceException' in head:
+            raise ApiError(f"WFS 요청 오류: {content[:500].decode('utf-8', 'replace')}")
+
+        with tempfile.TemporaryDirectory(prefix='vworld_wfs_') as temp_dir:
+            path = os.path.join(temp_dir, 'page.gml')
+            with open(path, 'wb') as f:
+                f.write(content)
+
+            layer = QgsVectorLayer(path, 'page', 'ogr')
+
+            # 결과가 없는 FeatureCollection은 OGR이 레이어로 열지 못함
+            if not layer.isValid():
+                return []
+
+            features = [QgsFeature(feature) for feature in layer.getFeatures()]
+
+            # 임시 폴더 삭제 전 파일 핸들 해제
+            del layer
+
+        return features
@@ -0,0 +1,323 @@
+from qgis.core import (
+    QgsVectorLayer, QgsVectorFileWriter, QgsFeature, QgsWkbTypes,
+    QgsCoordinateReferenceSystem, QgsCoordinateTransformContext
+)
+from contextlib import contextmanager
+from typing import List, Optional, Tuple, Iterator
+import os
+import re
+import sqlite3
+import threading
+import time
+import logging
+
+from ..constants import (
+    WFS_MIRROR_DIR, WFS_COVERAGE_DB_NAME, WFS_MIRROR_MAX_AGE, WFS_MIRROR_FID_COLUMN, CACHE_QUERY_CHUNK_SIZE
+)
+from ..exceptions import LayerError
+from ..utils import FileManager
+from .wfs_downloader import FEATURE_ID_FIELD
+from .extent_utils import Extent, area, subtract_extent
+from .feature_utils import append_features, merge_fields
+
+logger = logging.getLogger(__name__)
+
+# 정확한 범위는 coverage에, 공간 검색은 R*Tree(coverage_index)로 처리
+_COVERAGE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS coverage (
+    id INTEGER PRIMARY KEY,
+    typename TEXT NOT NULL,
+    crs TEXT NOT NULL,
+    xmin REAL NOT NULL,
+    ymin REAL NOT NULL,
+    xmax REAL NOT NULL,
+    ymax REAL NOT NULL,
+    fetched_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_coverage_layer ON coverage(typename, crs);
+CREATE VIRTUAL TABLE IF NOT EXISTS coverage_index USING rtree(id, xmin, xmax, ymin, ymax);
+"""
+
+_COVERAGE_VERSION = 2
+
+_COVERAGE_QUERY = """
+SELECT c.id, c.xmin, c.ymin, c.xmax, c.ymax, c.fetched_at
+FROM coverage_index i JOIN coverage c ON c.id = i.id
+WHERE c.typename = ? AND c.crs = ?
+  AND i.xmin <= ? AND i.xmax >= ? AND i.ymin <= ? AND i.ymax >= ?
+"""
+
+
+@contextmanager
+def _sqlite(path: str) -> Iterator[sqlite3.Connection]:
+    """
+        트랜잭션 후 연결까지 닫음 (Windows에서 파일 삭제가 막히지 않도록)
+    """
+    conn = sqlite3.connect(path, timeout=30)
+    try:
+        with conn:
+            yield conn
+    finally:
+        conn.close()
+
+
+class WfsMirror:
+    """
+        다운로드한 WFS 피처의 로컬 GeoPackage 저장소
+            - typename/좌표계별 GeoPackage 파일 (GPKG 기본 R-tree 공간 색인 포함)
+            - 받은 범위와 시각은 coverage.db(R*Tree)에 기록해 받지 않았거나 오래된 범위만 요청
+    """
+
+    def __init__(self, mirror_dir: str = WFS_MIRROR_DIR):
+        self.mirror_dir = mirror_dir
+        self.coverage_path = os.path.join(mirror_dir, WFS_COVERAGE_DB_NAME)
+        self._lock = threading.RLock()
+
+        FileManager.ensure_directory(mirror_dir)
+
+        with _sqlite(self.coverage_path) as conn:
+            conn.executescript(_COVERAGE_SCHEMA)
+            self._upgrade_coverage(conn)
+
+    @staticmethod
+    def _upgrade_coverage(conn: sqlite3.Connection):
+        """
+            이전 형식(색인 없는 범위 기록)을 R*Tree 색인에 채움
+        """
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= _COVERAGE_VERSION:
+            return
+
+        conn.execute(
+            "INSERT OR REPLACE INTO coverage_index (id, xmin, xmax, ymin, ymax) "
+            "SELECT id, xmin, xmax, ymin, ymax FROM coverage"
+        )
+        conn.execute(f"PRAGMA user_version = {_COVERAGE_VERSION}")
+
+    @staticmethod
+    def table_name(typename: str, crs: str) -> str:
+        """
+            GeoPackage 레이어(테이블) 이름
+        """
+        return re.sub(r'[^0-9a-z_]+', '_', f"{typename}_{crs}".lower())
+
+    def get_path(self, typename: str, crs: str) -> str:
+        return os.path.join(self.mirror_dir, f"{self.table_name(typename, crs)}.gpkg")
+
+    def get_layer_uri(self, typename: str, crs: str) -> str:
+        """
+            QGIS ogr 공급자용 URI
+        """
+        return f"{self.get_path(typename, crs)}|layername={self.table_name(typename, crs)}"
+
+    def has_layer(self, typename: str, crs: str) -> bool:
+        """
+            저장소 존재 여부 (기본 키가 fid인 이전 형식은 GML2 fid 속성과 겹치므로 지우고 False)
+        """
+        path = self.get_path(typename, crs)
+        if not os.path.exists(path):
+            return False
+
+        with self._lock:
+            if self._has_current_layout(path, self.table_name(typename, crs)):
+                return True
+
+            logger.info(f"이전 형식의 로컬 저장소를 다시 받습니다: {path}")
+            self.clear(typename, crs)
+            return False
+
+    def add_coverage(self, typename: str, crs: str, extent: Extent, fetched_at: Optional[float] = None):
+        """
+            빠짐없이 받은 범위 기록
+                - 새 범위 안에 완전히 들어가는 이전 기록은 삭제해 색인을 작게 유지
+        """
+        fetched_at = fetched_at or time.time()
+        xmin, ymin, xmax, ymax = extent
+
+        with self._lock, _sqlite(self.coverage_path) as conn:
+            rows = conn.execute(_COVERAGE_QUERY, (typename, crs, xmax, xmin, ymax, ymin)).fetchall()
+            contained = [
+                (row[0],) for row in rows
+                if row[1] >= xmin and row[2] >= ymin and row[3] <= xmax and row[4] <= ymax
+            ]
+            if contained:
+                conn.executemany("DELETE FROM coverage WHERE id = ?", contained)
+                conn.executemany("DELETE FROM coverage_index WHERE id = ?", contained)
+
+            cursor = conn.execute(
+                "INSERT INTO coverage (typename, crs, xmin, ymin, xmax, ymax, fetched_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (typename, crs, xmin, ymin, xmax, ymax, fetched_at)
+            )
+            conn.execute(
+                "INSERT INTO coverage_index (id, xmin, xmax, ymin, ymax) VALUES (?, ?, ?, ?, ?)",
+                (cursor.lastrowid, xmin, xmax, ymin, ymax)
+            )
+
+    def get_coverage(
+            self,
+            typename: str,
+            crs: str,
+            extent: Optional[Extent] = None
+    ) -> List[Tuple[Extent, float]]:
+        """
+            받은 범위 목록 (extent를 주면 겹치는 범위만), [(범위, 받은 시각)]
+        """
+        with _sqlite(self.coverage_path) as conn:
+            if extent:
+                xmin, ymin, xmax, ymax = extent
+                rows = conn.execute(_COVERAGE_QUERY, (typename, crs, xmax, xmin, ymax, ymin)).fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT id, xmin, ymin, xmax, ymax, fetched_at FROM coverage WHERE typename = ? AND crs = ?",
+                    (typename, crs)
+                ).fetchall()
+
+        return [(tuple(row[1:5]), row[5]) for row in rows]
+
+    def missing_extents(
+            self,
+            typename: str,
+            crs: str,
+            extent: Extent,
+            max_age: Optional[float] = WFS_MIRROR_MAX_AGE
+    ) -> List[Extent]:
+        """
+            요청 범위 중 다시 받아야 하는 부분 (받은 적 없거나 max_age초보다 오래된 범위)
+        """
+        if not self.has_layer(typename, crs):
+            return [extent]
+
+        now = time.time()
+        pieces = [extent]
+
+        for covered, fetched_at in self.get_coverage(typename, crs, extent):
+            if max_age is not None and now - fetched_at > max_age:
+                continue
+
+            pieces = [piece for remaining in pieces for piece in subtract_extent(remaining, covered)]
+            if not pieces:
+                return []
+
+        # 부동소수점 오차로 생긴 아주 얇은 조각은 제외
+        min_area = area(extent) * 1e-6
+        return [piece for piece in pieces if area(piece) > min_area]
+
+    def clear(self, typename: str, crs: str):
+        """
+            저장된 피처와 범위 기록 삭제
+        """
+        with self._lock:
+            with _sqlite(self.coverage_path) as conn:
+                conn.execute(
+                    "DELETE FROM coverage_index WHERE id IN "
+                    "(SELECT id FROM coverage WHERE typename = ? AND crs = ?)",
+                    (typename, crs)
+                )
+                conn.execute("DELETE FROM coverage WHERE typename = ? AND crs = ?", (typename, crs))
+            FileManager.delete_file(self.get_path(typename, crs))
+
+    def write(self, typename: str, crs: str, features: List[QgsFeature]) -> int:
+        """
+            피처 저장 (같은 fid가 있으면 교체), 저장된 수 반환
+                화면에 올린 저장소 레이어와 같은 파일을 쓰므로 메인 스레드에서 호출
+        """
+        if not features:
+            return 0
+
+        with self._lock:
+            path = self.get_path(typename, crs)
+            table = self.table_name(typename, crs)
+
+            if not self.has_layer(typename, crs):
+                self._create_layer(path, table, crs, features)
+
+            layer = QgsVectorLayer(self.get_layer_uri(typename, crs), table, "ogr")
+            if not layer.isValid():
+                raise LayerError(f"로컬 저장소를 열 수 없습니다: {path}")
+
+            # 다시 받은 피처는 이전 버전을 지우고 새로 저장
+            existing = self._existing_fids(path, table, features)
+            if existing:
+                layer.dataProvider().deleteFeatures(existing)
+
+            count = append_features(layer, features)
+            del layer
+
+        return count
+
+    @staticmethod
+    def _create_layer(path: str, table: str, crs: str, features: List[QgsFeature]):
+        """
+            첫 묶음의 필드 구성으로 GeoPackage 레이어 생성
+        """
+        geometry_type = QgsWkbTypes.Unknown
+        for feature in features:
+            if feature.hasGeometry():
+                geometry_type = QgsWkbTypes.multiType(feature.geometry().wkbType())
+                break
+
+        fields = merge_fields(features)
+
+        options = QgsVectorFileWriter.SaveVectorOptions()
+        options.driverName = 'GPKG'
+        options.layerName = table
+        options.fileEncoding = 'UTF-8'
+        options.layerOptions = [f'FID={WFS_MIRROR_FID_COLUMN}']
+
+        writer = QgsVectorFileWriter.create(
+            path,
+            fields,
+            geometry_type,
+            QgsCoordinateReferenceSystem(crs),
+            QgsCoordinateTransformContext(),
+            options
+        )
+
+        if writer.hasError() != QgsVectorFileWriter.NoError:
+            message = writer.errorMessage()
+            del writer
+            raise LayerError(f"로컬 저장소 생성 실패: {message}")
+
+        del writer
+
+        # 중복 확인용 fid 색인
+        if fields.indexOf(FEATURE_ID_FIELD) >= 0:
+            with _sqlite(path) as conn:
+                conn.execute(
+                    f'CREATE INDEX IF NOT EXISTS "idx_{table}_{FEATURE_ID_FIELD}" '
+                    f'ON "{table}" ("{FEATURE_ID_FIELD}")'
+                )
+
+        logger.info(f"WFS 로컬 저장소 생성: {path}")
+
+    @staticmethod
+    def _has_current_layout(path: str, table: str) -> bool:
+        """
+            기본 키 컬럼이 WFS_MIRROR_FID_COLUMN인 저장소인지 확인
+        """
+        with _sqlite(path) as conn:
+            columns = conn.execute(f'PRAGMA table_info("{table}")').fetchall()
+        return any(column[1] == WFS_MIRROR_FID_COLUMN and column[5] for column in columns)
+
+    @staticmethod
+    def _existing_fids(path: str, table: str, features: List[QgsFeature]) -> List[int]:
+        """
+            이미 저장된 같은 fid 피처의 기본 키(QGIS 피처 ID) 목록
+        """
+        if features[0].fields().indexOf(FEATURE_ID_FIELD) < 0:
+            return []
+
+        ids = [feature[FEATURE_ID_FIELD] for feature in features]
+        fids = []
+
+        with _sqlite(path) as conn:
+            for start in range(0, len(ids), CACHE_QUERY_CHUNK_SIZE):
+                chunk = ids[start:start + CACHE_QUERY_CHUNK_SIZE]
+                placeholders = ','.join('?' * len(chunk))
+                rows = conn.execute(
+                    f'SELECT "{WFS_MIRROR_FID_COLUMN}" FROM "{table}" WHERE "{FEATURE_ID_FIELD}" IN ({placeholders})',
+                    chunk
+                )
+                fids.extend(row[0] for row in rows)
+
+        return fids
@@ -46,3 +46,13 @@ class NetworkError(VWorldError):
 class GeocodingError(VWorldError):
     """지오코딩 관련 예외"""
     pass
+
+
+class TaskSchedulerError(VWorldError):
+    """작업 스케줄러 관련 예외"""
+    pass
+
+
+class OperationCancelledError(VWorldError):
+    """작업 취소 예외"""
+    pass
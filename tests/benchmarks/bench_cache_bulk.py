@@ -0,0 +1,66 @@
+"""
+    CacheManager 일괄 조회/저장(get_many / set_many)과 키별 호출 비교
+
+    플러그인 상위 디렉토리에서 실행 (QGIS 파이썬 환경 필요):
+        python -m <플러그인 디렉토리>.tests.benchmarks.bench_cache_bulk [키 개수]
+"""
+import argparse
+import tempfile
+import time
+
+from ...core.cache_manager import CacheManager
+
+DEFAULT_KEYS = 100_000
+
+
+def _timed(label: str, func) -> float:
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<24} {elapsed:8.3f}s")
+    return elapsed
+
+
+def run(count: int = DEFAULT_KEYS):
+    """
+        키 count개를 키별 / 일괄 방식으로 저장하고 새 인스턴스에서 조회 (메모리 캐시 없이 DB 기준)
+    """
+    items = {f"geocode|bench|{i}": {'x': i * 0.5, 'y': i * 0.25, 'status': 'OK'} for i in range(count)}
+    keys = list(items)
+
+    print(f"키 {count}개")
+
+    with tempfile.TemporaryDirectory() as single_dir, tempfile.TemporaryDirectory() as bulk_dir:
+        cache = CacheManager(single_dir)
+
+        def set_each():
+            for key, value in items.items():
+                cache.set(key, value)
+            cache.flush()
+
+        set_single = _timed("set (키별)", set_each)
+        cache.close()
+
+        cache = CacheManager(bulk_dir)
+        set_bulk = _timed("set_many", lambda: cache.set_many(items))
+        cache.close()
+
+        cache = CacheManager(single_dir)
+        get_single = _timed("get (키별)", lambda: [cache.get(key) for key in keys])
+        cache.close()
+
+        cache = CacheManager(bulk_dir)
+        found = {}
+        get_bulk = _timed("get_many", lambda: found.update(cache.get_many(keys)))
+        cache.close()
+
+        if len(found) != count:
+            raise AssertionError(f"get_many 결과 누락: {len(found)}/{count}")
+
+    print(f"set 속도 향상: {set_single / set_bulk:.1f}배, get 속도 향상: {get_single / get_bulk:.1f}배")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('count', nargs='?', type=int, default=DEFAULT_KEYS)
+    run(parser.parse_args().count)
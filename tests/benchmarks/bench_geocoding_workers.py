@@ -0,0 +1,91 @@
+"""
+    동시 요청 수(1/2/4/8)에 따른 일괄 지오코딩 처리량 비교 (응답 지연이 고정된 로컬 서버 기준)
+
+    플러그인 상위 디렉토리에서 실행 (QGIS 파이썬 환경 필요):
+        python -m <플러그인 디렉토리>.tests.benchmarks.bench_geocoding_workers [주소 개수] [--delay 초] [--rate 초당 요청 수]
+"""
+import argparse
+import tempfile
+import time
+
+from ...constants import API_RATE_LIMIT, API_RATE_BURST
+from ...core.cache_manager import CacheManager
+from ...core.geocode_cache import GeocodeCache
+from ...core.thread_workers import GeocodingWorker
+from ...utils import ApiThrottle, SharedSession
+from ...utils.rate_limiter import TokenBucket
+from ..http_stub import StubServer
+
+DEFAULT_ADDRESSES = 400
+DEFAULT_DELAY = 0.05
+WORKER_COUNTS = (1, 2, 4, 8)
+
+
+def _measure(server: StubServer, cache_dir: str, addresses: list, max_workers: int) -> float:
+    """
+        주소 목록을 max_workers개 동시 요청으로 지오코딩, 초당 처리 건수 반환
+    """
+    worker = GeocodingWorker(addresses, 'EPSG:4326', max_workers=max_workers)
+    worker.api_client.api_key = 'bench-key'
+    worker.api_client.base_url = server.url
+    worker.cache = GeocodeCache(cache_dir)
+
+    delivered = []
+    errors = []
+    worker.finished.connect(delivered.append)
+    worker.error.connect(errors.append)
+
+    started = time.perf_counter()
+    worker.run()
+    elapsed = time.perf_counter() - started
+
+    if errors or delivered != [len(addresses)]:
+        raise AssertionError(f"지오코딩 실패: {errors or delivered}")
+
+    return len(addresses) / elapsed
+
+
+def run(count: int = DEFAULT_ADDRESSES, delay: float = DEFAULT_DELAY, rate: float = 0):
+    """
+        rate: 초당 요청 제한 (0이면 제한 없이 동시 요청 수에 따른 처리량만 측정)
+    """
+    server = StubServer(delay=delay).start()
+
+    # 실행마다 새 제한 상태에서 시작
+    ApiThrottle._instance = ApiThrottle()
+    if rate > 0:
+        ApiThrottle._instance.bucket = TokenBucket(rate, API_RATE_BURST)
+    else:
+        ApiThrottle._instance.bucket = TokenBucket(1e9, count)
+
+    print(f"주소 {count}개, 응답 지연 {delay * 1000:.0f}ms, 초당 요청 제한 {rate or '없음'}")
+
+    baseline = None
+    try:
+        for max_workers in WORKER_COUNTS:
+            with tempfile.TemporaryDirectory() as cache_dir:
+                # 캐시 적중 없이 모두 서버에 요청하도록 측정마다 다른 주소 사용
+                addresses = [f"벤치마크 주소 {max_workers}-{i}" for i in range(count)]
+                throughput = _measure(server, cache_dir, addresses, max_workers)
+                CacheManager.close_shared()
+
+            baseline = baseline or throughput
+            print(
+                f"동시 {max_workers}건  {throughput:8.1f}건/초  "
+                f"(1건 대비 {throughput / baseline:.1f}배, 이상적 {max_workers}배)"
+            )
+    finally:
+        server.stop()
+        SharedSession.close()
+
+    # 응답 지연 x 초당 제한보다 많이 동시에 보내면 처리량이 더 늘지 않음
+    print(f"기본 초당 요청 제한 {API_RATE_LIMIT}건에서는 약 {API_RATE_LIMIT:.0f}건/초가 상한")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('count', nargs='?', type=int, default=DEFAULT_ADDRESSES)
+    parser.add_argument('--delay', type=float, default=DEFAULT_DELAY, help="서버 응답 지연 (초)")
+    parser.add_argument('--rate', type=float, default=0, help="초당 요청 제한 (0: 제한 없음)")
+    args = parser.parse_args()
+    run(args.count, args.delay, args.rate)
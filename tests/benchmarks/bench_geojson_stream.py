@@ -0,0 +1,101 @@
+"""
+    같은 WFS 페이지를 GML(parse_gml)과 GeoJSON 스트림(_iter_json_batches)으로 변환할 때 비교 (시간, 최대 메모리)
+        tests/fixtures의 GetFeature 응답(lt_c_landinfobasemap 1000건, gzip)을 사용
+        (최대 메모리는 파이썬 할당 기준, OGR 내부 할당은 포함되지 않음)
+
+    플러그인 상위 디렉토리에서 실행 (QGIS 파이썬 환경 필요):
+        python -m <플러그인 디렉토리>.tests.benchmarks.bench_geojson_stream [반복 횟수]
+"""
+import argparse
+import gzip
+import os
+import time
+import tracemalloc
+from typing import Iterator, List
+
+from ...constants import WFS_JSON_OUTPUT, WFS_GML_OUTPUT
+from ...core.wfs_downloader import WfsDownloader
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'fixtures')
+GML_FIXTURE = 'wfs_landinfo_page.gml.gz'
+JSON_FIXTURE = 'wfs_landinfo_page.json.gz'
+TYPENAME = 'lt_c_landinfobasemap'
+DEFAULT_REPEAT = 5
+
+
+class _RecordedResponse:
+    """
+        저장된 응답 본문을 requests 스트림 응답처럼 돌려주는 객체
+    """
+
+    def __init__(self, content: bytes):
+        self.content = content
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+    def close(self):
+        pass
+
+
+def _load(name: str) -> bytes:
+    with gzip.open(os.path.join(FIXTURE_DIR, name), 'rb') as f:
+        return f.read()
+
+
+def _parse_gml(content: bytes) -> list:
+    return WfsDownloader.parse_gml(content)
+
+
+def _parse_json(content: bytes) -> list:
+    downloader = WfsDownloader(output_format=WFS_JSON_OUTPUT)
+    features = []
+    for batch in downloader._iter_json_batches(_RecordedResponse(content), TYPENAME, None):
+        features.extend(batch)
+    return features
+
+
+def _measure(label: str, parse, content: bytes, repeat: int) -> List:
+    """
+        repeat번 변환해 가장 빠른 시간과 최대 메모리 출력, 마지막 변환 결과 반환
+    """
+    best = None
+    features = []
+
+    for _ in range(repeat):
+        started = time.perf_counter()
+        features = parse(content)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+
+    tracemalloc.start()
+    parse(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"{label:<8} {best:8.3f}s  {len(features) / best:10.0f}건/초  "
+        f"최대 {peak / 1024 / 1024:6.1f}MB  (응답 {len(content) / 1024:.0f}KB, {len(features)}건)"
+    )
+    return features
+
+
+def run(repeat: int = DEFAULT_REPEAT):
+    gml = _load(GML_FIXTURE)
+    geojson = _load(JSON_FIXTURE)
+
+    print(f"{TYPENAME} 1페이지, 최선 {repeat}회 기준 ({WFS_GML_OUTPUT} / {WFS_JSON_OUTPUT})")
+    gml_features = _measure("GML", _parse_gml, gml, repeat)
+    json_features = _measure("GeoJSON", _parse_json, geojson, repeat)
+
+    gml_ids = {WfsDownloader.feature_key(feature) for feature in gml_features}
+    json_ids = {WfsDownloader.feature_key(feature) for feature in json_features}
+    if gml_ids != json_ids:
+        raise AssertionError(f"두 형식의 피처가 다릅니다: GML {len(gml_ids)}건, GeoJSON {len(json_ids)}건")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('repeat', nargs='?', type=int, default=DEFAULT_REPEAT)
+    run(parser.parse_args().repeat)
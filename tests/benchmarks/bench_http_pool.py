@@ -0,0 +1,69 @@
+"""
+    공유 keep-alive 세션(SharedSession)과 요청마다 새로 연결(requests.get)할 때의 지연 시간 비교
+
+    플러그인 상위 디렉토리에서 실행:
+        python -m <플러그인 디렉토리>.tests.benchmarks.bench_http_pool [요청 수]
+"""
+import argparse
+import statistics
+import time
+
+import requests
+
+from ...constants import API_TIMEOUT
+from ...utils import SharedSession
+from ..http_stub import StubServer
+
+DEFAULT_REQUESTS = 2000
+
+
+def _measure(label: str, server: StubServer, send, count: int) -> float:
+    """
+        요청 count개를 순서대로 보내고 요청당 평균 지연 시간(초) 반환
+    """
+    connections = server.connections
+    latencies = []
+
+    for _ in range(count):
+        started = time.perf_counter()
+        response = send()
+        response.content
+        latencies.append(time.perf_counter() - started)
+
+        if response.status_code != 200:
+            raise AssertionError(f"{label}: 응답 오류 {response.status_code}")
+
+    latencies.sort()
+    mean = statistics.mean(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(
+        f"{label:<24} 평균 {mean * 1000:7.3f}ms  p95 {p95 * 1000:7.3f}ms  "
+        f"연결 {server.connections - connections}개"
+    )
+    return mean
+
+
+def run(count: int = DEFAULT_REQUESTS):
+    server = StubServer().start()
+    url = f"{server.url}/ok"
+
+    def pooled():
+        with SharedSession.use() as session:
+            return session.get(url, timeout=API_TIMEOUT)
+
+    print(f"요청 {count}개")
+
+    try:
+        unpooled_mean = _measure("requests.get (매번 연결)", server, lambda: requests.get(url, timeout=API_TIMEOUT), count)
+        pooled_mean = _measure("SharedSession", server, pooled, count)
+    finally:
+        server.stop()
+        SharedSession.close()
+
+    print(f"요청당 지연 시간 감소: {unpooled_mean / pooled_mean:.1f}배")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('count', nargs='?', type=int, default=DEFAULT_REQUESTS)
+    run(parser.parse_args().count)
@@ -0,0 +1,102 @@
+"""
+    ProgressThrottler로 모아 보낼 때와 항목마다 시그널을 보낼 때 비교 (메인 스레드 이벤트 수, 처리 시간)
+
+    플러그인 상위 디렉토리에서 실행:
+        python -m <플러그인 디렉토리>.tests.benchmarks.bench_progress_throttler [항목 개수]
+"""
+import argparse
+import time
+
+from PyQt5.QtCore import QCoreApplication, QObject, QThread, pyqtSignal
+
+from ...utils import ProgressThrottler
+
+DEFAULT_ITEMS = 100_000
+
+
+class _Producer(QObject):
+    progress = pyqtSignal(int)
+    status = pyqtSignal(str)
+    items_completed = pyqtSignal(list)
+
+    def __init__(self, count: int, throttled: bool):
+        super().__init__()
+        self.count = count
+        self.throttled = throttled
+
+    def run(self):
+        if self.throttled:
+            throttler = ProgressThrottler(self.count, self.progress.emit, self.status.emit)
+            completed = []
+            for idx in range(self.count):
+                completed.append((idx, idx))
+                if throttler.update(idx + 1, "처리 중"):
+                    self.items_completed.emit(completed)
+                    completed = []
+            if completed:
+                self.items_completed.emit(completed)
+            throttler.flush()
+        else:
+            for idx in range(self.count):
+                self.items_completed.emit([(idx, idx)])
+                self.progress.emit(int((idx + 1) * 100 / self.count))
+                self.status.emit(f"처리 중 ({idx + 1}/{self.count}건)")
+
+
+class _Consumer(QObject):
+    """
+        메인 스레드에서 시그널을 받아 세는 쪽 (UI 대신)
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.events = 0
+        self.items = 0
+
+    def on_items(self, items: list):
+        self.events += 1
+        self.items += len(items)
+
+    def on_other(self, *args):
+        self.events += 1
+
+
+def _measure(app: QCoreApplication, count: int, throttled: bool) -> float:
+    producer = _Producer(count, throttled)
+    consumer = _Consumer()
+    thread = QThread()
+    producer.moveToThread(thread)
+
+    producer.items_completed.connect(consumer.on_items)
+    producer.progress.connect(consumer.on_other)
+    producer.status.connect(consumer.on_other)
+    thread.started.connect(producer.run)
+    thread.started.connect(thread.quit)
+
+    started = time.perf_counter()
+    thread.start()
+
+    # 생산이 끝나고 메인 스레드가 받은 시그널을 모두 처리할 때까지
+    while not thread.isFinished() or consumer.items < count:
+        app.processEvents()
+    elapsed = time.perf_counter() - started
+
+    thread.wait()
+    label = "throttled" if throttled else "per item"
+    print(f"{label:<10} {elapsed:8.3f}s  메인 스레드 이벤트 {consumer.events}개")
+    return elapsed
+
+
+def run(count: int = DEFAULT_ITEMS):
+    app = QCoreApplication.instance() or QCoreApplication([])
+    print(f"항목 {count}개")
+
+    per_item = _measure(app, count, throttled=False)
+    throttled = _measure(app, count, throttled=True)
+    print(f"속도 향상: {per_item / throttled:.1f}배")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('count', nargs='?', type=int, default=DEFAULT_ITEMS)
+    run(parser.parse_args().count)
@@ -0,0 +1,117 @@
+import select
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict
+from urllib.parse import urlsplit
+
+
+_GEOCODE_OK = b'{"response": {"status": "OK", "result": {"point": {"x": "127.0", "y": "37.5"}}}}'
+
+
+class StubServer:
+    """
+        테스트용 로컬 HTTP 서버
+            /ok                 즉시 200 응답
+            /req/address        delay초 뒤 지오코딩 성공(OK) 응답
+            /slow-body          헤더와 본문 일부만 보내고 클라이언트가 연결을 끊거나 stop()할 때까지 대기
+            /status/<코드>      해당 상태 코드 응답
+    """
+
+    def __init__(self, delay: float = 0.0):
+        """
+            delay: 지오코딩 응답 지연 시간(초), 실제 API 응답 시간 흉내
+        """
+        self.delay = delay
+        self.stopped = threading.Event()
+        self.hits: Dict[str, int] = {}
+        self.connections = 0  # 받은 TCP 연결 수
+        self.body_started = threading.Semaphore(0)  # /slow-body가 본문 일부를 보낼 때마다 release
+        self._hits_lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'StubServer':
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.stopped.set()
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _count(self, path: str):
+        with self._hits_lock:
+            self.hits[path] = self.hits.get(path, 0) + 1
+
+    def _count_connection(self):
+        with self._hits_lock:
+            self.connections += 1
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            # 헤더와 본문을 따로 보내므로 keep-alive 연결에서 Nagle 지연(약 40ms)이 생기지 않도록 끔
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                stub._count_connection()
+
+            def do_GET(self):
+                path = urlsplit(self.path).path
+                stub._count(path)
+
+                if path == '/ok':
+                    self._reply(200, b'{"response": {"status": "OK"}}')
+                elif path == '/req/address':
+                    if stub.delay:
+                        time.sleep(stub.delay)
+                    self._reply(200, _GEOCODE_OK)
+                elif path == '/slow-body':
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'application/json')
+                    self.send_header('Content-Length', str(1024 * 1024))
+                    self.end_headers()
+                    try:
+                        self.wfile.write(b'{"features": [')
+                        self.wfile.flush()
+                        stub.body_started.release()
+                        # 클라이언트가 연결을 닫거나 서버가 멈출 때까지 나머지를 보내지 않음
+                        self._wait_for_disconnect()
+                    except OSError:
+                        pass
+                    self.close_connection = True
+                elif path.startswith('/status/'):
+                    self._reply(int(path.rsplit('/', 1)[1]), b'error')
+                else:
+                    self._reply(404, b'not found')
+
+            def _wait_for_disconnect(self, timeout: float = 30):
+                deadline = time.monotonic() + timeout
+                while not stub.stopped.is_set() and time.monotonic() < deadline:
+                    readable, _, _ = select.select([self.connection], [], [], 0.05)
+                    if readable and not self.connection.recv(1, socket.MSG_PEEK):
+                        return
+
+            def _reply(self, status: int, body: bytes):
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
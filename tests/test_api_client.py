@@ -0,0 +1,177 @@
+import threading
+import time
+
+import pytest
+
+from ..exceptions import ApiError, OperationCancelledError
+from ..utils import ApiClient, ApiThrottle, CancellationToken, RetryPolicy, SharedSession
+from ..utils.rate_limiter import AdaptiveConcurrencyLimiter
+from .http_stub import StubServer
+
+# 취소가 읽기 제한 시간(API_TIMEOUT)을 기다리지 않고 반영되어야 하는 시간 (초)
+CANCEL_LATENCY = 2.0
+
+
+@pytest.fixture
+def server():
+    stub = StubServer().start()
+    yield stub
+    stub.stop()
+    SharedSession.close()
+
+
+@pytest.fixture
+def client(server):
+    client = ApiClient()
+    client.api_key = 'test-key'
+    client.base_url = server.url
+    return client
+
+
+def _cancel_later(token: CancellationToken, delay: float = 0.2) -> threading.Timer:
+    timer = threading.Timer(delay, token.cancel)
+    timer.start()
+    return timer
+
+
+def test_request_returns_response(client, server):
+    response = client.request('/ok')
+
+    assert response.status_code == 200
+    assert response.json()['response']['status'] == 'OK'
+    assert server.hits['/ok'] == 1
+
+
+def test_cancelled_before_send_does_not_hit_server(client, server):
+    token = CancellationToken()
+    token.cancel()
+
+    with pytest.raises(OperationCancelledError):
+        client.request('/ok', cancel_token=token)
+
+    assert '/ok' not in server.hits
+
+
+def test_cancel_interrupts_body_read(client):
+    token = CancellationToken()
+    _cancel_later(token)
+
+    started = time.monotonic()
+    with pytest.raises(OperationCancelledError):
+        client.request('/slow-body', cancel_token=token)
+
+    assert time.monotonic() - started < CANCEL_LATENCY
+
+
+def test_cancel_interrupts_streamed_read(client):
+    token = CancellationToken()
+    response = client.request('/slow-body', cancel_token=token, stream=True)
+
+    # 응답을 돌려받은 뒤에는 호출자가 취소 시 닫도록 등록
+    _cancel_later(token)
+    started = time.monotonic()
+
+    with token.on_cancel(lambda: ApiClient.abort_response(response)), pytest.raises(Exception):
+        for _ in response.iter_content(1024):
+            pass
+
+    assert token.is_cancelled
+    assert time.monotonic() - started < CANCEL_LATENCY
+
+
+def test_cancel_interrupts_retry_wait(client, server):
+    client.set_retry_policy('/status/503', RetryPolicy(max_attempts=5, backoff_base=10, jitter=0))
+    token = CancellationToken()
+    _cancel_later(token, 0.3)
+
+    started = time.monotonic()
+    with pytest.raises(OperationCancelledError):
+        client.request('/status/503', cancel_token=token)
+
+    assert time.monotonic() - started < CANCEL_LATENCY
+    assert server.hits['/status/503'] == 1
+
+
+def test_cancel_while_waiting_for_throttle_slot(client, server, monkeypatch):
+    throttle = ApiThrottle()
+    throttle.concurrency = AdaptiveConcurrencyLimiter(min_limit=1, max_limit=1)
+    monkeypatch.setattr(ApiThrottle, '_instance', throttle)
+
+    # 하나뿐인 슬롯을 읽기가 끝나지 않는 요청이 차지
+    holder = CancellationToken()
+
+    def hold():
+        try:
+            client.request('/slow-body', cancel_token=holder)
+        except OperationCancelledError:
+            pass
+
+    thread = threading.Thread(target=hold)
+    thread.start()
+    time.sleep(0.2)
+
+    token = CancellationToken()
+    _cancel_later(token)
+    started = time.monotonic()
+
+    with pytest.raises(OperationCancelledError):
+        client.request('/ok', cancel_token=token)
+
+    assert time.monotonic() - started < CANCEL_LATENCY
+    assert '/ok' not in server.hits
+
+    holder.cancel()
+    thread.join(CANCEL_LATENCY)
+    assert not thread.is_alive()
+    assert throttle.concurrency.get_stats()['in_flight'] == 0
+
+
+def test_streamed_response_holds_slot_until_closed(client, server, monkeypatch):
+    throttle = ApiThrottle()
+    monkeypatch.setattr(ApiThrottle, '_instance', throttle)
+
+    response = client.request('/ok', stream=True)
+
+    assert throttle.concurrency.get_stats()['in_flight'] == 1
+    assert SharedSession.in_flight() == 1
+
+    response.close()
+    response.close()
+
+    assert throttle.concurrency.get_stats()['in_flight'] == 0
+    assert SharedSession.in_flight() == 0
+
+
+def test_non_retryable_status_raises_api_error(client, server):
+    with pytest.raises(ApiError):
+        client.request('/status/404')
+
+    assert server.hits['/status/404'] == 1
+
+
+def test_many_cancelled_requests_release_throttle_and_session(client, server):
+    tokens = [CancellationToken() for _ in range(40)]
+    errors = []
+
+    def run(token):
+        try:
+            client.request('/slow-body', cancel_token=token)
+        except OperationCancelledError:
+            errors.append(token)
+
+    threads = [threading.Thread(target=run, args=(token,)) for token in tokens]
+    for thread in threads:
+        thread.start()
+
+    time.sleep(0.3)
+    for token in tokens:
+        token.cancel()
+    for thread in threads:
+        thread.join(CANCEL_LATENCY * 5)
+
+    assert not any(thread.is_alive() for thread in threads)
+    assert len(errors) == len(tokens)
+    assert SharedSession.in_flight() == 0
+
+    # 취소된 요청이 커넥션/동시 실행 슬롯을 붙잡고 있지 않아야 함
+    assert client.request('/ok').status_code == 200
@@ -0,0 +1,162 @@
+import threading
+import time
+
+import pytest
+
+from ..exceptions import OperationCancelledError
+from ..utils import ApiClient, ApiThrottle, CancellationToken, SharedSession
+from ..utils.rate_limiter import TokenBucket
+from .http_stub import StubServer
+
+# 연속 취소 반복 횟수 / 한 번의 취소가 반영되어야 하는 시간 (초)
+STRESS_ITERATIONS = 1000
+CANCEL_LATENCY = 2.0
+
+
+def test_callbacks_run_once_when_cancelled_concurrently():
+    tokens = [CancellationToken() for _ in range(5000)]
+    calls = [0] * len(tokens)
+    lock = threading.Lock()
+
+    def make_callback(idx):
+        def callback():
+            with lock:
+                calls[idx] += 1
+        return callback
+
+    for idx, token in enumerate(tokens):
+        token.register(make_callback(idx))
+
+    def cancel_all():
+        for token in tokens:
+            token.cancel()
+
+    threads = [threading.Thread(target=cancel_all) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(token.is_cancelled for token in tokens)
+    assert calls == [1] * len(tokens)
+
+
+def test_register_after_cancel_runs_immediately():
+    token = CancellationToken()
+    token.cancel()
+    called = []
+
+    assert token.register(lambda: called.append(True)) is None
+    assert called == [True]
+
+
+def test_on_cancel_unregisters_on_exit():
+    token = CancellationToken()
+    called = []
+
+    for _ in range(5000):
+        with token.on_cancel(lambda: called.append(True)):
+            pass
+
+    token.cancel()
+    assert called == []
+    assert not token._callbacks
+
+
+def test_callback_errors_do_not_stop_other_callbacks():
+    token = CancellationToken()
+    called = []
+
+    token.register(lambda: 1 / 0)
+    token.register(lambda: called.append(True))
+    token.cancel()
+
+    assert called == [True]
+
+
+def test_wait_and_raise():
+    token = CancellationToken()
+    assert token.wait(0.01) is False
+    token.raise_if_cancelled()
+
+    threading.Timer(0.05, token.cancel).start()
+    assert token.wait(5) is True
+
+    with pytest.raises(OperationCancelledError):
+        token.raise_if_cancelled()
+
+
+def _checked_out_connections() -> int:
+    """
+        공유 세션 커넥션 풀에서 빌려 간 상태인 연결 수
+    """
+    total = 0
+    # http/https에 같은 어댑터가 등록되어 있으므로 한 번씩만 셈
+    adapters = {id(adapter): adapter for adapter in SharedSession.get().adapters.values()}
+    for adapter in adapters.values():
+        for key in adapter.poolmanager.pools.keys():
+            pool = adapter.poolmanager.pools[key].pool
+            total += pool.maxsize - pool.qsize()
+    return total
+
+
+def _settle(condition, timeout: float = 5.0) -> bool:
+    """
+        서버 쪽 처리 스레드가 끝나는 등 비동기 정리를 기다림
+    """
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.05)
+    return True
+
+
+def test_repeated_cancel_mid_read_releases_threads_and_connections(monkeypatch):
+    # 초당 요청 제한 없이 취소만 반복 (동시 요청 한도는 그대로)
+    throttle = ApiThrottle()
+    throttle.bucket = TokenBucket(1e9, STRESS_ITERATIONS)
+    monkeypatch.setattr(ApiThrottle, '_instance', throttle)
+
+    server = StubServer().start()
+    client = ApiClient()
+    client.api_key = 'test-key'
+    client.base_url = server.url
+
+    try:
+        # 세션/풀 생성 후 기준값 측정
+        assert client.request('/ok').status_code == 200
+        baseline_threads = threading.active_count()
+
+        for _ in range(STRESS_ITERATIONS):
+            token = CancellationToken()
+            errors = []
+
+            def run():
+                try:
+                    client.request('/slow-body', cancel_token=token)
+                except OperationCancelledError as e:
+                    errors.append(e)
+
+            thread = threading.Thread(target=run)
+            thread.start()
+
+            # 본문 일부를 받은 뒤(읽기 대기 중) 취소
+            assert server.body_started.acquire(timeout=CANCEL_LATENCY)
+            token.cancel()
+            thread.join(CANCEL_LATENCY)
+
+            assert not thread.is_alive()
+            assert len(errors) == 1
+
+        assert server.hits['/slow-body'] == STRESS_ITERATIONS
+        assert SharedSession.in_flight() == 0
+        assert throttle.concurrency.get_stats()['in_flight'] == 0
+        assert _checked_out_connections() == 0
+        assert _settle(lambda: threading.active_count() <= baseline_threads), threading.active_count()
+
+        # 취소된 요청이 풀/동시 실행 슬롯을 붙잡고 있지 않아야 함
+        assert client.request('/ok').status_code == 200
+    finally:
+        server.stop()
+        SharedSession.close()
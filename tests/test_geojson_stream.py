@@ -0,0 +1,88 @@
+import json
+
+import pytest
+
+pytest.importorskip("qgis.core")
+
+from PyQt5.QtCore import QVariant  # noqa: E402
+
+from ..core.feature_utils import merge_fields  # noqa: E402
+from ..core.geojson_stream import iter_geojson_features, GeoJsonFeatureConverter  # noqa: E402
+from ..exceptions import ApiError  # noqa: E402
+
+
+def _chunks(text: str, size: int):
+    data = text.encode('utf-8')
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def _collection(count: int) -> dict:
+    return {
+        'type': 'FeatureCollection',
+        'features': [
+            {
+                'type': 'Feature',
+                'id': f'layer.{i}',
+                'properties': {'name': f'지번 {i}', 'flag': i % 2 == 0, 'value': -1.5e-3 * i, 'empty': None},
+                'geometry': {'type': 'Point', 'coordinates': [127.0 + i, 37.0]}
+            }
+            for i in range(count)
+        ]
+    }
+
+
+@pytest.mark.parametrize('size', [1, 3, 7, 997, 1 << 20])
+def test_decodes_across_chunk_boundaries(size):
+    collection = _collection(200)
+    text = json.dumps(collection, ensure_ascii=False)
+
+    assert list(iter_geojson_features(_chunks(text, size))) == collection['features']
+
+
+def test_empty_collection():
+    assert list(iter_geojson_features(_chunks('{"type":"FeatureCollection","features":[]}', 4))) == []
+
+
+def test_truncated_stream_raises():
+    text = '{"type":"FeatureCollection","features":[{"id":1},{"id":2'
+
+    with pytest.raises(ApiError):
+        list(iter_geojson_features(_chunks(text, 5)))
+
+
+def test_unclosed_array_raises():
+    with pytest.raises(ApiError):
+        list(iter_geojson_features(_chunks('{"features":[{"id":1}', 64)))
+
+
+@pytest.mark.parametrize('size', [4, 64])
+def test_malformed_feature_raises(size):
+    text = '{"features":[{"id":1},{garbage},{"id":2}]}'
+
+    with pytest.raises(ApiError):
+        list(iter_geojson_features(_chunks(text, size)))
+
+
+def test_missing_features_raises():
+    with pytest.raises(ApiError):
+        list(iter_geojson_features(_chunks('{"error":"bad request"}', 8)))
+
+
+def _field_types(fields) -> dict:
+    return {field.name(): field.type() for field in fields}
+
+
+def test_converter_widens_types_and_skips_null_only_fields():
+    converter = GeoJsonFeatureConverter('fid')
+    features = [
+        converter.to_feature({'id': 1, 'properties': {'area': 10, 'memo': None}}),
+        converter.to_feature({'id': 2, 'properties': {'area': 10.5, 'memo': None, 'name': '지번'}}),
+        converter.to_feature({'id': 3, 'properties': {'memo': 'note'}})
+    ]
+
+    types = _field_types(merge_fields(features))
+
+    assert list(types) == ['fid', 'area', 'name', 'memo']
+    assert types['area'] == QVariant.Double
+    assert types['memo'] == QVariant.String
+    assert features[1].attribute('area') == 10.5
@@ -0,0 +1,52 @@
+from ..utils import ProgressThrottler
+
+
+def _throttler(total, **kwargs):
+    progress, status = [], []
+    throttler = ProgressThrottler(total, progress.append, status.append, **kwargs)
+    return throttler, progress, status
+
+
+def test_emits_once_per_step_for_fast_updates():
+    throttler, progress, status = _throttler(100_000, interval=3600)
+
+    emitted = sum(throttler.update() for _ in range(100_000))
+
+    assert progress == list(range(0, 101))
+    assert emitted == len(status) == 101
+
+
+def test_last_update_is_always_emitted():
+    throttler, progress, status = _throttler(3, interval=3600, step=100)
+
+    assert throttler.update(message="첫 번째") is False
+    assert throttler.update() is False
+    assert throttler.update(message="마지막") is True
+
+    assert progress == [100]
+    assert status[-1].startswith("마지막 (3/3건")
+
+
+def test_flush_sends_pending_state():
+    throttler, progress, status = _throttler(10, interval=3600, step=100)
+
+    throttler.update(4, "처리 중")
+    throttler.flush()
+    throttler.flush()
+
+    assert progress == [40]
+    assert len(status) == 1
+
+
+def test_resumed_rows_are_not_counted_in_rate():
+    throttler, _, _ = _throttler(100, start=90)
+
+    assert throttler.percent == 90
+    assert throttler.rate == 0.0
+    assert throttler.eta is None
+
+
+def test_format_duration():
+    assert ProgressThrottler.format_duration(5) == "5초"
+    assert ProgressThrottler.format_duration(125) == "2분 5초"
+    assert ProgressThrottler.format_duration(3725) == "1시간 2분"
@@ -0,0 +1,95 @@
+import threading
+
+import pytest
+
+pytest.importorskip("qgis.core")
+
+from ..constants import TASK_PRIORITY_BACKGROUND, TASK_PRIORITY_INTERACTIVE  # noqa: E402
+from ..core.task_scheduler import TaskScheduler, ScheduledWorker  # noqa: E402
+from ..exceptions import TaskSchedulerError  # noqa: E402
+
+
+class BlockingWorker(ScheduledWorker):
+    """
+        취소되거나 release될 때까지 실행 상태로 남는 작업
+    """
+
+    def __init__(self, priority: int, started: threading.Semaphore, release: threading.Event):
+        super().__init__()
+        self.priority = priority
+        self.started = started
+        self.release = release
+        self.ran = False
+
+    def run(self):
+        self.ran = True
+        self.started.release()
+        while not self.release.is_set() and not self.cancel_token.wait(0.01):
+            pass
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = TaskScheduler(max_threads=4, max_queue=10000)
+    yield scheduler
+    scheduler.shutdown(timeout=5000)
+
+
+def _workers(count, priority, started, release):
+    return [BlockingWorker(priority, started, release) for _ in range(count)]
+
+
+def test_cancel_thousands_of_queued_jobs(scheduler):
+    started, release = threading.Semaphore(0), threading.Event()
+    workers = _workers(5000, TASK_PRIORITY_BACKGROUND, started, release)
+
+    for worker in workers:
+        worker.start(scheduler)
+
+    # 백그라운드 작업은 스레드 하나를 대화형 작업용으로 남기고 실행
+    for _ in range(scheduler.max_threads - 1):
+        assert started.acquire(timeout=5)
+
+    # 대기 중인 작업부터 취소해야 실행 중 작업이 끝나도 다음 작업이 시작되지 않음
+    for worker in reversed(workers):
+        worker.cancel()
+
+    assert all(worker.wait(5000) for worker in workers)
+    assert scheduler.pending_count() == 0
+    assert sum(worker.ran for worker in workers) == scheduler.max_threads - 1
+    assert scheduler.pool.waitForDone(5000)
+
+
+def test_interactive_job_runs_while_background_jobs_fill_the_pool(scheduler):
+    started, release = threading.Semaphore(0), threading.Event()
+    background = _workers(100, TASK_PRIORITY_BACKGROUND, started, release)
+    for worker in background:
+        worker.start(scheduler)
+
+    interactive_started = threading.Semaphore(0)
+    interactive = BlockingWorker(TASK_PRIORITY_INTERACTIVE, interactive_started, release)
+    interactive.start(scheduler)
+
+    assert interactive_started.acquire(timeout=5)
+
+    release.set()
+    assert all(worker.wait(10000) for worker in background + [interactive])
+
+
+def test_queue_limit_applies_to_background_jobs_only():
+    scheduler = TaskScheduler(max_threads=2, max_queue=3)
+    started, release = threading.Semaphore(0), threading.Event()
+
+    try:
+        for worker in _workers(4, TASK_PRIORITY_BACKGROUND, started, release):
+            worker.start(scheduler)
+
+        with pytest.raises(TaskSchedulerError):
+            BlockingWorker(TASK_PRIORITY_BACKGROUND, started, release).start(scheduler)
+
+        interactive = BlockingWorker(TASK_PRIORITY_INTERACTIVE, started, release)
+        interactive.start(scheduler)
+        assert interactive.isRunning()
+    finally:
+        release.set()
+        scheduler.shutdown(timeout=5000)
@@ -1,14 +1,26 @@
 from .config_manager import ConfigManager
+from .http_session import SharedSession
+from .rate_limiter import ApiThrottle
+from .retry_policy import RetryPolicy
+from .cancellation import CancellationToken
 from .api_client import ApiClient
 from .file_manager import FileManager
 from .validators import Validators
+from .search_index import SearchIndex
+from .progress_throttler import ProgressThrottler
 from .decorators import with_error_handling, with_loading_cursor, require_api_key
 
 __all__ = [
     'ConfigManager',
     'ApiClient',
+    'SharedSession',
+    'ApiThrottle',
+    'RetryPolicy',
+    'CancellationToken',
     'FileManager',
     'Validators',
+    'SearchIndex',
+    'ProgressThrottler',
     'with_error_handling',
     'with_loading_cursor',
     'require_api_key'
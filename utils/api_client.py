@@ -1,12 +1,22 @@
 import requests
+import socket
+import threading
+import time
 import xml.etree.ElementTree as ET
+from contextlib import ExitStack
 from typing import Dict, Any, Optional
 import logging
 
-from ..constants import API_BASE_URL, API_TIMEOUT, DEFAULT_SEARCH_SIZE
-from ..exceptions import ApiError, SSLError, AuthenticationError
+from ..constants import (
+    API_BASE_URL, API_TIMEOUT, DEFAULT_SEARCH_SIZE, API_OVERLOAD_STATUS_CODES, WFS_PAGE_SIZE, WFS_GML_OUTPUT
+)
+from ..exceptions import ApiError, SSLError, AuthenticationError, OperationCancelledError
 from ..config import API_KEY  # config.py에서 직접 가져오기
 from .config_manager import ConfigManager
+from .http_session import SharedSession
+from .rate_limiter import ApiThrottle
+from .retry_policy import RetryPolicy
+from .cancellation import CancellationToken
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +28,11 @@ class ApiClient:
         self.api_key = API_KEY if API_KEY else self.config.api_key
         self.base_url = self._get_base_url()
         self.timeout = API_TIMEOUT
+        self.retry_policies: Dict[str, RetryPolicy] = {}
+
+        # 재시도 횟수 (배치 단위 보고용)
+        self.retry_count = 0
+        self._stats_lock = threading.Lock()
 
     def _get_base_url(self) -> str:
         """
@@ -35,9 +50,20 @@ class ApiClient:
             'Accept': 'application/json'
         }
 
-    def request(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
+    def request(
+            self,
+            endpoint: str,
+            params: Optional[Dict[str, Any]] = None,
+            cancel_token: Optional[CancellationToken] = None,
+            headers: Optional[Dict[str, str]] = None,
+            stream: bool = False
+    ) -> requests.Response:
         """
-            API 요청
+            API 요청 (일시적 오류는 엔드포인트별 정책에 따라 재시도)
+                headers: 추가 요청 헤더 (조건부 요청 등)
+                stream: 본문을 미리 받지 않고 response.raw로 순차 읽기
+                        (취소 시 읽기를 멈추려면 with cancel_token.on_cancel(...) 안에서 읽고 abort_response로 닫음)
+                cancel_token: 취소되면 대기/전송 중인 요청을 중단하고 OperationCancelledError
         """
         if not self.api_key:
             raise AuthenticationError("API 키가 설정되지 않았습니다.")
@@ -49,27 +75,212 @@ class ApiClient:
 
         url = f"{self.base_url}{endpoint}"
         _, verify_ssl = self.config.protocol
+        policy = self.get_retry_policy(endpoint)
+        attempt = 1
+
+        while True:
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled("요청이 취소되었습니다.")
+
+            try:
+                return self._send(url, params, verify_ssl, headers, stream, cancel_token)
+
+            except requests.exceptions.SSLError as e:
+                logger.error(f"SSL 오류: {e}")
+                raise SSLError("SSL 인증 오류가 발생했습니다. 설정에서 프로토콜을 변경해주세요.")
+            except requests.exceptions.RequestException as e:
+                delay = self._get_retry_delay(policy, attempt, e)
+
+                if delay is None:
+                    logger.error(f"API 요청 실패: {e}")
+                    if isinstance(e, requests.exceptions.Timeout):
+                        raise ApiError("요청 시간이 초과되었습니다.")
+                    raise ApiError(f"API 요청 실패: {str(e)}")
+
+                logger.warning(f"API 요청 재시도 {attempt}/{policy.max_attempts - 1} ({delay:.1f}초 후): {e}")
+
+                # 대기 중 취소되면 즉시 중단
+                if cancel_token is not None:
+                    if cancel_token.wait(delay):
+                        raise OperationCancelledError("요청이 취소되었습니다.")
+                else:
+                    time.sleep(delay)
+
+                with self._stats_lock:
+                    self.retry_count += 1
+                attempt += 1
+
+    def _send(
+            self,
+            url: str,
+            params: Dict[str, Any],
+            verify_ssl: bool,
+            headers: Optional[Dict[str, str]] = None,
+            stream: bool = False,
+            cancel_token: Optional[CancellationToken] = None
+    ) -> requests.Response:
+        """
+            단일 HTTP 요청 (재시도마다 호출 제한을 다시 거침)
+                - 본문은 항상 스트림으로 받고, 취소되면 응답을 닫아 읽기를 중단
+                - 응답 헤더를 기다리는 동안의 취소는 읽기 제한 시간(timeout) 안에 반영
+                - 동시 요청 슬롯과 공유 세션은 본문을 다 읽을 때까지 사용
+                  (stream이면 호출자가 응답을 닫을 때 반환)
+        """
+        throttle = ApiThrottle.shared()
+        # 호출 제한 대기 중 취소되면 슬롯을 잡지 않고 바로 중단
+        throttle.acquire(cancel_token)
+        started = time.monotonic()
+        overloaded = False
+        response = None
+        handle = None
+
+        # 응답 지연 시간은 본문까지 받은 시점 기준으로 한도 조정에 반영
+        resources = ExitStack()
+        resources.callback(lambda: throttle.release(time.monotonic() - started, overloaded))
 
         try:
-            response = requests.get(
+            # 슬롯을 얻은 직후 취소된 경우
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled("요청이 취소되었습니다.")
+
+            # 워커/위젯이 모두 같은 커넥션 풀을 공유 (요청 중에는 세션이 닫히지 않음)
+            session = resources.enter_context(SharedSession.use())
+            response = session.get(
                 url,
                 params=params,
-                headers=self._get_headers(),
+                headers={**self._get_headers(), **(headers or {})},
                 timeout=self.timeout,
-                verify=verify_ssl
+                verify=verify_ssl,
+                stream=True
             )
 
+            if cancel_token is not None:
+                handle = cancel_token.register(lambda: self.abort_response(response))
+
+            overloaded = response.status_code in API_OVERLOAD_STATUS_CODES
+
+            if not stream:
+                # 본문 읽기 (취소 시 연결이 닫혀 예외 발생)
+                response.content
+
+            # 등록 전에 이미 취소되어 닫힌 응답은 빈 본문으로 읽히므로 다시 확인
+            self._raise_if_cancelled(cancel_token)
+
             response.raise_for_status()
+
+            if stream:
+                self._release_on_close(response, resources.pop_all())
+
             return response
 
-        except requests.exceptions.SSLError as e:
-            logger.error(f"SSL 오류: {e}")
-            raise SSLError("SSL 인증 오류가 발생했습니다. 설정에서 프로토콜을 변경해주세요.")
-        except requests.exceptions.Timeout:
-            raise ApiError("요청 시간이 초과되었습니다.")
-        except requests.exceptions.RequestException as e:
-            logger.error(f"API 요청 실패: {e}")
-            raise ApiError(f"API 요청 실패: {str(e)}")
+        except Exception as e:
+            if isinstance(e, (requests.exceptions.Timeout, requests.exceptions.ConnectionError)):
+                overloaded = True
+            if response is not None:
+                response.close()
+            self._raise_if_cancelled(cancel_token)
+            raise
+        finally:
+            if cancel_token is not None:
+                cancel_token.unregister(handle)
+            resources.close()
+
+    @staticmethod
+    def _release_on_close(response: requests.Response, resources: ExitStack):
+        """
+            스트림 응답을 닫을 때 동시 요청 슬롯과 세션 반환
+                (읽는 스레드와 취소 콜백이 동시에 닫아도 한 번만 반환)
+        """
+        close = response.close
+        lock = threading.Lock()
+
+        def close_and_release():
+            try:
+                close()
+            finally:
+                with lock:
+                    pending = resources.pop_all()
+                pending.close()
+
+        response.close = close_and_release
+
+    @staticmethod
+    def abort_response(response: requests.Response):
+        """
+            다른 스레드에서 읽는 중인 응답을 중단 (취소 콜백용)
+                close()만으로는 이미 소켓 읽기에서 대기 중인 스레드가 깨어나지 않으므로
+                소켓을 먼저 shutdown해 읽기를 바로 끝냄
+        """
+        connection = getattr(response.raw, 'connection', None)
+        sock = getattr(connection, 'sock', None)
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        response.close()
+
+    @staticmethod
+    def _raise_if_cancelled(cancel_token: Optional[CancellationToken]):
+        """
+            취소로 연결을 닫아 생긴 오류는 취소 예외로 변환
+        """
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled("요청이 취소되었습니다.")
+
+    @staticmethod
+    def _get_retry_delay(
+            policy: RetryPolicy,
+            attempt: int,
+            error: requests.exceptions.RequestException
+    ) -> Optional[float]:
+        """
+            재시도 대기 시간 반환 (재시도 대상이 아니면 None)
+        """
+        if attempt >= policy.max_attempts:
+            return None
+
+        if isinstance(error, (requests.exceptions.Timeout, requests.exceptions.ConnectionError)):
+            return policy.get_delay(attempt)
+
+        if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+            if not policy.is_retryable_status(error.response.status_code):
+                return None
+
+            retry_after = None
+            try:
+                retry_after = float(error.response.headers.get('Retry-After', ''))
+            except ValueError:
+                pass
+
+            return policy.get_delay(attempt, retry_after)
+
+        return None
+
+    def get_retry_policy(self, endpoint: str) -> RetryPolicy:
+        """
+            엔드포인트 재시도 정책 반환
+        """
+        if endpoint not in self.retry_policies:
+            self.retry_policies[endpoint] = RetryPolicy.for_endpoint(endpoint)
+        return self.retry_policies[endpoint]
+
+    def set_retry_policy(self, endpoint: str, policy: RetryPolicy):
+        """
+            엔드포인트 재시도 정책 설정
+        """
+        self.retry_policies[endpoint] = policy
+
+    def reset_retry_count(self):
+        with self._stats_lock:
+            self.retry_count = 0
+
+    @staticmethod
+    def get_throttle_stats() -> Dict[str, Any]:
+        """
+            호출 제한 대기 통계 반환
+        """
+        return ApiThrottle.shared().get_stats()
     """
     def search_address(self, query: str, crs: str = "EPSG:4326", search_type: str = "ADDRESS", size: int = DEFAULT_SEARCH_SIZE) -> Dict[str, Any]:
         
@@ -104,9 +315,16 @@ class ApiClient:
         response = self.request("/req/address", params)
         return response.json()
 
-    def geocode(self, address: str, crs: str = "EPSG:4326") -> Dict[str, Any]:
+    def geocode(
+            self,
+            address: str,
+            crs: str = "EPSG:4326",
+            cancel_token: Optional[CancellationToken] = None,
+            address_type: str = "road"
+    ) -> Dict[str, Any]:
         """
             지오코딩
+                address_type: road(도로명) / parcel(지번)
         """
         params = {
             "service": "address",
@@ -114,10 +332,10 @@ class ApiClient:
             "crs": crs,
             "address": address,
             "format": "json",
-            "type": "road"
+            "type": address_type
         }
 
-        response = self.request("/req/address", params)
+        response = self.request("/req/address", params, cancel_token)
         return response.json()
 
     def get_wfs_capabilities(self) -> ET.Element:
@@ -132,3 +350,63 @@ class ApiClient:
 
         response = self.request("/req/wfs", params)
         return ET.fromstring(response.content)
+
+    def fetch_wfs_capabilities(
+            self,
+            etag: Optional[str] = None,
+            last_modified: Optional[str] = None,
+            stream: bool = False
+    ) -> requests.Response:
+        """
+            WFS Capabilities 조건부 요청 (변경이 없으면 304 응답)
+                stream: 응답 본문을 순차 파싱할 경우 True (사용 후 close 필요)
+        """
+        params = {
+            "service": "WFS",
+            "request": "GetCapabilities",
+            "version": "1.1.0"
+        }
+
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+
+        return self.request("/req/wfs", params, headers=headers, stream=stream)
+
+    def get_wfs_features(
+            self,
+            typename: str,
+            crs: str,
+            bbox: Optional[str] = None,
+            start_index: int = 0,
+            count: int = WFS_PAGE_SIZE,
+            output_format: str = WFS_GML_OUTPUT,
+            result_type: Optional[str] = None,
+            cancel_token: Optional[CancellationToken] = None,
+            stream: bool = False
+    ) -> requests.Response:
+        """
+            WFS GetFeature 요청 (startindex/maxfeatures 페이지 단위)
+                bbox: "minx,miny,maxx,maxy,EPSG:xxxx"
+                result_type: 'hits'이면 피처 없이 전체 건수만 요청
+        """
+        params = {
+            "service": "WFS",
+            "request": "GetFeature",
+            "version": "1.1.0",
+            "typename": typename,
+            "srsname": crs,
+            "maxfeatures": str(count),
+            "startindex": str(start_index),
+            "output": output_format
+        }
+
+        if bbox:
+            params["bbox"] = bbox
+        if result_type:
+            params["resultType"] = result_type
+
+        return self.request("/req/wfs", params, cancel_token, stream=stream)
+
@@ -0,0 +1,88 @@
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional
+import logging
+
+from ..exceptions import OperationCancelledError
+
+logger = logging.getLogger(__name__)
+
+
+class CancellationToken:
+    """
+        협력적 작업 취소 토큰
+            - 작업 쪽은 is_cancelled / raise_if_cancelled()로 확인하거나 wait()로 대기
+            - register()한 콜백은 취소 시 한 번 호출 (진행 중인 HTTP 응답 닫기 등)
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: Dict[int, Callable[[], None]] = {}
+        self._next_handle = 0
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self):
+        """
+            취소 요청 (여러 번 호출해도 콜백은 한 번만 실행)
+        """
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks = list(self._callbacks.values())
+            self._callbacks.clear()
+
+        for callback in callbacks:
+            self._invoke(callback)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+            취소되거나 timeout(초)이 지날 때까지 대기, 취소되었으면 True
+        """
+        return self._event.wait(timeout)
+
+    def raise_if_cancelled(self, message: str = "작업이 취소되었습니다."):
+        if self._event.is_set():
+            raise OperationCancelledError(message)
+
+    def register(self, callback: Callable[[], None]) -> Optional[int]:
+        """
+            취소 콜백 등록, 해제용 핸들 반환 (이미 취소되었으면 바로 호출하고 None)
+        """
+        with self._lock:
+            if not self._event.is_set():
+                handle = self._next_handle
+                self._next_handle += 1
+                self._callbacks[handle] = callback
+                return handle
+
+        self._invoke(callback)
+        return None
+
+    def unregister(self, handle: Optional[int]):
+        if handle is None:
+            return
+        with self._lock:
+            self._callbacks.pop(handle, None)
+
+    @contextmanager
+    def on_cancel(self, callback: Callable[[], None]) -> Iterator[None]:
+        """
+            with 블록 안에서만 유효한 취소 콜백
+        """
+        handle = self.register(callback)
+        try:
+            yield
+        finally:
+            self.unregister(handle)
+
+    @staticmethod
+    def _invoke(callback: Callable[[], None]):
+        try:
+            callback()
+        except Exception as e:
+            logger.debug(f"취소 콜백 오류: {e}")
@@ -3,7 +3,10 @@ import json
 from typing import Any, Optional
 from PyQt5.QtCore import QSettings
 
-from ..constants import OPTIONS_FILE, DEFAULT_PROTOCOL, PROTOCOL_OPTIONS
+from ..constants import (
+    OPTIONS_FILE, DEFAULT_PROTOCOL, PROTOCOL_OPTIONS, HTTP_POOL_SIZE, HTTP_POOL_MAX_IDLE
+)
+from .http_session import SharedSession
 from ..config import API_KEY  # config.py에서 API_KEY 가져오기
 
 
@@ -59,6 +62,50 @@ class ConfigManager:
         """
         self._settings.setValue('land_label_style', value)
 
+    @property
+    def http_pool_size(self) -> int:
+        """
+            HTTP 커넥션 풀 크기 반환
+        """
+        return self._settings.value('http_pool_size', HTTP_POOL_SIZE, type=int)
+
+    @http_pool_size.setter
+    def http_pool_size(self, value: int):
+        """
+            HTTP 커넥션 풀 크기 설정
+        """
+        self._settings.setValue('http_pool_size', value)
+        SharedSession.configure(pool_size=value)
+
+    @property
+    def http_pool_max_idle(self) -> float:
+        """
+            HTTP 커넥션 최대 유휴 시간(초) 반환
+        """
+        return self._settings.value('http_pool_max_idle', HTTP_POOL_MAX_IDLE, type=float)
+
+    @http_pool_max_idle.setter
+    def http_pool_max_idle(self, value: float):
+        """
+            HTTP 커넥션 최대 유휴 시간(초) 설정
+        """
+        self._settings.setValue('http_pool_max_idle', value)
+        SharedSession.configure(max_idle=value)
+
+    @property
+    def wfs_mirror_enabled(self) -> bool:
+        """
+            WFS 레이어 로컬(GeoPackage) 저장 사용 여부 반환
+        """
+        return self._settings.value('wfs_mirror_enabled', False, type=bool)
+
+    @wfs_mirror_enabled.setter
+    def wfs_mirror_enabled(self, value: bool):
+        """
+            WFS 레이어 로컬(GeoPackage) 저장 사용 여부 설정
+        """
+        self._settings.setValue('wfs_mirror_enabled', value)
+
     def _load_options(self) -> dict:
         """
             옵션 파일 로드
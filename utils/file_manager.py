@@ -1,6 +1,7 @@
 import os
+import csv
 import json
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 import logging
 
 from ..exceptions import FileError
@@ -107,4 +108,28 @@ class FileManager:
             return True
         except Exception as e:
             logger.error(f"파일 삭제 실패 {filepath}: {e}")
-            return False
\ No newline at end of file
+            return False
+
+    @staticmethod
+    def append_csv(filepath: str, rows: List[Dict[str, Any]], fieldnames: List[str]) -> None:
+        """
+            CSV 파일에 행 추가 (새 파일이면 헤더 먼저 기록)
+        """
+        try:
+            # 디렉토리 확인
+            directory = os.path.dirname(filepath)
+            if directory:
+                FileManager.ensure_directory(directory)
+
+            is_new = not os.path.exists(filepath) or os.path.getsize(filepath) == 0
+
+            # 엑셀에서 한글이 깨지지 않도록 새 파일에만 BOM 기록
+            with open(filepath, 'w' if is_new else 'a', encoding='utf-8-sig' if is_new else 'utf-8', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+                if is_new:
+                    writer.writeheader()
+                writer.writerows(rows)
+
+        except Exception as e:
+            logger.error(f"CSV 파일 쓰기 실패 {filepath}: {e}")
+            raise FileError(f"CSV 파일 저장 실패: {filepath}")
\ No newline at end of file
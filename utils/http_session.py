@@ -0,0 +1,156 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ..constants import HTTP_POOL_SIZE, HTTP_POOL_MAX_IDLE
+
+logger = logging.getLogger(__name__)
+
+
+class SharedSession:
+    """
+        프로세스 전역 keep-alive HTTP 세션
+            - 요청은 use()로 세션을 빌려 쓰고, 사용 중인 세션은 닫지 않음
+            - 설정 변경/유휴 시간 초과로 교체된 세션은 마지막 사용이 끝날 때 닫음
+    """
+
+    _lock = threading.Lock()
+    _session: Optional[requests.Session] = None
+    _last_used = 0.0
+    _pool_size = HTTP_POOL_SIZE
+    _max_idle = HTTP_POOL_MAX_IDLE
+
+    # 세션별 진행 중인 요청 수
+    _in_flight: Dict[requests.Session, int] = {}
+
+    @classmethod
+    def configure(cls, pool_size: Optional[int] = None, max_idle: Optional[float] = None):
+        """
+            커넥션 풀 크기 / 최대 유휴 시간 설정 (플러그인 로드 또는 설정 변경 시 호출)
+                풀 크기가 바뀌면 새 요청부터 새 세션 사용
+        """
+        with cls._lock:
+            if max_idle is not None and float(max_idle) > 0:
+                cls._max_idle = float(max_idle)
+
+            if pool_size is not None and int(pool_size) > 0 and int(pool_size) != cls._pool_size:
+                cls._pool_size = int(pool_size)
+                if cls._session is not None:
+                    logger.info(f"HTTP 커넥션 풀 크기 변경: {cls._pool_size}")
+                    cls._retire_locked()
+
+    @classmethod
+    @contextmanager
+    def use(cls) -> Iterator[requests.Session]:
+        """
+            요청 하나 동안 공유 세션 사용
+                스트림 응답은 본문을 다 읽을 때까지 커넥션을 풀에서 빌린 상태이므로
+                세션이 교체되어도 읽기는 계속됨
+        """
+        session = cls._checkout()
+        try:
+            yield session
+        finally:
+            cls._checkin(session)
+
+    @classmethod
+    def get(cls) -> requests.Session:
+        """
+            공유 세션 반환 (진행 중 요청 수를 세지 않으므로 요청에는 use() 사용)
+        """
+        with cls._lock:
+            return cls._current_locked(time.monotonic())
+
+    @classmethod
+    def close(cls):
+        """
+            공유 세션 종료 (진행 중인 요청이 있으면 끝난 뒤 닫힘)
+        """
+        with cls._lock:
+            cls._retire_locked()
+
+    @classmethod
+    def pool_size(cls) -> int:
+        return cls._pool_size
+
+    @classmethod
+    def in_flight(cls) -> int:
+        with cls._lock:
+            return sum(cls._in_flight.values())
+
+    @classmethod
+    def _checkout(cls) -> requests.Session:
+        with cls._lock:
+            session = cls._current_locked(time.monotonic())
+            cls._in_flight[session] = cls._in_flight.get(session, 0) + 1
+            return session
+
+    @classmethod
+    def _checkin(cls, session: requests.Session):
+        with cls._lock:
+            count = cls._in_flight.get(session, 0) - 1
+            if count > 0:
+                cls._in_flight[session] = count
+                return
+
+            cls._in_flight.pop(session, None)
+
+            if session is cls._session:
+                # 유휴 시간은 마지막 요청이 끝난 시점부터 계산
+                cls._last_used = time.monotonic()
+            else:
+                # 교체된 세션의 마지막 요청이 끝남
+                cls._close_session(session)
+
+    @classmethod
+    def _current_locked(cls, now: float) -> requests.Session:
+        # 오래 쉬었던 커넥션은 서버가 이미 끊었을 수 있으므로 새로 연결 (사용 중이면 유휴 아님)
+        if (
+                cls._session is not None
+                and not cls._in_flight.get(cls._session)
+                and now - cls._last_used > cls._max_idle
+        ):
+            logger.debug("유휴 시간 초과로 HTTP 세션 재생성")
+            cls._retire_locked()
+
+        if cls._session is None:
+            cls._session = cls._create_session()
+
+        cls._last_used = now
+        return cls._session
+
+    @classmethod
+    def _create_session(cls) -> requests.Session:
+        """
+            커넥션 풀이 제한된 세션 생성
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=cls._pool_size,
+            pool_maxsize=cls._pool_size,
+            pool_block=True
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    @classmethod
+    def _retire_locked(cls):
+        """
+            현재 세션을 교체 대상으로 표시 (사용 중이 아니면 바로 닫음)
+        """
+        session, cls._session = cls._session, None
+        if session is not None and not cls._in_flight.get(session):
+            cls._close_session(session)
+
+    @staticmethod
+    def _close_session(session: requests.Session):
+        try:
+            session.close()
+        except Exception as e:
+            logger.error(f"HTTP 세션 종료 오류: {e}")
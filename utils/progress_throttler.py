@@ -0,0 +1,133 @@
+import time
+from typing import Callable, Optional
+import logging
+
+from ..constants import PROGRESS_EMIT_INTERVAL, PROGRESS_EMIT_STEP
+
+logger = logging.getLogger(__name__)
+
+
+class ProgressThrottler:
+    """
+        일괄 작업 진행 상황을 일정 간격으로 모아서 전달
+            - interval(초)이 지났거나 진행률이 step(%) 이상 늘었을 때만 전달
+            - 그 사이의 상태 메시지는 마지막 것만 남김
+            - 상태 메시지에 처리 건수, 초당 처리량, 남은 예상 시간 포함
+            (한 스레드에서만 update 호출)
+    """
+
+    def __init__(
+            self,
+            total: int,
+            on_progress: Callable[[int], None],
+            on_status: Optional[Callable[[str], None]] = None,
+            interval: float = PROGRESS_EMIT_INTERVAL,
+            step: int = PROGRESS_EMIT_STEP,
+            start: int = 0
+    ):
+        """
+            start: 이미 끝난 건수 (이어서 처리할 때, 처리량 계산에서는 제외)
+        """
+        self.total = max(0, int(total))
+        self.on_progress = on_progress
+        self.on_status = on_status
+        self.interval = interval
+        self.step = step
+
+        self.done = start
+        self._initial = start
+        self._started = time.monotonic()
+        self._last_emit = self._started
+        self._last_percent = -1
+        self._message = ""
+        self._pending = False
+
+    @property
+    def percent(self) -> int:
+        if not self.total:
+            return 100
+        return min(100, int(self.done * 100 / self.total))
+
+    @property
+    def rate(self) -> float:
+        """
+            초당 처리 건수
+        """
+        elapsed = time.monotonic() - self._started
+        return (self.done - self._initial) / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> Optional[float]:
+        """
+            남은 예상 시간(초), 아직 알 수 없으면 None
+        """
+        rate = self.rate
+        if rate <= 0 or not self.total:
+            return None
+        return max(0.0, (self.total - self.done) / rate)
+
+    def update(self, done: Optional[int] = None, message: str = "") -> bool:
+        """
+            진행 건수 갱신 (done을 생략하면 1건 증가), 이번에 전달했으면 True
+                (호출자가 모아 둔 다른 결과도 같은 간격으로 보낼 수 있음)
+        """
+        self.done = self.done + 1 if done is None else done
+        if message:
+            self._message = message
+        self._pending = True
+
+        now = time.monotonic()
+        percent = self.percent
+
+        if (
+                now - self._last_emit >= self.interval
+                or percent - self._last_percent >= self.step
+                or self.done >= self.total
+        ):
+            self._emit(now, percent)
+            return True
+        return False
+
+    def flush(self):
+        """
+            아직 전달하지 않은 마지막 상태 전달
+        """
+        if self._pending:
+            self._emit(time.monotonic(), self.percent)
+
+    def format_status(self) -> str:
+        parts = [f"{self.done}/{self.total}건"]
+
+        rate = self.rate
+        if rate > 0:
+            parts.append(f"{rate:.1f}건/초")
+
+        eta = self.eta
+        if eta is not None and self.done < self.total:
+            parts.append(f"남은 시간 {self.format_duration(eta)}")
+
+        status = ", ".join(parts)
+        return f"{self._message} ({status})" if self._message else status
+
+    @staticmethod
+    def format_duration(seconds: float) -> str:
+        seconds = int(round(seconds))
+        hours, rest = divmod(seconds, 3600)
+        minutes, seconds = divmod(rest, 60)
+
+        if hours:
+            return f"{hours}시간 {minutes}분"
+        if minutes:
+            return f"{minutes}분 {seconds}초"
+        return f"{seconds}초"
+
+    def _emit(self, now: float, percent: int):
+        self._last_emit = now
+        self._pending = False
+
+        if percent != self._last_percent:
+            self._last_percent = percent
+            self.on_progress(percent)
+
+        if self.on_status:
+            self.on_status(self.format_status())
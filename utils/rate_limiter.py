@@ -0,0 +1,236 @@
+import threading
+import time
+from typing import Dict, Any, Optional
+import logging
+
+from ..constants import (
+    API_RATE_LIMIT, API_RATE_BURST, API_MIN_CONCURRENCY, API_MAX_CONCURRENCY,
+    API_LATENCY_TARGET
+)
+from .cancellation import CancellationToken
+
+logger = logging.getLogger(__name__)
+
+# 이보다 짧은 대기는 대기 횟수 통계에서 제외 (초)
+WAIT_THRESHOLD = 0.001
+
+# 대기 중 취소 여부를 확인하는 간격 (초)
+WAIT_SLICE = 0.1
+
+
+class TokenBucket:
+    """
+        토큰 버킷 방식 초당 요청 수 제한
+    """
+
+    def __init__(self, rate: float = API_RATE_LIMIT, burst: int = API_RATE_BURST):
+        self.rate = float(rate)
+        self.capacity = float(max(1, burst))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+        # 대기 통계
+        self.acquired = 0
+        self.waited = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def acquire(self, cancel_token: Optional[CancellationToken] = None) -> float:
+        """
+            토큰 1개 획득 (부족하면 대기), 대기한 시간(초) 반환
+                대기 중 cancel_token이 취소되면 OperationCancelledError
+        """
+        started = time.monotonic()
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    waited = now - started
+                    self.acquired += 1
+                    if waited > WAIT_THRESHOLD:
+                        self.waited += 1
+                        self.total_wait += waited
+                        self.max_wait = max(self.max_wait, waited)
+                    return waited
+
+                delay = (1 - self._tokens) / self.rate
+
+            if cancel_token is None:
+                time.sleep(delay)
+            elif cancel_token.wait(delay):
+                cancel_token.raise_if_cancelled("요청이 취소되었습니다.")
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'rate': self.rate,
+                'burst': self.capacity,
+                'acquired': self.acquired,
+                'waited': self.waited,
+                'total_wait_sec': self.total_wait,
+                'max_wait_sec': self.max_wait
+            }
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+        AIMD 방식 동시 요청 수 제한
+            - 응답 지연 또는 429/503/네트워크 오류 발생 시 한도 절반으로 감소
+            - 정상 응답이 이어지면 한도 1씩 증가
+    """
+
+    def __init__(
+            self,
+            min_limit: int = API_MIN_CONCURRENCY,
+            max_limit: int = API_MAX_CONCURRENCY,
+            latency_target: float = API_LATENCY_TARGET
+    ):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.latency_target = latency_target
+        self._limit = float(self.max_limit)
+        self._in_flight = 0
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+
+        # 통계
+        self.acquired = 0
+        self.waited = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.decreases = 0
+        self.increases = 0
+
+    @property
+    def limit(self) -> int:
+        return max(self.min_limit, int(self._limit))
+
+    def acquire(self, cancel_token: Optional[CancellationToken] = None) -> float:
+        """
+            동시 요청 슬롯 획득, 대기한 시간(초) 반환
+                대기 중 cancel_token이 취소되면 OperationCancelledError (WAIT_SLICE 간격으로 확인)
+        """
+        started = time.monotonic()
+
+        with self._cond:
+            while self._in_flight >= self.limit:
+                if cancel_token is None:
+                    self._cond.wait()
+                else:
+                    cancel_token.raise_if_cancelled("요청이 취소되었습니다.")
+                    self._cond.wait(WAIT_SLICE)
+
+            self._in_flight += 1
+            waited = time.monotonic() - started
+            self.acquired += 1
+            if waited > WAIT_THRESHOLD:
+                self.waited += 1
+                self.total_wait += waited
+                self.max_wait = max(self.max_wait, waited)
+            return waited
+
+    def release(self, latency: float, overloaded: bool = False):
+        """
+            슬롯 반환 및 응답 결과로 한도 조정
+        """
+        with self._cond:
+            self._in_flight = max(0, self._in_flight - 1)
+            now = time.monotonic()
+
+            if overloaded or latency > self.latency_target:
+                # 한 번의 혼잡에 연속으로 줄어들지 않도록 지연 시간만큼은 재감소하지 않음
+                if now - self._last_decrease > max(latency, 1.0):
+                    previous = self.limit
+                    self._limit = max(float(self.min_limit), self._limit / 2)
+                    self._last_decrease = now
+                    self.decreases += 1
+                    logger.info(f"API 동시 요청 한도 감소: {previous} -> {self.limit}")
+            elif self._limit < self.max_limit:
+                previous = self.limit
+                self._limit = min(float(self.max_limit), self._limit + 1.0 / max(1, self.limit))
+                if self.limit > previous:
+                    self.increases += 1
+                    logger.debug(f"API 동시 요청 한도 증가: {previous} -> {self.limit}")
+
+            self._cond.notify_all()
+
+    def discard(self):
+        """
+            요청을 보내지 못한 슬롯 반환 (한도 조정 없음)
+        """
+        with self._cond:
+            self._in_flight = max(0, self._in_flight - 1)
+            self._cond.notify_all()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                'limit': self.limit,
+                'in_flight': self._in_flight,
+                'acquired': self.acquired,
+                'waited': self.waited,
+                'total_wait_sec': self.total_wait,
+                'max_wait_sec': self.max_wait,
+                'decreases': self.decreases,
+                'increases': self.increases
+            }
+
+
+class ApiThrottle:
+    """
+        프로세스 전역 API 호출 제한 (동시 요청 수 + 초당 요청 수)
+    """
+
+    _lock = threading.Lock()
+    _instance: Optional['ApiThrottle'] = None
+
+    def __init__(self):
+        self.concurrency = AdaptiveConcurrencyLimiter()
+        self.bucket = TokenBucket()
+
+    @classmethod
+    def shared(cls) -> 'ApiThrottle':
+        """
+            공유 인스턴스 반환
+        """
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def acquire(self, cancel_token: Optional[CancellationToken] = None) -> float:
+        """
+            요청 전 호출, 총 대기 시간(초) 반환
+                대기 중 cancel_token이 취소되면 OperationCancelledError (슬롯은 반환됨)
+        """
+        # 슬롯을 먼저 잡아야 대기 중인 호출자가 토큰을 미리 소모하지 않음
+        waited = self.concurrency.acquire(cancel_token)
+        try:
+            waited += self.bucket.acquire(cancel_token)
+        except BaseException:
+            self.concurrency.discard()
+            raise
+        return waited
+
+    def release(self, latency: float, overloaded: bool = False):
+        """
+            요청 완료 후 호출
+        """
+        self.concurrency.release(latency, overloaded)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'concurrency': self.concurrency.get_stats(),
+            'rate': self.bucket.get_stats()
+        }
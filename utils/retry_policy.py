@@ -0,0 +1,55 @@
+import random
+from typing import Optional, Iterable
+
+from ..constants import RETRY_POLICIES
+
+
+class RetryPolicy:
+    """
+        지수 백오프 + 지터 재시도 정책
+    """
+
+    def __init__(
+            self,
+            max_attempts: int = 3,
+            backoff_base: float = 0.5,
+            backoff_max: float = 10.0,
+            jitter: float = 0.5,
+            retry_status: Iterable[int] = (429, 500, 502, 503, 504)
+    ):
+        """
+            max_attempts: 최초 요청을 포함한 최대 시도 횟수
+            backoff_base: 첫 재시도 대기 시간 (초)
+            backoff_max: 최대 대기 시간 (초)
+            jitter: 대기 시간에 곱하는 무작위 비율 범위 (0~1)
+            retry_status: 재시도 대상 HTTP 상태 코드
+        """
+        self.max_attempts = max(1, int(max_attempts))
+        self.backoff_base = float(backoff_base)
+        self.backoff_max = float(backoff_max)
+        self.jitter = min(1.0, max(0.0, float(jitter)))
+        self.retry_status = frozenset(retry_status)
+
+    @classmethod
+    def for_endpoint(cls, endpoint: str) -> 'RetryPolicy':
+        """
+            엔드포인트별 기본 정책 생성
+        """
+        options = RETRY_POLICIES.get(endpoint, RETRY_POLICIES['default'])
+        return cls(**options)
+
+    def is_retryable_status(self, status_code: int) -> bool:
+        return status_code in self.retry_status
+
+    def get_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+            attempt번째 시도 실패 후 대기 시간 계산
+        """
+        delay = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        delay *= 1 - self.jitter * random.random()
+
+        # 서버가 Retry-After를 준 경우 그보다 먼저 재시도하지 않음
+        if retry_after is not None:
+            delay = max(delay, min(self.backoff_max, retry_after))
+
+        return delay
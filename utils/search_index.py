@@ -0,0 +1,106 @@
+from typing import Dict, Set, List, Optional
+
+# 한글 음절 분해 (호환용 자모 사용 - 키보드로 입력되는 자모와 같은 코드)
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+_JUNGSEONG = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+_JONGSEONG = ('', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ',
+              'ㄿ', 'ㅀ', 'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ')
+
+# 겹받침/이중모음은 입력 도중 두 글자로 나뉘어 있으므로 낱자로 펼침
+_COMPOUND = {
+    'ㄳ': 'ㄱㅅ', 'ㄵ': 'ㄴㅈ', 'ㄶ': 'ㄴㅎ', 'ㄺ': 'ㄹㄱ', 'ㄻ': 'ㄹㅁ', 'ㄼ': 'ㄹㅂ', 'ㄽ': 'ㄹㅅ',
+    'ㄾ': 'ㄹㅌ', 'ㄿ': 'ㄹㅍ', 'ㅀ': 'ㄹㅎ', 'ㅄ': 'ㅂㅅ',
+    'ㅘ': 'ㅗㅏ', 'ㅙ': 'ㅗㅐ', 'ㅚ': 'ㅗㅣ', 'ㅝ': 'ㅜㅓ', 'ㅞ': 'ㅜㅔ', 'ㅟ': 'ㅜㅣ', 'ㅢ': 'ㅡㅣ'
+}
+
+
+def _build_jamo_table() -> Dict[int, str]:
+    table = {}
+    for code in range(_HANGUL_BASE, _HANGUL_LAST + 1):
+        offset = code - _HANGUL_BASE
+        jamo = (
+            _CHOSEONG[offset // 588]
+            + _JUNGSEONG[(offset % 588) // 28]
+            + _JONGSEONG[offset % 28]
+        )
+        table[code] = ''.join(_COMPOUND.get(j, j) for j in jamo)
+
+    for compound, parts in _COMPOUND.items():
+        table[ord(compound)] = parts
+
+    return table
+
+
+_JAMO_TABLE = _build_jamo_table()
+
+
+class SearchIndex:
+    """
+        부분 문자열 검색용 n-gram 색인
+            - 소문자 + 한글 자모 단위로 정규화해 입력 중인 글자("섭" -> "서비스")도 일치
+            - 1~n글자 조각을 모두 색인하므로 짧은 검색어는 색인만으로, 긴 검색어는 후보 확인으로 처리
+    """
+
+    def __init__(self, gram_size: int = 3):
+        self.gram_size = gram_size
+        self._texts: Dict[int, str] = {}
+        self._postings: Dict[str, Set[int]] = {}
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """
+            검색용 정규화 (대소문자 통일 + 한글 자모 분해)
+        """
+        return (text or '').casefold().translate(_JAMO_TABLE)
+
+    def add(self, key: int, text: str):
+        """
+            항목 추가 (key는 호출 측 식별자)
+        """
+        normalized = self.normalize(text)
+        self._texts[key] = normalized
+
+        for size in range(1, self.gram_size + 1):
+            for start in range(len(normalized) - size + 1):
+                self._postings.setdefault(normalized[start:start + size], set()).add(key)
+
+    def clear(self):
+        self._texts.clear()
+        self._postings.clear()
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def keys(self) -> Set[int]:
+        return set(self._texts)
+
+    def search(self, query: str) -> Optional[Set[int]]:
+        """
+            검색어를 포함하는 항목의 key 집합 반환 (빈 검색어는 None = 전체)
+        """
+        query = self.normalize(query.strip())
+        if not query:
+            return None
+
+        if len(query) <= self.gram_size:
+            return set(self._postings.get(query, ()))
+
+        # 검색어의 n-gram 색인을 작은 것부터 교집합한 뒤 실제 포함 여부 확인
+        grams = {query[i:i + self.gram_size] for i in range(len(query) - self.gram_size + 1)}
+        postings: List[Set[int]] = []
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if not posting:
+                return set()
+            postings.append(posting)
+
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+            if not candidates:
+                return candidates
+
+        return {key for key in candidates if query in self._texts[key]}
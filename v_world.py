@@ -14,8 +14,8 @@ from .constants import (
     PLUGIN_DIR, UI_TEXTS, ERROR_MESSAGES, SUCCESS_MESSAGES,
     WMTS_LAYER_PREFIX, SUPPORTED_ENCODINGS
 )
-from .utils import ConfigManager, Validators, with_error_handling
-from .core import LayerManager
+from .utils import ConfigManager, Validators, SharedSession, with_error_handling
+from .core import LayerManager, CacheManager, ViewportLoader, TaskScheduler
 from .widgets import SearchWidget, WfsWidget, SettingsWidget
 from .config import API_KEY  # config.py에서 API_KEY 가져오기
 
@@ -38,6 +38,9 @@ class VWorld:
         # 설정 관리자
         self.config = ConfigManager()
 
+        # 공유 HTTP 세션은 로드 시 한 번만 설정 (이후 변경은 설정 저장 시 반영)
+        SharedSession.configure(self.config.http_pool_size, self.config.http_pool_max_idle)
+
         # 위젯 인스턴스
         self.widgets: Dict[str, Optional[object]] = {
             'search': None,
@@ -421,6 +424,12 @@ class VWorld:
                     widget.close()
                 self.widgets[widget_name] = None
 
+        # 백그라운드 작업 / 공유 HTTP 세션 / 캐시 종료
+        ViewportLoader.stop_all()
+        TaskScheduler.shutdown_shared()
+        SharedSession.close()
+        CacheManager.close_shared()
+
         logger.info("VWorld 플러그인 언로드 완료")
 
     def show_info_message(self, title: str, message: str):
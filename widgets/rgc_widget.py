@@ -7,8 +7,9 @@ from qgis.gui import QgsMapToolEmitPoint
 import logging
 
 from .base_widget import BaseDialog
-from ..constants import UI_DIR
+from ..constants import UI_DIR, REVERSE_GEOCODE_CACHE_TTL
 from ..utils import ApiClient, with_error_handling, require_api_key
+from ..core import CacheManager
 from ..config import API_KEY
 
 logger = logging.getLogger(__name__)
@@ -51,6 +52,7 @@ class ReverseGeocodingWidget(BaseDialog, FORM_CLASS if FORM_CLASS else object):
             self._setup_ui()
 
         self.api_client = ApiClient()
+        self.cache = CacheManager.shared()
         self.point_tool = None
         self._connect_signals()
 
@@ -173,8 +175,14 @@ class ReverseGeocodingWidget(BaseDialog, FORM_CLASS if FORM_CLASS else object):
             y = float(self.yInput.text())
             crs = self.crsSelect.text() if hasattr(self, 'crsSelect') else "EPSG:4326"
 
-            # 역지오코딩 수행
-            response = self.api_client.reverse_geocode(x, y, crs)
+            # 역지오코딩 수행 (캐시 우선, 만료된 결과는 즉시 표시 후 백그라운드 갱신)
+            response, cache_status = self.cache.get_or_fetch(
+                f"reverse_geocode|{crs}|{x:.7f},{y:.7f}",
+                lambda: self.api_client.reverse_geocode(x, y, crs),
+                ttl=REVERSE_GEOCODE_CACHE_TTL,
+                cacheable=lambda r: r.get('response', {}).get('status') in ('OK', 'NOT_FOUND')
+            )
+            logger.debug(f"역지오코딩 캐시 상태: {cache_status}")
 
             if response.get('response', {}).get('status') == 'OK':
                 result = response['response']['result'][0]
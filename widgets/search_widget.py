@@ -56,10 +56,9 @@ class SearchWidget(BaseWidget, FORM_CLASS):
         if not query:
             return
 
-        # 기존 검색 워커 정리
+        # 기존 검색은 취소만 요청하고 기다리지 않음 (결과는 버려짐)
         if self.search_worker and self.search_worker.isRunning():
-            self.search_worker.terminate()
-            self.search_worker.wait()
+            self.search_worker.cancel()
 
         # 새 검색 워커 시작
         self.search_worker = SearchWorker(query, self.get_current_crs())
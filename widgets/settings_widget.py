@@ -43,6 +43,12 @@ class SettingsWidget(BaseDialog, FORM_CLASS):
         else:
             self.landLabelSytleOFF.setChecked(True)
 
+        # WFS 로컬 저장
+        if self.config.wfs_mirror_enabled:
+            self.wfsMirrorON.setChecked(True)
+        else:
+            self.wfsMirrorOFF.setChecked(True)
+
     def _connect_signals(self):
         """
             시그널 연결
@@ -59,6 +65,10 @@ class SettingsWidget(BaseDialog, FORM_CLASS):
         self.landLabelSytleON.clicked.connect(lambda: self._save_label_style(True))
         self.landLabelSytleOFF.clicked.connect(lambda: self._save_label_style(False))
 
+        # WFS 로컬 저장
+        self.wfsMirrorON.clicked.connect(lambda: self._save_wfs_mirror(True))
+        self.wfsMirrorOFF.clicked.connect(lambda: self._save_wfs_mirror(False))
+
     @with_error_handling("API 키 저장 중 오류가 발생했습니다")
     def _save_api_key(self):
         """
@@ -101,4 +111,17 @@ class SettingsWidget(BaseDialog, FORM_CLASS):
             logger.info(f"토지 라벨 스타일: {enabled}")
         except Exception as e:
             logger.error(f"라벨 스타일 저장 실패: {e}")
-            self.show_error_message("오류", "라벨 스타일 저장에 실패했습니다.")
\ No newline at end of file
+            self.show_error_message("오류", "라벨 스타일 저장에 실패했습니다.")
+
+    def _save_wfs_mirror(self, enabled: bool):
+        """
+            WFS 로컬 저장 설정 저장
+        """
+        try:
+            self.config.wfs_mirror_enabled = enabled
+            status = "활성화" if enabled else "비활성화"
+            self.show_info_message("저장 완료", f"WFS 레이어 로컬 저장이 {status}되었습니다.")
+            logger.info(f"WFS 로컬 저장: {enabled}")
+        except Exception as e:
+            logger.error(f"WFS 로컬 저장 설정 실패: {e}")
+            self.show_error_message("오류", "WFS 로컬 저장 설정에 실패했습니다.")
\ No newline at end of file
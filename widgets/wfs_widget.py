@@ -1,32 +1,83 @@
 import os
-import xml.etree.ElementTree as ET
 from qgis.PyQt import uic
-from qgis.PyQt.QtCore import Qt, QUrl
-from qgis.PyQt.QtWidgets import QListWidgetItem, QMenu
+from qgis.PyQt.QtCore import Qt, QUrl, QTimer
+from qgis.PyQt.QtWidgets import QListWidget, QListWidgetItem, QMenu
 from qgis.PyQt.QtGui import QDesktopServices
-from typing import Dict, List
+from typing import Dict, List, Set
 import logging
 
 from .base_widget import BaseWidget
-from ..constants import UI_DIR, FAVORITES_FILE
-from ..utils import FileManager, ApiClient, with_error_handling, with_loading_cursor, require_api_key
-from ..core import LayerManager
-from ..exceptions import ApiError
+from ..constants import UI_DIR, FAVORITES_FILE, WFS_SEARCH_DEBOUNCE_MS
+from ..utils import FileManager, ApiClient, ConfigManager, SearchIndex, with_error_handling, with_loading_cursor, require_api_key
+from ..core import LayerManager, WfsCatalog, WfsCatalogWorker, WfsDownloader, ViewportLoader
 
 logger = logging.getLogger(__name__)
 
 FORM_CLASS, _ = uic.loadUiType(os.path.join(UI_DIR, 'v_world_dockWfs_base.ui'))
 
 
+class _ListFilter:
+    """
+        QListWidget 검색 필터 (색인 검색 후 표시 상태가 바뀐 항목만 갱신)
+    """
+
+    def __init__(self, list_widget: QListWidget):
+        self.list_widget = list_widget
+        self.index = SearchIndex()
+        self._items: List[QListWidgetItem] = []
+        self._hidden: Set[int] = set()
+
+    def add_item(self, item: QListWidgetItem):
+        self.index.add(len(self._items), item.text())
+        self._items.append(item)
+
+    def clear(self):
+        self.index.clear()
+        self._items.clear()
+        self._hidden.clear()
+
+    def apply(self, query: str):
+        """
+            검색어 적용
+        """
+        matches = self.index.search(query)
+        hidden = set() if matches is None else self.index.keys() - matches
+
+        changed = hidden ^ self._hidden
+        if not changed:
+            return
+
+        self.list_widget.setUpdatesEnabled(False)
+        try:
+            for key in changed:
+                self._items[key].setHidden(key in hidden)
+        finally:
+            self.list_widget.setUpdatesEnabled(True)
+
+        self._hidden = hidden
+
+
 class WfsWidget(BaseWidget, FORM_CLASS):
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setupUi(self)
         self.api_client = ApiClient()
+        self.catalog_worker = None
+        self.download_worker = None
+        self.wfsProgress.hide()
+
+        self.wfs_filter = _ListFilter(self.wfsList)
+        self.favorites_filter = _ListFilter(self.wfsFavorites)
+
+        # 입력이 멈춘 뒤 한 번만 필터링
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(WFS_SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self._apply_search_filter)
         self._connect_signals()
-        self._load_wfs_layers()
         self._refresh_favorites()
+        self._load_wfs_layers()
 
     def _connect_signals(self):
         """
@@ -47,48 +98,84 @@ class WfsWidget(BaseWidget, FORM_CLASS):
         self.linktoVworld.linkActivated.connect(self._open_vworld_website)
 
     @with_error_handling("WFS 레이어 목록을 가져오는 중 오류가 발생했습니다")
-    @with_loading_cursor
     @require_api_key
     def _load_wfs_layers(self):
         """
-            WFS 레이어 목록 로드
+            WFS 레이어 목록 로드 (백그라운드)
         """
-        try:
-            # Capabilities 가져오기
-            root = self.api_client.get_wfs_capabilities()
+        self.wfsList.clear()
+        self.wfs_filter.clear()
+
+        # 이번 세션에 이미 불러온 목록은 바로 표시
+        layers = WfsCatalog.get_session_layers()
+        if layers is not None:
+            self._add_layer_items(layers)
+            self._on_layers_finished(layers)
+            return
 
-            # 레이어 목록 파싱
-            for feature_type in root.findall(".//FeatureType"):
-                name_elem = feature_type.find("Name")
-                title_elem = feature_type.find("Title")
+        self.wfsProgress.setRange(0, 0)
+        self.wfsProgress.setFormat("주제도 목록 불러오는 중...")
+        self.wfsProgress.show()
 
-                if name_elem is not None and title_elem is not None:
-                    item = QListWidgetItem(f"{title_elem.text}[{name_elem.text}]")
-                    item.setData(Qt.UserRole, name_elem.text)
-                    self.wfsList.addItem(item)
+        self.catalog_worker = WfsCatalogWorker()
+        self.catalog_worker.layers_loaded.connect(self._add_layer_items)
+        self.catalog_worker.finished.connect(self._on_layers_finished)
+        self.catalog_worker.error.connect(self._on_layers_error)
+        self.catalog_worker.start()
 
-            self.wfsList.sortItems()
-            logger.info(f"WFS 레이어 {self.wfsList.count()}개 로드 완료")
+    def _add_layer_items(self, layers: List[Dict]):
+        """
+            레이어 목록 아이템 추가
+        """
+        for layer in layers:
+            item = QListWidgetItem(f"{layer['title']}[{layer['name']}]")
+            item.setData(Qt.UserRole, layer['name'])
+            self.wfsList.addItem(item)
+            self.wfs_filter.add_item(item)
 
-        except ApiError as e:
-            logger.error(f"WFS 레이어 로드 실패: {e}")
-            self.show_error_message("WFS 오류", str(e))
+        # 입력 중인 검색어 반영
+        if self.wfsSearch.text():
+            self.wfs_filter.apply(self.wfsSearch.text())
 
-    def _on_search_text_changed(self, text: str):
+    def _on_layers_finished(self, layers: List[Dict]):
         """
-            검색 텍스트 변경
+            레이어 목록 로드 완료
         """
-        search_text = text.lower()
+        self.wfsProgress.hide()
+        self.wfsList.sortItems()
+        logger.info(f"WFS 레이어 {self.wfsList.count()}개 로드 완료")
 
-        # WFS 목록 필터링
-        for i in range(self.wfsList.count()):
-            item = self.wfsList.item(i)
-            item.setHidden(search_text not in item.text().lower())
+    def _on_layers_error(self, message: str):
+        """
+            레이어 목록 로드 실패
+        """
+        self.wfsProgress.hide()
+        logger.error(f"WFS 레이어 로드 실패: {message}")
+        self.show_error_message("WFS 오류", message)
 
-        # 즐겨찾기 목록 필터링
-        for i in range(self.wfsFavorites.count()):
-            item = self.wfsFavorites.item(i)
-            item.setHidden(search_text not in item.text().lower())
+    def closeEvent(self, event):
+        """
+            위젯 닫기 시 진행 중인 목록 로드 중단
+        """
+        if self.catalog_worker and self.catalog_worker.isRunning():
+            self.catalog_worker.cancel()
+        if self.download_worker and self.download_worker.isRunning():
+            self.download_worker.cancel()
+        super().closeEvent(event)
+
+    def _on_search_text_changed(self, text: str):
+        """
+            검색 텍스트 변경 (입력이 멈출 때까지 필터링 지연)
+        """
+        self.search_timer.start()
+
+    def _apply_search_filter(self):
+        """
+            WFS 목록과 즐겨찾기 목록 필터링
+        """
+        search_text = self.wfsSearch.text()
+        self.wfs_filter.apply(search_text)
+        self.favorites_filter.apply(search_text)
 
     @with_error_handling("레이어 추가 중 오류가 발생했습니다")
     @with_loading_cursor
@@ -112,6 +199,10 @@ class WfsWidget(BaseWidget, FORM_CLASS):
             WFS 레이어 추가
         """
         try:
+            if ConfigManager().wfs_mirror_enabled:
+                self._add_mirrored_wfs_layer(layer_title, layer_name)
+                return
+
             LayerManager.add_wfs_layer(
                 layer_title,
                 layer_name,
@@ -124,6 +215,60 @@ class WfsWidget(BaseWidget, FORM_CLASS):
             logger.error(f"WFS 레이어 추가 실패: {e}")
             self.show_error_message("레이어 추가 실패", str(e))
 
+    def _add_mirrored_wfs_layer(self, layer_title: str, layer_name: str):
+        """
+            로컬 저장소에서 레이어 추가 (현재 화면 범위 중 받지 않은 부분만 다운로드)
+        """
+        if self.download_worker and self.download_worker.isRunning():
+            self.show_warning_message("WFS", "진행 중인 다운로드가 끝난 뒤 다시 시도해주세요.")
+            return
+
+        layer, worker = LayerManager.add_mirrored_wfs_layer(
+            layer_title,
+            layer_name,
+            self.canvas.extent(),
+            self.get_current_crs()
+        )
+
+        if worker is None:
+            self.show_info_message("성공", f"{layer_title} 레이어를 로컬 저장소에서 불러왔습니다.")
+            return
+
+        self._track_download(worker, layer_title)
+
+    @with_error_handling("레이어 추가 중 오류가 발생했습니다")
+    @require_api_key
+    def _add_viewport_wfs_layer(self, item: QListWidgetItem):
+        """
+            지도 화면을 따라 필요한 범위만 불러오는 레이어 추가 (레이어를 삭제하면 중지)
+        """
+        layer_name = item.data(Qt.UserRole)
+        layer_title = item.text().split("[")[0].strip()
+
+        ViewportLoader(self.canvas, layer_title, layer_name, self.get_current_crs())
+
+    @with_error_handling("로컬 저장소 갱신 중 오류가 발생했습니다")
+    @require_api_key
+    def _refresh_mirrored_wfs_layer(self, item: QListWidgetItem):
+        """
+            현재 화면 범위 중 받지 않았거나 오래된 부분만 다시 받아 로컬 저장소 갱신
+        """
+        layer_name = item.data(Qt.UserRole)
+        layer_title = item.text().split("[")[0].strip()
+
+        worker = LayerManager.refresh_mirrored_wfs_layer(
+            layer_title,
+            layer_name,
+            self.canvas.extent(),
+            self.get_current_crs()
+        )
+
+        if worker is None:
+            self.show_info_message("WFS", f"{layer_title} 로컬 저장소가 최신 상태입니다.")
+            return
+
+        self._track_download(worker, layer_title)
+
     def _show_wfs_context_menu(self, position):
         """
             WFS 목록 컨텍스트 메뉴
@@ -138,12 +283,95 @@ class WfsWidget(BaseWidget, FORM_CLASS):
         add_favorite = menu.addAction("즐겨찾기 추가")
         add_favorite.triggered.connect(lambda: self._add_to_favorites(item))
 
+        # 현재 화면 범위 전체 피처 다운로드
+        if self.download_worker and self.download_worker.isRunning():
+            cancel_download = menu.addAction("피처 다운로드 취소")
+            cancel_download.triggered.connect(self._cancel_download)
+        else:
+            download_features = menu.addAction("현재 화면 범위 피처 전체 받기")
+            download_features.triggered.connect(lambda: self._download_wfs_features(item))
+
+            extract_features = menu.addAction("현재 화면 범위 피처 타일 병렬 받기")
+            extract_features.triggered.connect(lambda: self._download_wfs_features(item, tiled=True))
+
+            refresh_mirror = menu.addAction("로컬 저장소 갱신 (현재 화면 범위)")
+            refresh_mirror.triggered.connect(lambda: self._refresh_mirrored_wfs_layer(item))
+
+        # 화면 이동에 따라 필요한 범위만 불러오기
+        follow_view = menu.addAction("화면 이동에 따라 불러오기")
+        follow_view.triggered.connect(lambda: self._add_viewport_wfs_layer(item))
+
         # 다운로드 링크
         download = menu.addAction("다운로드 바로가기")
         download.triggered.connect(lambda: self._open_download_page(item))
 
         menu.exec_(self.wfsList.viewport().mapToGlobal(position))
 
+    @with_error_handling("피처 다운로드 중 오류가 발생했습니다")
+    @require_api_key
+    def _download_wfs_features(self, item: QListWidgetItem, tiled: bool = False):
+        """
+            현재 화면 범위의 피처를 모두 내려받아 레이어로 추가
+                tiled: True면 범위를 타일로 나눠 병렬로 받음
+        """
+        layer_name = item.data(Qt.UserRole)
+        layer_title = item.text().split("[")[0].strip()
+        crs = self.get_current_crs()
+
+        extent = self.canvas.extent()
+
+        if tiled:
+            worker = LayerManager.extract_wfs_layer(layer_title, layer_name, extent, crs)
+        else:
+            bbox = WfsDownloader.format_bbox(extent, crs)
+            worker = LayerManager.download_wfs_layer(layer_title, layer_name, crs, bbox)
+
+        self._track_download(worker, layer_title)
+
+    def _track_download(self, worker, layer_title: str):
+        """
+            다운로드 워커 진행률 표시 연결
+        """
+        self.wfsProgress.setRange(0, 0)
+        self.wfsProgress.setFormat(f"{layer_title} 다운로드 중... %p%")
+        self.wfsProgress.show()
+
+        self.download_worker = worker
+        self.download_worker.progress.connect(self._on_download_progress)
+        self.download_worker.finished.connect(self._on_download_finished)
+        self.download_worker.error.connect(self._on_download_error)
+        self.download_worker.status.connect(lambda message: logger.info(message))
+
+    def _cancel_download(self):
+        """
+            다운로드 취소 (이미 받은 피처는 레이어에 남음)
+        """
+        if self.download_worker:
+            self.download_worker.cancel()
+        self.wfsProgress.hide()
+
+    def _on_download_progress(self, value: int):
+        """
+            다운로드 진행률 (전체 건수를 알 때만 호출됨)
+        """
+        if self.wfsProgress.maximum() == 0:
+            self.wfsProgress.setRange(0, 100)
+        self.wfsProgress.setValue(value)
+
+    def _on_download_finished(self, count: int):
+        """
+            다운로드 완료
+        """
+        self.wfsProgress.hide()
+        self.show_info_message("다운로드 완료", f"{count}개 피처를 받았습니다.")
+
+    def _on_download_error(self, message: str):
+        """
+            다운로드 실패 (받은 피처는 레이어에 남음)
+        """
+        self.wfsProgress.hide()
+        self.show_error_message("다운로드 실패", message)
+
     def _show_favorites_context_menu(self, position):
         """
             즐겨찾기 컨텍스트 메뉴
@@ -196,6 +424,7 @@ class WfsWidget(BaseWidget, FORM_CLASS):
             즐겨찾기 목록 새로고침
         """
         self.wfsFavorites.clear()
+        self.favorites_filter.clear()
 
         favorites = FileManager.read_json(FAVORITES_FILE, {})
 
@@ -203,6 +432,10 @@ class WfsWidget(BaseWidget, FORM_CLASS):
             item = QListWidgetItem(f"{layer_title}[{layer_name}]")
             item.setData(Qt.UserRole, layer_name)
             self.wfsFavorites.addItem(item)
+            self.favorites_filter.add_item(item)
+
+        if self.wfsSearch.text():
+            self.favorites_filter.apply(self.wfsSearch.text())
 
     def _open_download_page(self, item: QListWidgetItem):
         """